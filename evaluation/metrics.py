@@ -88,6 +88,22 @@ def evaluate_risks(expected_risks: list[str], identified_risks: list[dict]) -> d
     }
 
 
+def compute_filter_metrics(kept: list[bool], relevant: list[bool]) -> dict:
+    """Precision and recall of a result filter against relevance labels."""
+    true_pos = sum(k and r for k, r in zip(kept, relevant))
+    n_kept = sum(kept)
+    n_relevant = sum(relevant)
+    precision = true_pos / n_kept if n_kept else 0.0
+    recall = true_pos / n_relevant if n_relevant else 0.0
+    return {
+        "precision": round(precision, 3),
+        "recall": round(recall, 3),
+        "f1_score": compute_f1(recall, precision),
+        "kept": n_kept,
+        "total": len(kept),
+    }
+
+
 def _fuzzy_match(expected: str, extracted: str, threshold: float) -> bool:
     """Simple keyword-overlap similarity."""
     if not expected or not extracted:
@@ -0,0 +1,74 @@
+"""Offline check of the BM25 relevance prefilter on hand-labelled persona search results.
+
+Scores evaluation/relevance_samples.json against each persona's name and
+context, and reports precision / recall of the results kept at several
+thresholds, the share of prompt tokens dropped and the scoring time.
+
+Usage:
+    python -m evaluation.relevance [--thresholds 0.1 0.15 0.2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from evaluation.metrics import compute_filter_metrics
+from src.config.settings import Settings
+from src.graphs.nodes.extractor import format_result
+from src.utils.relevance import build_query, rank_results
+from src.utils.text import estimate_tokens
+
+PERSONAS_DIR = Path("evaluation/personas")
+SAMPLES_PATH = Path("evaluation/relevance_samples.json")
+
+
+def evaluate_relevance_filter(persona: dict, samples: list[dict], min_score: float) -> dict:
+    """Filter one persona's labelled results at ``min_score`` and score the outcome."""
+    query = build_query(persona["name"], persona.get("context", ""))
+    start = time.perf_counter()
+    scores = rank_results(samples, query)
+    elapsed = time.perf_counter() - start
+
+    kept = [s >= min_score for s in scores]
+    tokens = [estimate_tokens(format_result(r)) for r in samples]
+    metrics = compute_filter_metrics(kept, [bool(r["relevant"]) for r in samples])
+    metrics["tokens_dropped_ratio"] = round(
+        sum(t for t, k in zip(tokens, kept) if not k) / max(1, sum(tokens)), 3,
+    )
+    metrics["scoring_ms"] = round(elapsed * 1000, 3)
+    return metrics
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--thresholds", type=float, nargs="*")
+    args = parser.parse_args()
+    # Runs without API keys, so read the default rather than loading settings
+    default = Settings.model_fields["relevance_min_score"].default
+    thresholds = args.thresholds or sorted({0.1, default, 0.2, 0.3})
+
+    samples = json.loads(SAMPLES_PATH.read_text(encoding="utf-8"))
+    personas = [
+        json.loads(p.read_text(encoding="utf-8")) for p in sorted(PERSONAS_DIR.glob("persona_*.json"))
+    ]
+
+    print(f"{'persona':<18} {'min':>5} {'kept':>7} {'precision':>9} {'recall':>6} {'tokens cut':>10} {'ms':>6}")
+    for threshold in thresholds:
+        for persona in personas:
+            results = samples.get(persona["name"])
+            if not results:
+                continue
+            m = evaluate_relevance_filter(persona, results, threshold)
+            print(
+                f"{persona['name']:<18} {threshold:>5.2f} {m['kept']:>3}/{m['total']:<3} "
+                f"{m['precision']:>9.3f} {m['recall']:>6.3f} {m['tokens_dropped_ratio']:>10.1%} "
+                f"{m['scoring_ms']:>6.2f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
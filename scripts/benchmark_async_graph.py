@@ -0,0 +1,265 @@
+"""Benchmark research-job throughput: async graph on one event loop vs the previous two-thread pool.
+
+Runs the real research graph against stubbed backends: every LLM call and
+Tavily search answers with canned JSON after a fixed latency (``time.sleep``
+for blocking calls, ``asyncio.sleep`` for awaited ones), so only the execution
+model differs. The legacy runner submits ``graph.invoke`` to a
+``ThreadPoolExecutor(max_workers=2)`` as the API controller did; the new
+runner drives ``graph.ainvoke`` for every job on one event loop, at most
+MAX_CONCURRENT_JOBS at a time. Reports wall time, jobs per minute, peak
+concurrent backend calls and peak thread count.
+
+Settings are the defaults (rate limits, LLM cache, passage index) unless set in
+the environment, e.g. RATE_LIMIT_BACKEND=sqlite LLM_CACHE_ENABLED=true; on-disk
+stores go to a temporary directory and the LLM cache is cleared between runners.
+
+Usage:
+    python scripts/benchmark_async_graph.py [--jobs 32] [--llm-latency 0.3] [--search-latency 0.2]
+"""
+
+from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+_STORE_DIR = Path(tempfile.mkdtemp(prefix="benchmark-async-graph-"))
+
+for _name, _value in {
+    "OPENROUTER_API_KEY": "benchmark",
+    "TAVILY_API_KEY": "benchmark",
+    "LLM_CACHE_PATH": str(_STORE_DIR / "llm_cache.sqlite3"),
+    "RATE_LIMIT_PATH": str(_STORE_DIR / "rate_limits.sqlite3"),
+    "MAX_RESEARCH_ITERATIONS": "3",
+    "LOG_LEVEL": "WARNING",
+}.items():
+    os.environ.setdefault(_name, _value)
+
+from langchain_core.messages import AIMessage
+
+from src.config.models import TaskType
+from src.config.settings import get_settings
+from src.graphs.nodes import analyzer, extractor, pipeline, planner, reporter, scorer, searcher, validator
+from src.graphs.research_graph import build_research_graph
+from src.utils import llm_cache
+
+TOPICS = ("career history", "board seats", "lawsuits", "regulatory filings", "business partners", "press coverage")
+
+
+# --- Stubbed backends ----------------------------------------------------------
+
+class Backend:
+    """Shared latency settings and a count of calls in flight."""
+
+    def __init__(self, llm_latency: float, search_latency: float):
+        self.llm_latency = llm_latency
+        self.search_latency = search_latency
+        self.in_flight = self.peak = self.peak_threads = 0
+        self._lock = threading.Lock()
+
+    def begin(self):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            self.peak_threads = max(self.peak_threads, threading.active_count())
+
+    def end(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    @contextmanager
+    def call(self):
+        self.begin()
+        try:
+            yield
+        finally:
+            self.end()
+
+    def reset(self):
+        self.in_flight = self.peak = self.peak_threads = 0
+
+
+class StubModel:
+    def __init__(self, task: TaskType, backend: Backend):
+        self.task = task
+        self.backend = backend
+
+    def invoke(self, messages):
+        with self.backend.call():
+            time.sleep(self.backend.llm_latency)
+        return self._respond(messages)
+
+    async def ainvoke(self, messages):
+        with self.backend.call():
+            await asyncio.sleep(self.backend.llm_latency)
+        return self._respond(messages)
+
+    def _respond(self, messages) -> AIMessage:
+        prompt = messages if isinstance(messages, str) else messages[-1].content
+        target = re.search(r"(?:Subject|Target)[^:\n]*:\s*(.+)", prompt)
+        name = target.group(1).strip() if target else "the subject"
+        if self.task == TaskType.PLANNING:
+            match = re.search(r"Current iteration: (\d+)", prompt)
+            iteration = int(match.group(1)) if match else 0
+            body = {"queries": [f"{name} {topic} {iteration}" for topic in TOPICS[iteration % 2::2]]}
+        elif self.task == TaskType.EXTRACTION:
+            body = {"facts": [
+                {"claim": f"Finding {i} from {q}", "category": "professional",
+                 "source_url": f"https://example.com/{abs(hash(q)) % 10_000}", "source_title": q,
+                 "entities": ["Acme Corp"], "confidence": 0.6}
+                for i, q in enumerate(re.findall(r"=== Query: (.+?) ===", prompt))
+            ]}
+        elif self.task == TaskType.ANALYSIS:
+            body = {"risk_flags": [], "connections": [], "information_gaps": ["education"],
+                    "analysis_digest": "Professional background only."}
+        elif self.task == TaskType.VALIDATION and isinstance(messages, str):
+            body = {"continue": True}
+        elif self.task == TaskType.VALIDATION:
+            body = {"scores": [{"fact_index": 0, "confidence": 0.8}]}
+        else:
+            return AIMessage(content="## 1. Executive Summary\nNo findings in this category.")
+        return AIMessage(content=json.dumps(body))
+
+
+class StubProvider:
+    def __init__(self, name: str):
+        self.name = name
+
+    def get_model_name(self) -> str:
+        return self.name
+
+
+class StubRouter:
+    def __init__(self, backend: Backend):
+        self.backend = backend
+
+    def get_model(self, task, **kwargs):
+        return StubModel(task, self.backend)
+
+    get_fallback_model = get_model
+
+    def get_provider(self, task):
+        return StubProvider("stub-primary")
+
+    def get_fallback_provider(self, task):
+        return StubProvider("stub-fallback")
+
+
+class StubSearchEngine:
+    def __init__(self, backend: Backend):
+        self.backend = backend
+
+    def submit(self, query, **kwargs) -> Future:
+        # The real engine runs searches on its own loop thread; a timer thread stands in for it
+        future: Future = Future()
+        self.backend.begin()
+
+        def _finish():
+            self.backend.end()
+            future.set_result(self._results(query))
+
+        threading.Timer(self.backend.search_latency, _finish).start()
+        return future
+
+    async def asearch(self, query, **kwargs):
+        with self.backend.call():
+            await asyncio.sleep(self.backend.search_latency)
+        return self._results(query)
+
+    @staticmethod
+    def _results(query):
+        return [{"title": f"{query} ({i})", "url": f"https://news.example.com/{abs(hash((query, i)))}",
+                 "content": f"Result {i} for {query}: coverage of {query.split()[0]} and related filings."}
+                for i in range(3)]
+
+
+def install_stubs(backend: Backend) -> None:
+    router, engine = StubRouter(backend), StubSearchEngine(backend)
+    for module in (planner, extractor, pipeline, analyzer, scorer, validator, reporter):
+        module.get_model_router = lambda: router
+    for module in (searcher, pipeline):
+        module.get_search_engine = lambda: engine
+
+
+def initial_state(i: int) -> dict:
+    return {
+        "job_id": f"bench-{i}", "target_name": f"Person {i}", "target_context": "executive",
+        "research_plan": [], "search_history": [], "extracted_facts": [], "connections": [],
+        "risk_flags": [], "confidence_scores": {}, "scored_fact_ids": [], "seen_documents": {},
+        "document_fingerprints": {}, "analysis_digest": "", "analyzed_fact_count": 0,
+        "information_gaps": [], "run_metrics": {}, "iteration": 0, "status": "planning",
+        "final_report": None,
+    }
+
+
+# --- Previous implementation, kept here for comparison -------------------------
+
+def legacy_run(graph, jobs: int) -> list[dict]:
+    """The previous API controller: graph.invoke on a two-thread pool."""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        return list(executor.map(lambda i: graph.invoke(initial_state(i)), range(jobs)))
+
+
+# --- Async execution -------------------------------------------------------------
+
+def async_run(graph, jobs: int, max_concurrent: int) -> list[dict]:
+    async def run_all():
+        slots = asyncio.Semaphore(max_concurrent)
+
+        async def run(i):
+            async with slots:
+                return await graph.ainvoke(initial_state(i))
+
+        return await asyncio.gather(*(run(i) for i in range(jobs)))
+
+    return asyncio.run(run_all())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=32)
+    parser.add_argument("--llm-latency", type=float, default=0.3)
+    parser.add_argument("--search-latency", type=float, default=0.2)
+    args = parser.parse_args()
+
+    backend = Backend(args.llm_latency, args.search_latency)
+    install_stubs(backend)
+    graph = build_research_graph()
+    max_concurrent = get_settings().max_concurrent_jobs
+
+    settings = get_settings()
+    print(f"{args.jobs} jobs, {settings.max_research_iterations} iterations each, "
+          f"LLM latency {args.llm_latency}s, search latency {args.search_latency}s")
+    print(f"rate limit backend {settings.rate_limit_backend}, LLM cache "
+          f"{'on' if settings.llm_cache_enabled else 'off'}, passage index "
+          f"{'on' if settings.passage_index_enabled else 'off'}")
+    print(f"{'runner':<22} {'wall s':>7} {'jobs/min':>9} {'peak calls':>10} {'peak threads':>12}")
+    rows = {}
+    for label, run in (("thread pool (2)", lambda: legacy_run(graph, args.jobs)),
+                       (f"event loop ({max_concurrent})", lambda: async_run(graph, args.jobs, max_concurrent))):
+        backend.reset()
+        if llm_cache._llm_cache is not None:
+            llm_cache._llm_cache.clear()  # each runner starts cold
+        start = time.perf_counter()
+        states = run()
+        seconds = time.perf_counter() - start
+        assert all(s["status"] == "done" for s in states), f"{label}: unfinished jobs"
+        rows[label] = seconds
+        print(f"{label:<22} {seconds:>7.2f} {args.jobs / seconds * 60:>9.1f} "
+              f"{backend.peak:>10} {backend.peak_threads:>12}")
+    legacy_s, async_s = rows.values()
+    print(f"throughput gain {legacy_s / async_s:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
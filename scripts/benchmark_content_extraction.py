@@ -0,0 +1,147 @@
+"""Benchmark main-content extraction against the previous truncate-the-page-text scraper output.
+
+Builds synthetic news pages around each persona: scripts, a nav bar, a cookie
+banner, a sidebar, related-link lists and a footer wrapped around an article of
+filler paragraphs with a few passages about the target (taken from the labelled
+relevance samples) placed at random depths. Both extractors run with the
+scraper's 10,000-character budget. The benchmark reports output size, how many
+target passages survive, how much of the output is article text at all, and
+time per page.
+
+Usage:
+    python scripts/benchmark_content_extraction.py [--pages 60] [--seed 7]
+"""
+
+from pathlib import Path
+import argparse
+import html
+import json
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.tools.content import extract_main_content
+from src.utils.relevance import build_query
+
+SAMPLES_PATH = Path(__file__).parent.parent / "evaluation" / "relevance_samples.json"
+MAX_CHARS = 10_000
+CHARS_PER_TOKEN = 4  # as in src.utils.text.estimate_tokens
+TARGETS = {
+    "Elon Musk": "Tesla SpaceX",
+    "Michael Burry": "Scion Asset Management investor",
+    "Timothy Overturf": "Sisu Capital CEO",
+}
+VOCABULARY = (
+    "market report analysts quarter growth policy city council weather season travel review "
+    "economy rates energy health local sports schedule community survey results budget plan "
+    "officials announced week program industry data experts residents public service project"
+).split()
+
+
+# --- Previous implementation, kept here for comparison -----------------------
+
+_INVISIBLE = re.compile(r"<(script|style|noscript|template|svg)\b.*?</\1\s*>", re.S | re.I)
+_COMMENT = re.compile(r"<!--.*?-->", re.S)
+_BLOCK = re.compile(r"</?(p|div|br|li|h[1-6]|tr|section|article|header|footer)\b[^>]*>", re.I)
+_TAG = re.compile(r"<[^>]+>")
+
+
+def legacy_extract(markup: str) -> str:
+    markup = _COMMENT.sub(" ", _INVISIBLE.sub(" ", markup))
+    markup = _TAG.sub(" ", _BLOCK.sub("\n", markup))
+    lines = (" ".join(line.split()) for line in html.unescape(markup).splitlines())
+    return "\n".join(line for line in lines if line)[:MAX_CHARS]
+
+
+# --- Synthetic pages ---------------------------------------------------------
+
+def _sentence(rng: random.Random) -> str:
+    return " ".join(rng.choice(VOCABULARY) for _ in range(rng.randint(10, 20))).capitalize() + "."
+
+
+def _links(rng: random.Random, n: int) -> str:
+    return "".join(f'<li><a href="/s/{rng.randint(0, 9999)}">{_sentence(rng)[:40]}</a></li>' for _ in range(n))
+
+
+def build_page(rng: random.Random, name: str, passages: list[str]) -> tuple[str, list[str]]:
+    """One page; returns the markup and the article paragraphs in it."""
+    paragraphs = [" ".join(_sentence(rng) for _ in range(rng.randint(2, 5))) for _ in range(rng.randint(15, 90))]
+    for passage in rng.sample(passages, k=min(3, len(passages))):
+        paragraphs.insert(rng.randint(0, len(paragraphs)), passage)
+    article = "".join(
+        (f"<h2>{_sentence(rng)[:50]}</h2>" if i % 6 == 5 else "") + f"<p>{html.escape(p)}</p>"
+        for i, p in enumerate(paragraphs)
+    )
+    markup = (
+        f"<html><head><title>{name} news | Daily</title>"
+        f"<script>{'var a = 1; ' * 300}</script><style>{'.x { color: red } ' * 200}</style></head><body>"
+        f'<header class="masthead"><a href="/">Daily</a><nav><ul>{_links(rng, 40)}</ul></nav></header>'
+        '<div class="cookie-consent"><p>We and our partners use cookies to personalise content and ads, '
+        "to provide social media features and to analyse our traffic.</p><p>Accept all cookies?</p></div>"
+        f"<main><article><h1>{name}: the latest</h1>{article}</article></main>"
+        f'<div class="related-stories"><h3>Related</h3><ul>{_links(rng, 12)}</ul></div>'
+        f"<aside><h3>Trending</h3><ul>{_links(rng, 15)}</ul></aside>"
+        f"<footer><ul>{_links(rng, 30)}</ul><p>Copyright Daily Media. All rights reserved.</p></footer>"
+        "</body></html>"
+    )
+    return markup, paragraphs
+
+
+def _score(output: str, paragraphs: list[str], passages: list[str]) -> tuple[int, int]:
+    """(target passages kept whole, chars of output that are article paragraphs)."""
+    lines = set(output.splitlines())
+    kept = sum(p in lines for p in passages)
+    article_chars = sum(len(p) for p in paragraphs if p in lines)
+    return kept, article_chars
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    samples = json.loads(SAMPLES_PATH.read_text(encoding="utf-8"))
+    rng = random.Random(args.seed)
+    totals = {name: {"chars": 0, "kept": 0, "article": 0, "seconds": 0.0} for name in ("legacy", "main-content")}
+    html_bytes = target_passages = 0
+
+    for i in range(args.pages):
+        name = list(TARGETS)[i % len(TARGETS)]
+        passages = [s["content"] for s in samples[name] if s["relevant"]]
+        markup, paragraphs = build_page(rng, name, passages)
+        in_page = [p for p in passages if p in paragraphs]
+        html_bytes += len(markup)
+        target_passages += len(in_page)
+        query = build_query(name, TARGETS[name])
+
+        for label, extract in (("legacy", legacy_extract),
+                               ("main-content", lambda m: extract_main_content(m, query, MAX_CHARS))):
+            start = time.perf_counter()
+            output = extract(markup)
+            totals[label]["seconds"] += time.perf_counter() - start
+            kept, article = _score(output, paragraphs, in_page)
+            totals[label]["chars"] += len(output)
+            totals[label]["kept"] += kept
+            totals[label]["article"] += article
+
+    print(f"{args.pages} pages, {html_bytes / args.pages / 1024:.0f} KiB HTML each on average, "
+          f"{target_passages} target passages, {MAX_CHARS} char budget")
+    print(f"{'extractor':<13} {'chars/page':>10} {'tokens/page':>11} {'target kept':>11} "
+          f"{'article share':>13} {'ms/page':>8}")
+    for label, t in totals.items():
+        print(f"{label:<13} {t['chars'] / args.pages:>10.0f} {t['chars'] / CHARS_PER_TOKEN / args.pages:>11.0f} "
+              f"{t['kept'] / target_passages:>11.0%} {t['article'] / max(t['chars'], 1):>13.0%} "
+              f"{t['seconds'] / args.pages * 1000:>8.2f}")
+    legacy, new = totals["legacy"], totals["main-content"]
+    per_1k = [t["kept"] / (t["chars"] / CHARS_PER_TOKEN) * 1000 for t in (legacy, new)]
+    print(f"size reduction {1 - new['chars'] / legacy['chars']:.0%}; "
+          f"target passages per 1k tokens {per_1k[0]:.2f} -> {per_1k[1]:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
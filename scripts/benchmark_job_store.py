@@ -0,0 +1,148 @@
+"""Benchmark the SQLite job store against the previous in-memory ``_jobs`` dict.
+
+Saves synthetic completed jobs the way ``ResearchService`` does (pending,
+running, then completed with a result shaped like ``_format_result``'s: ~60
+facts, risk flags, connections and a markdown report), then polls status and
+reads results, mostly for recent jobs. Reports Python heap held after every
+checkpoint of jobs (tracemalloc), result bytes on disk, and time per save,
+status read and result read.
+
+Usage:
+    python scripts/benchmark_job_store.py [--jobs 5000] [--cache-size 64]
+"""
+
+from pathlib import Path
+import argparse
+import gc
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.job_store import ResearchJob, SQLiteJobStore
+
+CATEGORIES = ("professional", "financial", "legal", "personal", "connections")
+WORDS = (
+    "founded board director fund capital filing lawsuit settlement partner investor acquisition "
+    "company chief officer regulatory disclosure shares report press interview venture role"
+).split()
+
+
+def build_result(rng: random.Random, name: str) -> dict:
+    def sentence(n: int) -> str:
+        return " ".join(rng.choice(WORDS) for _ in range(n)).capitalize() + "."
+
+    facts = [
+        {"claim": f"{name} {sentence(18)}", "category": rng.choice(CATEGORIES),
+         "source_url": f"https://news.example.com/{rng.randint(0, 10**9)}", "source_title": sentence(8),
+         "entities": [name, f"Company {rng.randint(0, 99)}"], "confidence": round(rng.random(), 2)}
+        for _ in range(60)
+    ]
+    return {
+        "target_name": name,
+        "iterations": 5,
+        "final_report": "\n\n".join(f"## {i}. {sentence(4)}\n" + " ".join(sentence(20) for _ in range(8))
+                                    for i in range(1, 9)),
+        "facts": facts,
+        "risk_flags": [{"description": sentence(15), "severity": "medium"} for _ in range(6)],
+        "connections": [{"source_entity": name, "target_entity": f"Company {i}", "relationship": "EMPLOYED_BY"}
+                        for i in range(12)],
+        "confidence_stats": {"total_facts": 60, "avg_confidence": 0.62},
+        "search_queries_executed": 40,
+        "metrics": {"llm_calls": 55, "tokens_in": 180_000},
+    }
+
+
+# --- Previous implementation, kept here for comparison -------------------------
+
+class LegacyJobs:
+    """The previous module-level ``_jobs`` dict: every job object, result and all, forever."""
+
+    def __init__(self):
+        self._jobs: dict[str, ResearchJob] = {}
+
+    def save(self, job: ResearchJob) -> None:
+        self._jobs[job.job_id] = job
+
+    def get(self, job_id: str, *, with_result: bool = True) -> ResearchJob | None:
+        return self._jobs.get(job_id)
+
+
+# --- Benchmark -----------------------------------------------------------------
+
+def run(store, jobs: int, rng: random.Random) -> dict:
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    job_ids: list[str] = []
+    heap = []
+    save_s = 0.0
+    for i in range(jobs):
+        job = ResearchJob(str(uuid.uuid4()), f"Person {i}", "executive")
+        result = build_result(rng, job.target_name)
+        start = time.perf_counter()
+        store.save(job)
+        job.status = "running"
+        store.save(job)
+        job.status, job.result = "completed", result
+        store.save(job)
+        save_s += time.perf_counter() - start
+        job_ids.append(job.job_id)
+        del job, result  # the service drops its job object once the run ends
+        if (i + 1) % max(jobs // 4, 1) == 0:
+            gc.collect()
+            heap.append(tracemalloc.get_traced_memory()[0] - baseline)
+    tracemalloc.stop()
+
+    status_s = result_s = 0.0
+    reads = 2000
+    for _ in range(reads):
+        # Clients poll recent jobs far more often than old ones
+        job_id = job_ids[-1 - min(int(rng.expovariate(1 / 20)), len(job_ids) - 1)]
+        start = time.perf_counter()
+        store.get(job_id, with_result=False)
+        status_s += time.perf_counter() - start
+        start = time.perf_counter()
+        assert store.get(job_id).result["facts"]
+        result_s += time.perf_counter() - start
+    return {
+        "heap": heap,
+        "save_ms": save_s / jobs * 1000,
+        "status_ms": status_s / reads * 1000,
+        "result_ms": result_s / reads * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=5000)
+    parser.add_argument("--cache-size", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sqlite_store = SQLiteJobStore(Path(tmp) / "jobs.sqlite3", cache_size=args.cache_size)
+        rows = {
+            "dict (legacy)": run(LegacyJobs(), args.jobs, random.Random(args.seed)),
+            f"sqlite (cache {args.cache_size})": run(sqlite_store, args.jobs, random.Random(args.seed)),
+        }
+        on_disk = sqlite_store.stats()["result_bytes"]
+
+    checkpoints = [round(args.jobs * q / 4) for q in range(1, 5)]
+    print(f"{args.jobs} completed jobs; heap held after "
+          + ", ".join(str(n) for n in checkpoints) + " jobs (MiB)")
+    print(f"{'store':<20} {'heap MiB':>31} {'save ms':>8} {'status ms':>10} {'result ms':>10}")
+    for label, r in rows.items():
+        heap = " ".join(f"{h / 2**20:>7.1f}" for h in r["heap"])
+        print(f"{label:<20} {heap:>31} {r['save_ms']:>8.3f} {r['status_ms']:>10.3f} {r['result_ms']:>10.3f}")
+    legacy, new = (r["heap"][-1] for r in rows.values())
+    print(f"results on disk {on_disk / 2**20:.1f} MiB compressed; heap {legacy / 2**20:.1f} -> {new / 2**20:.1f} MiB")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
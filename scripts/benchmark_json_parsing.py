@@ -0,0 +1,91 @@
+"""Micro-benchmark robust_json_loads against the previous regex-based implementation.
+
+Runs both parsers over recorded extractor, analyzer and scorer responses
+(scripts/data/recorded_llm_outputs.json), checks they agree, and prints the
+mean time per response for each node.
+
+Usage:
+    python scripts/benchmark_json_parsing.py [--repeat 200]
+"""
+
+from pathlib import Path
+import argparse
+import json
+import re
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.text import robust_json_loads, strip_code_fences
+
+DATA_PATH = Path(__file__).parent / "data" / "recorded_llm_outputs.json"
+
+
+# --- Previous implementation, kept here for comparison -----------------------
+
+def _legacy_fix_unquoted_keys(text: str) -> str:
+    return re.sub(r'(?<=[{,])\s*(\w+)\s*:', r' "\1":', text)
+
+
+def _legacy_extract_json_block(text: str):
+    for pattern in [r'(\[[\s\S]*\])', r'(\{[\s\S]*\})']:
+        m = re.search(pattern, text)
+        if m:
+            candidate = m.group(1)
+            try:
+                return json.loads(candidate)
+            except json.JSONDecodeError:
+                try:
+                    return json.loads(_legacy_fix_unquoted_keys(candidate))
+                except json.JSONDecodeError:
+                    continue
+    return None
+
+
+def legacy_robust_json_loads(content):
+    text = strip_code_fences(content)
+    try:
+        return json.loads(text)
+    except (json.JSONDecodeError, TypeError):
+        pass
+    try:
+        return json.loads(_legacy_fix_unquoted_keys(text))
+    except (json.JSONDecodeError, TypeError):
+        pass
+    return _legacy_extract_json_block(text)
+
+
+# -----------------------------------------------------------------------------
+
+def _time_per_call(parse, samples: list[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for sample in samples:
+            parse(sample)
+    return (time.perf_counter() - start) / (repeat * len(samples))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    recorded = json.loads(DATA_PATH.read_text())
+    print(f"{'node':<10} {'samples':>7} {'legacy ok':>9} {'new ok':>6} {'legacy us':>10} {'new us':>8} {'speedup':>8}")
+
+    for node, samples in recorded.items():
+        legacy_ok = sum(legacy_robust_json_loads(s) is not None for s in samples)
+        new_ok = sum(robust_json_loads(s, context="benchmark") is not None for s in samples)
+        legacy = _time_per_call(legacy_robust_json_loads, samples, args.repeat)
+        new = _time_per_call(lambda s: robust_json_loads(s, context="benchmark"), samples, args.repeat)
+        print(
+            f"{node:<10} {len(samples):>7} {legacy_ok:>9} {new_ok:>6} "
+            f"{legacy * 1e6:>10.1f} {new * 1e6:>8.1f} {legacy / new:>7.2f}x"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,99 @@
+"""Benchmark WebScraper against the previous one-URL-at-a-time scraper on a local HTTP server.
+
+Starts a threaded HTTP server on loopback that answers every page after a fixed
+latency, spreads the URLs over several loopback addresses (127.0.0.1,
+127.0.0.2, ...) so per-host limits apply as they would across real sites, and
+times both scrapers over the same URLs.
+
+Usage:
+    python scripts/benchmark_scraper.py [--urls 30] [--hosts 6] [--latency 0.2]
+"""
+
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import argparse
+import sys
+import threading
+import time
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.tools.scraper import WebScraper
+
+PAGE = (
+    "<html><head><script>var tracking = 1;</script></head><body><nav>Home | About</nav>"
+    + "<p>Paragraph about the research target with a few details.</p>" * 200
+    + "</body></html>"
+).encode()
+
+
+def _make_handler(latency: float):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(PAGE)))
+            self.end_headers()
+            self.wfile.write(PAGE)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def legacy_scrape_multiple(urls: list[str], timeout: float = 30.0) -> dict[str, str]:
+    """The previous fallback path: one request at a time, a new connection each."""
+    out = {}
+    for url in urls:
+        try:
+            resp = httpx.get(url, timeout=timeout, follow_redirects=True)
+            resp.raise_for_status()
+            out[url] = resp.text[:10000]
+        except Exception:
+            out[url] = ""
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--urls", type=int, default=30)
+    parser.add_argument("--hosts", type=int, default=6)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("0.0.0.0", 0), _make_handler(args.latency))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    urls = [f"http://127.0.0.{i % args.hosts + 1}:{port}/page/{i}" for i in range(args.urls)]
+
+    try:
+        start = time.perf_counter()
+        legacy = legacy_scrape_multiple(urls)
+        legacy_s = time.perf_counter() - start
+
+        scraper = WebScraper()
+        start = time.perf_counter()
+        pooled = scraper.scrape_multiple(urls)
+        pooled_s = time.perf_counter() - start
+        stats = scraper.stats()
+        scraper.close()
+    finally:
+        server.shutdown()
+
+    print(f"{args.urls} URLs on {args.hosts} hosts, {args.latency * 1000:.0f} ms server latency")
+    print(f"{'scraper':<10} {'ok':>4} {'seconds':>8}")
+    print(f"{'legacy':<10} {sum(bool(t) for t in legacy.values()):>4} {legacy_s:>8.2f}")
+    print(f"{'pooled':<10} {sum(bool(t) for t in pooled.values()):>4} {pooled_s:>8.2f}")
+    print(f"speedup {legacy_s / pooled_s:.1f}x; scraper stats: {stats}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -1,8 +1,25 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
-from src.api.routers import research, graph, reports
+from src.api.controllers import research as research_ctrl
+from src.api.routers import research, graph, reports, metrics
+from src.config.settings import get_settings
 from src.utils.logging import setup_logging
 
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if get_settings().resume_interrupted_jobs:
+        try:
+            research_ctrl.resume_interrupted_jobs()
+        except Exception as e:
+            logger.error("Could not resume interrupted research jobs: %s", e)
+    yield
+
 
 def create_app() -> FastAPI:
     setup_logging()
@@ -11,11 +28,13 @@ def create_app() -> FastAPI:
         title="Deep Research AI Agent",
         description="Autonomous research agent for intelligence gathering and risk assessment",
         version="0.1.0",
+        lifespan=lifespan,
     )
 
     app.include_router(research.router)
     app.include_router(graph.router)
     app.include_router(reports.router)
+    app.include_router(metrics.router)
 
     @app.get("/health")
     def health_check():
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import logging
+
+from src.api.controllers.research import research_job_stats
+from src.services.job_store import job_store_stats
+from src.tools.scraper import web_scraper_stats
+from src.tools.search import search_cache_stats
+from src.tools.search_engine import search_engine_stats
+from src.utils.circuit_breaker import breaker_metrics
+from src.utils.llm_cache import llm_cache_stats
+from src.utils.llm_retry import hedge_metrics, llm_error_metrics
+from src.utils.passage_index import passage_index_stats
+from src.utils.rate_limiter import rate_limiter_stats
+
+logger = logging.getLogger(__name__)
+
+
+def get_metrics() -> dict:
+    """Process-wide resilience, cache and rate-limit metrics."""
+    return {
+        "research_jobs": research_job_stats(),
+        "job_store": job_store_stats(),
+        "circuit_breakers": breaker_metrics(),
+        "llm_errors": llm_error_metrics(),
+        "llm_hedging": hedge_metrics(),
+        "llm_cache": llm_cache_stats(),
+        "search_cache": search_cache_stats(),
+        "search_engine": search_engine_stats(),
+        "web_scraper": web_scraper_stats(),
+        "passage_index": passage_index_stats(),
+        "rate_limits": rate_limiter_stats(),
+    }
@@ -1,19 +1,27 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
+from src.config.settings import get_settings
 from src.services.research_service import ResearchService
+from src.utils.aio import BackgroundLoop
 
 logger = logging.getLogger(__name__)
 
-_executor = ThreadPoolExecutor(max_workers=2)
+# Every job runs as a coroutine on this loop: waiting on LLM, search and Neo4j
+# calls costs no thread, so MAX_CONCURRENT_JOBS jobs can be in flight at once
+_loop = BackgroundLoop("research-jobs")
+_job_slots: asyncio.Semaphore | None = None
+_queued = 0
+_running = 0
 _research_service = ResearchService()
 
 
 def start_research(target_name: str, target_context: str = "") -> dict:
     job_id = _research_service.start_research(target_name, target_context)
-    _executor.submit(_run_research_background, job_id)
+    _submit(_research_service.arun_research, job_id, "research")
     return {
         "job_id": job_id,
         "target_name": target_name,
@@ -22,6 +30,39 @@ def start_research(target_name: str, target_context: str = "") -> dict:
     }
 
 
+def resume_research(job_id: str) -> dict | None:
+    """Continue a checkpointed job in the background; None if it has nothing to resume."""
+    job = _research_service.restore_job(job_id)
+    if job is None:
+        return None
+    # Reserved before the run is scheduled, so a second request cannot start it again
+    running = not _research_service.mark_running(job_id)
+    if not running:
+        _submit(partial(_research_service.aresume_research, reserved=True), job_id, "resume")
+    return {
+        "job_id": job_id,
+        "target_name": job.target_name,
+        "status": "running" if running else "resumed",
+        "message": f"Research resumed from its last checkpoint. Poll /api/research/{job_id}/status for updates.",
+    }
+
+
+def resume_interrupted_jobs() -> list[str]:
+    """Resume, in the background, the jobs a previous run of the service left unfinished.
+
+    Jobs it never got to start are run again from the beginning.
+    """
+    job_ids = []
+    for job_id in _research_service.resume_interrupted_jobs():
+        if _research_service.mark_running(job_id):
+            _submit(partial(_research_service.aresume_research, reserved=True), job_id, "resume")
+            job_ids.append(job_id)
+    for job_id in _research_service.requeue_abandoned_jobs():
+        _submit(_research_service.arun_research, job_id, "research")
+        job_ids.append(job_id)
+    return job_ids
+
+
 def get_status(job_id: str) -> dict:
     return _research_service.get_job_status(job_id)
 
@@ -44,8 +85,30 @@ def get_result(job_id: str) -> dict | None:
     }
 
 
-def _run_research_background(job_id: str) -> None:
-    try:
-        _research_service.run_research(job_id)
-    except Exception as e:
-        logger.error("Background research failed for %s: %s", job_id, e)
+def research_job_stats() -> dict:
+    return {
+        "running": _running,
+        "queued": _queued,
+        "max_concurrent": get_settings().max_concurrent_jobs,
+    }
+
+
+def _submit(run, job_id: str, action: str) -> None:
+    _loop.submit(_run_background(run, job_id, action))
+
+
+async def _run_background(run, job_id: str, action: str) -> None:
+    # Runs on the jobs loop only, so the counters need no lock
+    global _job_slots, _queued, _running
+    if _job_slots is None:
+        _job_slots = asyncio.Semaphore(get_settings().max_concurrent_jobs)
+    _queued += 1
+    async with _job_slots:
+        _queued -= 1
+        _running += 1
+        try:
+            await run(job_id)
+        except Exception as e:
+            logger.error("Background %s failed for %s: %s", action, job_id, e)
+        finally:
+            _running -= 1
@@ -0,0 +1,10 @@
+from fastapi import APIRouter
+
+from src.api.controllers import metrics as ctrl
+
+router = APIRouter(prefix="/api/metrics", tags=["metrics"])
+
+
+@router.get("/")
+def get_metrics():
+    return ctrl.get_metrics()
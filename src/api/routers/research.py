@@ -17,6 +17,14 @@ def create_research(request: ResearchRequest):
     return ResearchResponse(**result)
 
 
+@router.post("/{job_id}/resume", response_model=ResearchResponse)
+def resume_research(job_id: str):
+    result = ctrl.resume_research(job_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail="No checkpoint to resume for this job")
+    return ResearchResponse(**result)
+
+
 @router.get("/{job_id}/status", response_model=JobStatusResponse)
 def get_research_status(job_id: str):
     status = ctrl.get_status(job_id)
@@ -26,3 +26,23 @@ FALLBACK_MODEL_MAP: dict[ModelProvider, ModelProvider] = {
     ModelProvider.OPENAI: ModelProvider.GEMINI,
     ModelProvider.GEMINI: ModelProvider.OPENAI,
 }
+
+# Whether resilient_invoke may serve a task from the on-disk LLM response cache
+# (only consulted when LLM_CACHE_ENABLED is set).
+TASK_CACHE_POLICY: dict[TaskType, bool] = {
+    TaskType.PLANNING: True,
+    TaskType.EXTRACTION: True,
+    TaskType.ANALYSIS: True,
+    TaskType.VALIDATION: True,
+    TaskType.REPORTING: False,
+}
+
+# Whether resilient_invoke may hedge slow calls for a task
+# (only consulted when LLM_HEDGING_ENABLED is set).
+TASK_HEDGE_POLICY: dict[TaskType, bool] = {
+    TaskType.PLANNING: False,
+    TaskType.EXTRACTION: True,
+    TaskType.ANALYSIS: False,
+    TaskType.VALIDATION: False,
+    TaskType.REPORTING: True,
+}
@@ -15,9 +15,77 @@ class Settings(BaseSettings):
     # Gemini (via OpenRouter)
     gemini_model: str = Field(default="google/gemini-3-flash-preview", alias="GEMINI_MODEL")
 
+    # HTTP connection pool size per provider (shared by all nodes and jobs)
+    openai_max_connections: int = Field(default=20, alias="OPENAI_MAX_CONNECTIONS")
+    gemini_max_connections: int = Field(default=10, alias="GEMINI_MAX_CONNECTIONS")
+
     # Tavily
     tavily_api_key: str = Field(..., alias="TAVILY_API_KEY")
 
+    # Search result cache (SQLite, shared across jobs and processes)
+    search_cache_enabled: bool = Field(default=True, alias="SEARCH_CACHE_ENABLED")
+    search_cache_path: str = Field(
+        default=".cache/search_cache.sqlite3", alias="SEARCH_CACHE_PATH"
+    )
+    search_cache_ttl_seconds: int = Field(default=86400, alias="SEARCH_CACHE_TTL_SECONDS")
+    search_cache_max_entries: int = Field(default=5000, alias="SEARCH_CACHE_MAX_ENTRIES")
+
+    # Shared search engine (process-wide limits across all jobs)
+    search_max_concurrency: int = Field(default=8, alias="SEARCH_MAX_CONCURRENCY")
+    search_max_connections: int = Field(default=10, alias="SEARCH_MAX_CONNECTIONS")
+    search_timeout_seconds: float = Field(default=30.0, alias="SEARCH_TIMEOUT_SECONDS")
+
+    # Shared web scraper: global and per-host in-flight limits, per-page time and size caps
+    scrape_max_concurrency: int = Field(default=16, alias="SCRAPE_MAX_CONCURRENCY")
+    scrape_per_host_concurrency: int = Field(default=2, alias="SCRAPE_PER_HOST_CONCURRENCY")
+    scrape_max_connections: int = Field(default=20, alias="SCRAPE_MAX_CONNECTIONS")
+    scrape_timeout_seconds: float = Field(default=15.0, alias="SCRAPE_TIMEOUT_SECONDS")
+    scrape_max_bytes: int = Field(default=2_000_000, alias="SCRAPE_MAX_BYTES")
+    scrape_max_chars: int = Field(default=10_000, alias="SCRAPE_MAX_CHARS")
+
+    # Scraped-page cache: served as-is while fresh, then revalidated with conditional GETs
+    page_cache_enabled: bool = Field(default=True, alias="PAGE_CACHE_ENABLED")
+    page_cache_path: str = Field(default=".cache/page_cache.sqlite3", alias="PAGE_CACHE_PATH")
+    page_cache_fresh_seconds: int = Field(default=3600, alias="PAGE_CACHE_FRESH_SECONDS")
+    page_cache_max_age_seconds: int = Field(default=30 * 86400, alias="PAGE_CACHE_MAX_AGE_SECONDS")
+    page_cache_max_mb: int = Field(default=500, alias="PAGE_CACHE_MAX_MB")
+
+    # Client-side rate limits per bucket (requests/tokens per minute; 0 disables)
+    tavily_rpm: int = Field(default=100, alias="TAVILY_RPM")
+    openai_rpm: int = Field(default=500, alias="OPENAI_RPM")
+    openai_tpm: int = Field(default=0, alias="OPENAI_TPM")
+    gemini_rpm: int = Field(default=500, alias="GEMINI_RPM")
+    gemini_tpm: int = Field(default=0, alias="GEMINI_TPM")
+    rate_limit_burst_seconds: float = Field(default=10.0, alias="RATE_LIMIT_BURST_SECONDS")
+    # "local" is per process; "sqlite" shares buckets between all worker processes on the host,
+    # at the cost of a write transaction per call -- opt in when running several workers
+    rate_limit_backend: str = Field(default="local", alias="RATE_LIMIT_BACKEND")
+    rate_limit_path: str = Field(default=".cache/rate_limits.sqlite3", alias="RATE_LIMIT_PATH")
+
+    # LLM retry policy and per-provider circuit breakers
+    llm_max_attempts: int = Field(default=2, alias="LLM_MAX_ATTEMPTS")
+    llm_backoff_base_seconds: float = Field(default=0.5, alias="LLM_BACKOFF_BASE_SECONDS")
+    llm_backoff_max_seconds: float = Field(default=20.0, alias="LLM_BACKOFF_MAX_SECONDS")
+    breaker_failure_threshold: int = Field(default=3, alias="BREAKER_FAILURE_THRESHOLD")
+    breaker_recovery_seconds: float = Field(default=30.0, alias="BREAKER_RECOVERY_SECONDS")
+
+    # Hedged LLM requests (opt-in; per-task policy in config/models.py)
+    llm_hedging_enabled: bool = Field(default=False, alias="LLM_HEDGING_ENABLED")
+    llm_hedge_target: str = Field(default="same", alias="LLM_HEDGE_TARGET")  # same | fallback
+    llm_hedge_percentile: float = Field(default=0.95, alias="LLM_HEDGE_PERCENTILE")
+    llm_hedge_min_samples: int = Field(default=20, alias="LLM_HEDGE_MIN_SAMPLES")
+    llm_hedge_initial_delay_seconds: float = Field(
+        default=20.0, alias="LLM_HEDGE_INITIAL_DELAY_SECONDS"
+    )
+    llm_hedge_budget_ratio: float = Field(default=0.1, alias="LLM_HEDGE_BUDGET_RATIO")
+    llm_hedge_max_workers: int = Field(default=32, alias="LLM_HEDGE_MAX_WORKERS")
+
+    # LLM response cache (opt-in; per-task policy in config/models.py)
+    llm_cache_enabled: bool = Field(default=False, alias="LLM_CACHE_ENABLED")
+    llm_cache_path: str = Field(default=".cache/llm_cache.sqlite3", alias="LLM_CACHE_PATH")
+    llm_cache_ttl_seconds: int = Field(default=7 * 86400, alias="LLM_CACHE_TTL_SECONDS")
+    llm_cache_max_mb: int = Field(default=200, alias="LLM_CACHE_MAX_MB")
+
     # Neo4j (Aura or local)
     neo4j_uri: str = Field(default="bolt://localhost:7687", alias="NEO4J_URI")
     neo4j_user: str = Field(
@@ -52,6 +120,52 @@ class Settings(BaseSettings):
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
     max_research_iterations: int = Field(default=5, alias="MAX_RESEARCH_ITERATIONS")
     confidence_threshold: float = Field(default=0.7, alias="CONFIDENCE_THRESHOLD")
+    # Jobs run as coroutines on one event loop; at most this many at a time, the rest queue
+    max_concurrent_jobs: int = Field(default=32, alias="MAX_CONCURRENT_JOBS")
+
+    # Job checkpoints: graph state is saved after every node so a restarted process
+    # resumes interrupted jobs (younger than CHECKPOINT_MAX_AGE_HOURS) where they stopped.
+    # A running job's claim is renewed every CHECKPOINT_HEARTBEAT_SECONDS; one missing
+    # four heartbeats is taken to be interrupted
+    checkpoint_enabled: bool = Field(default=True, alias="CHECKPOINT_ENABLED")
+    checkpoint_path: str = Field(default=".cache/checkpoints.sqlite3", alias="CHECKPOINT_PATH")
+    resume_interrupted_jobs: bool = Field(default=True, alias="RESUME_INTERRUPTED_JOBS")
+    checkpoint_max_age_hours: float = Field(default=24.0, alias="CHECKPOINT_MAX_AGE_HOURS")
+    checkpoint_heartbeat_seconds: float = Field(default=15.0, alias="CHECKPOINT_HEARTBEAT_SECONDS")
+
+    # Job store: job status and zlib-compressed results, readable from every uvicorn
+    # worker (sqlite) or kept in this process only (memory); recent results stay decoded
+    job_store_backend: str = Field(default="sqlite", alias="JOB_STORE_BACKEND")
+    job_store_path: str = Field(default=".cache/jobs.sqlite3", alias="JOB_STORE_PATH")
+    job_result_cache_size: int = Field(default=64, alias="JOB_RESULT_CACHE_SIZE")
+
+    # Extraction: results are packed into token-budgeted chunks extracted in parallel
+    extraction_chunk_tokens: int = Field(default=6000, alias="EXTRACTION_CHUNK_TOKENS")
+    extraction_max_parallel: int = Field(default=4, alias="EXTRACTION_MAX_PARALLEL")
+    # Claims whose content words overlap at least this much (Jaccard) merge into one fact
+    fact_dedup_threshold: float = Field(default=0.7, alias="FACT_DEDUP_THRESHOLD")
+    # Search results whose SimHash differs in at most this many of 64 bits (0-7) are one document
+    simhash_max_distance: int = Field(default=6, alias="SIMHASH_MAX_DISTANCE")
+    # BM25 prefilter: drop results unrelated to the target before extraction
+    relevance_filter_enabled: bool = Field(default=True, alias="RELEVANCE_FILTER_ENABLED")
+    relevance_min_score: float = Field(default=0.15, alias="RELEVANCE_MIN_SCORE")
+    relevance_top_k: int = Field(default=30, alias="RELEVANCE_TOP_K")
+    # Full page text (Tavily raw_content) is split into passages in a per-job BM25
+    # index; the extractor and planner pull only the top passages for open gaps.
+    # Off by default: it requests raw_content on every search, which costs more
+    # Tavily credits and misses search-cache entries written without it
+    passage_index_enabled: bool = Field(default=False, alias="PASSAGE_INDEX_ENABLED")
+    passage_max_words: int = Field(default=120, alias="PASSAGE_MAX_WORDS")
+    extractor_passage_top_k: int = Field(default=8, alias="EXTRACTOR_PASSAGE_TOP_K")
+    planner_passage_top_k: int = Field(default=4, alias="PLANNER_PASSAGE_TOP_K")
+    passage_index_max_jobs: int = Field(default=32, alias="PASSAGE_INDEX_MAX_JOBS")
+
+    # Analyzer: send only new facts plus a rolling digest after the first iteration
+    incremental_analysis: bool = Field(default=True, alias="INCREMENTAL_ANALYSIS")
+
+    # Pipelining: extract each query's results as soon as its search completes
+    pipelined_extraction: bool = Field(default=False, alias="PIPELINED_EXTRACTION")
+    pipeline_extraction_workers: int = Field(default=4, alias="PIPELINE_EXTRACTION_WORKERS")
 
 
 _settings: Settings | None = None
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from contextlib import contextmanager
-from typing import Any, Generator
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncGenerator, Generator
 
-from neo4j import GraphDatabase, Driver, Session
+from neo4j import AsyncDriver, AsyncGraphDatabase, AsyncSession, GraphDatabase, Driver, Session
 
 from src.config.settings import get_settings
 
@@ -12,10 +13,18 @@ logger = logging.getLogger(__name__)
 
 
 class Neo4jClient:
-    """Singleton wrapper around the Neo4j driver."""
+    """Singleton wrapper around the Neo4j driver.
+
+    The async driver (``asession``, ``arun_query``) is created on first use by
+    a coroutine and belongs to that coroutine's event loop, i.e. the loop that
+    runs research jobs.
+    """
 
     _instance: Neo4jClient | None = None
     _driver: Driver | None = None
+    _async_driver: AsyncDriver | None = None
+    # Concurrent first callers of ``aconnect`` must share one driver
+    _async_connect_lock = asyncio.Lock()
 
     def __new__(cls) -> Neo4jClient:
         if cls._instance is None:
@@ -26,14 +35,7 @@ class Neo4jClient:
         if self._driver is not None:
             return
         settings = get_settings()
-        uri = settings.neo4j_uri
-
-        # neo4j+ssc:// accepts self-signed certs (avoids SSL verify errors on Windows)
-        if uri.startswith("neo4j+s://"):
-            uri = uri.replace("neo4j+s://", "neo4j+ssc://", 1)
-        elif uri.startswith("bolt+s://"):
-            uri = uri.replace("bolt+s://", "bolt+ssc://", 1)
-
+        uri = _driver_uri(settings.neo4j_uri)
         self._driver = GraphDatabase.driver(
             uri,
             auth=(settings.neo4j_user, settings.neo4j_password),
@@ -41,12 +43,38 @@ class Neo4jClient:
         self._driver.verify_connectivity()
         logger.info("Connected to Neo4j at %s", uri)
 
+    async def aconnect(self) -> None:
+        if self._async_driver is not None:
+            return
+        async with self._async_connect_lock:
+            if self._async_driver is not None:
+                return
+            settings = get_settings()
+            uri = _driver_uri(settings.neo4j_uri)
+            driver = AsyncGraphDatabase.driver(
+                uri,
+                auth=(settings.neo4j_user, settings.neo4j_password),
+            )
+            try:
+                await driver.verify_connectivity()
+            except Exception:
+                await driver.close()
+                raise
+            self._async_driver = driver
+            logger.info("Connected to Neo4j at %s (async)", uri)
+
     def close(self) -> None:
         if self._driver:
             self._driver.close()
             self._driver = None
             logger.info("Neo4j connection closed")
 
+    async def aclose(self) -> None:
+        if self._async_driver:
+            await self._async_driver.close()
+            self._async_driver = None
+            logger.info("Neo4j async connection closed")
+
     @contextmanager
     def session(self) -> Generator[Session, None, None]:
         if self._driver is None:
@@ -55,12 +83,34 @@ class Neo4jClient:
         with self._driver.session(database=settings.neo4j_database) as session:
             yield session
 
+    @asynccontextmanager
+    async def asession(self) -> AsyncGenerator[AsyncSession, None]:
+        if self._async_driver is None:
+            await self.aconnect()
+        settings = get_settings()
+        async with self._async_driver.session(database=settings.neo4j_database) as session:
+            yield session
+
     def run_query(self, query: str, parameters: dict[str, Any] | None = None) -> list[dict]:
         with self.session() as session:
             result = session.run(query, parameters or {})
             return [record.data() for record in result]
 
+    async def arun_query(self, query: str, parameters: dict[str, Any] | None = None) -> list[dict]:
+        async with self.asession() as session:
+            result = await session.run(query, parameters or {})
+            return [record.data() async for record in result]
+
     def clear_database(self) -> None:
         """Remove all nodes and relationships (use with caution)."""
         self.run_query("MATCH (n) DETACH DELETE n")
         logger.warning("Neo4j database cleared")
+
+
+def _driver_uri(uri: str) -> str:
+    # neo4j+ssc:// accepts self-signed certs (avoids SSL verify errors on Windows)
+    if uri.startswith("neo4j+s://"):
+        return uri.replace("neo4j+s://", "neo4j+ssc://", 1)
+    if uri.startswith("bolt+s://"):
+        return uri.replace("bolt+s://", "bolt+ssc://", 1)
+    return uri
@@ -92,74 +92,104 @@ class IdentityGraphQueries:
     def build_from_research(self, target_name: str, facts: list[dict], connections: list[dict]) -> None:
         """Build the full identity graph from research results using batched queries."""
         logger.info("Building identity graph for %s", target_name)
-
-        persons: list[dict] = [{"name": target_name, "props": {"role": "research_target"}}]
-        organizations: list[dict] = []
-        documents: list[dict] = []
-        entity_types: dict[str, str] = {}
-
-        for fact in facts:
-            for entity in fact.get("entities", []):
-                if entity.lower() == target_name.lower() or entity in entity_types:
-                    continue
-                category = fact.get("category", "")
-                if category in ("professional", "financial"):
-                    organizations.append({"name": entity, "props": {}})
-                    entity_types[entity] = "Organization"
-                else:
-                    persons.append({"name": entity, "props": {}})
-                    entity_types[entity] = "Person"
-
-            if fact.get("source_url") and fact.get("source_title"):
-                documents.append({
-                    "title": fact["source_title"],
-                    "props": {"url": fact["source_url"], "confidence": fact.get("confidence", 0.5)},
-                })
-
+        batches, relationships = _research_statements(target_name, facts, connections)
         with self._client.session() as session:
-            if persons:
-                session.run(
-                    "UNWIND $batch AS item MERGE (p:Person {name: item.name}) SET p += item.props",
-                    {"batch": persons},
-                )
-            if organizations:
-                session.run(
-                    "UNWIND $batch AS item MERGE (o:Organization {name: item.name}) SET o += item.props",
-                    {"batch": organizations},
-                )
-            if documents:
-                session.run(
-                    "UNWIND $batch AS item MERGE (d:Document {title: item.title}) SET d += item.props",
-                    {"batch": documents},
-                )
-
-            for conn in connections:
-                source = conn.get("source_entity", "")
-                target = conn.get("target_entity", "")
-                rel_type = _sanitize_rel_type(conn.get("relationship", "ASSOCIATED_WITH"))
-                source_label = entity_types.get(source, "Person")
-                target_label = entity_types.get(target, "Person")
-
+            for query, params in batches:
+                session.run(query, params)
+            for (query, params), (source, target) in relationships:
                 try:
-                    session.run(
-                        f"MATCH (a:{source_label} {{name: $source_name}}) "
-                        f"MATCH (b:{target_label} {{name: $target_name}}) "
-                        f"MERGE (a)-[r:{rel_type}]->(b) SET r += $props",
-                        {
-                            "source_name": source,
-                            "target_name": target,
-                            "props": {
-                                "description": conn.get("description", ""),
-                                "confidence": conn.get("confidence", 0.5),
-                            },
-                        },
-                    )
+                    session.run(query, params)
                 except Exception as e:
                     logger.warning("Failed to create relationship %s->%s: %s", source, target, e)
+        logger.info("Identity graph built: processed %d facts, %d connections", len(facts), len(connections))
 
+    async def abuild_from_research(self, target_name: str, facts: list[dict], connections: list[dict]) -> None:
+        """Async ``build_from_research``, on the async Neo4j driver."""
+        logger.info("Building identity graph for %s", target_name)
+        batches, relationships = _research_statements(target_name, facts, connections)
+        async with self._client.asession() as session:
+            for query, params in batches:
+                await (await session.run(query, params)).consume()
+            for (query, params), (source, target) in relationships:
+                try:
+                    await (await session.run(query, params)).consume()
+                except Exception as e:
+                    logger.warning("Failed to create relationship %s->%s: %s", source, target, e)
         logger.info("Identity graph built: processed %d facts, %d connections", len(facts), len(connections))
 
 
+_Statement = tuple[str, dict[str, Any]]
+
+
+def _research_statements(
+    target_name: str, facts: list[dict], connections: list[dict],
+) -> tuple[list[_Statement], list[tuple[_Statement, tuple[str, str]]]]:
+    """Cypher for a research result: batched node merges, and one statement per
+    connection paired with its (source, target) for error reporting."""
+    persons: list[dict] = [{"name": target_name, "props": {"role": "research_target"}}]
+    organizations: list[dict] = []
+    documents: list[dict] = []
+    entity_types: dict[str, str] = {}
+
+    for fact in facts:
+        for entity in fact.get("entities", []):
+            if entity.lower() == target_name.lower() or entity in entity_types:
+                continue
+            category = fact.get("category", "")
+            if category in ("professional", "financial"):
+                organizations.append({"name": entity, "props": {}})
+                entity_types[entity] = "Organization"
+            else:
+                persons.append({"name": entity, "props": {}})
+                entity_types[entity] = "Person"
+
+        if fact.get("source_url") and fact.get("source_title"):
+            documents.append({
+                "title": fact["source_title"],
+                "props": {"url": fact["source_url"], "confidence": fact.get("confidence", 0.5)},
+            })
+
+    batches: list[_Statement] = []
+    if persons:
+        batches.append((
+            "UNWIND $batch AS item MERGE (p:Person {name: item.name}) SET p += item.props",
+            {"batch": persons},
+        ))
+    if organizations:
+        batches.append((
+            "UNWIND $batch AS item MERGE (o:Organization {name: item.name}) SET o += item.props",
+            {"batch": organizations},
+        ))
+    if documents:
+        batches.append((
+            "UNWIND $batch AS item MERGE (d:Document {title: item.title}) SET d += item.props",
+            {"batch": documents},
+        ))
+
+    relationships = []
+    for conn in connections:
+        source = conn.get("source_entity", "")
+        target = conn.get("target_entity", "")
+        rel_type = _sanitize_rel_type(conn.get("relationship", "ASSOCIATED_WITH"))
+        source_label = entity_types.get(source, "Person")
+        target_label = entity_types.get(target, "Person")
+        query = (
+            f"MATCH (a:{source_label} {{name: $source_name}}) "
+            f"MATCH (b:{target_label} {{name: $target_name}}) "
+            f"MERGE (a)-[r:{rel_type}]->(b) SET r += $props"
+        )
+        params = {
+            "source_name": source,
+            "target_name": target,
+            "props": {
+                "description": conn.get("description", ""),
+                "confidence": conn.get("confidence", 0.5),
+            },
+        }
+        relationships.append(((query, params), (source, target)))
+    return batches, relationships
+
+
 def _sanitize_rel_type(raw: str) -> str:
     """Sanitize a relationship type for Neo4j Cypher.
 
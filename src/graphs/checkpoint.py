@@ -0,0 +1,230 @@
+"""Durable SQLite checkpoints of research graph state, so interrupted jobs can resume."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, AsyncIterator, Sequence
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import ChannelVersions, Checkpoint, CheckpointMetadata, CheckpointTuple
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+from src.config.settings import get_settings
+from src.utils.rate_limit_backends import default_worker_id
+
+logger = logging.getLogger(__name__)
+
+# Owner of the job claims this process takes; unique per start even if a
+# container restarts with the same host name and PID
+WORKER_ID = f"{default_worker_id()}:{uuid.uuid4().hex[:8]}"
+
+# A running job's claim is considered abandoned after this many missed heartbeats
+_STALE_HEARTBEATS = 4
+
+_heartbeats: dict[int, threading.Thread] = {}
+_heartbeats_lock = threading.Lock()
+
+
+class SharedSqliteSaver(SqliteSaver):
+    """SqliteSaver that also serves ``ainvoke`` runs, doing its I/O on worker threads.
+
+    ``AsyncSqliteSaver`` is tied to the event loop that opened it; this keeps
+    one connection for blocking and async runs alike, on any loop.
+    """
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        items = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in items:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+
+def checkpoint_config(job_id: str) -> dict:
+    """Graph config that checkpoints a job's run under its own thread."""
+    return {"configurable": {"thread_id": job_id}}
+
+
+def open_checkpointer(path: str | Path) -> SharedSqliteSaver:
+    """A checkpointer on ``path``, safe to share between the threads and event loops running jobs."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    checkpointer = SharedSqliteSaver(sqlite3.connect(str(path), check_same_thread=False, timeout=30.0))
+    checkpointer.setup()
+    with checkpointer.cursor() as cur:
+        cur.execute(
+            "CREATE TABLE IF NOT EXISTS job_claims ("
+            " thread_id TEXT PRIMARY KEY,"
+            " owner TEXT NOT NULL,"
+            " heartbeat_at REAL NOT NULL,"
+            " failed INTEGER NOT NULL DEFAULT 0)"
+        )
+    return checkpointer
+
+
+def checkpointed_jobs(checkpointer: SqliteSaver) -> list[str]:
+    """IDs of every job with checkpoints, i.e. not yet finished (finished jobs delete theirs)."""
+    with checkpointer.cursor() as cur:
+        cur.execute("SELECT DISTINCT thread_id FROM checkpoints")
+        return [row[0] for row in cur.fetchall()]
+
+
+def job_states(checkpointer: SqliteSaver, heartbeat_seconds: float) -> dict[str, str]:
+    """State of every checkpointed job: ``running``, ``failed`` or ``interrupted``.
+
+    A job is running while its owner's heartbeat is recent, failed once a run
+    raised (it resumes only on request), and interrupted when its claim was
+    released mid-run or its owner stopped heartbeating, e.g. the process died.
+    """
+    stale = time.time() - heartbeat_seconds * _STALE_HEARTBEATS
+    with checkpointer.cursor() as cur:
+        cur.execute(
+            "SELECT c.thread_id, j.failed, j.heartbeat_at"
+            " FROM (SELECT DISTINCT thread_id FROM checkpoints) c"
+            " LEFT JOIN job_claims j ON j.thread_id = c.thread_id"
+        )
+        rows = cur.fetchall()
+    states = {}
+    for job_id, failed, heartbeat_at in rows:
+        if failed:
+            states[job_id] = "failed"
+        elif heartbeat_at is not None and heartbeat_at >= stale:
+            states[job_id] = "running"
+        else:
+            states[job_id] = "interrupted"
+    return states
+
+
+def live_claims(checkpointer: SqliteSaver, heartbeat_seconds: float) -> set[str]:
+    """IDs of the jobs some worker holds a live claim on (running or queued there)."""
+    stale = time.time() - heartbeat_seconds * _STALE_HEARTBEATS
+    with checkpointer.cursor() as cur:
+        cur.execute("SELECT thread_id FROM job_claims WHERE failed = 0 AND heartbeat_at >= ?", (stale,))
+        return {row[0] for row in cur.fetchall()}
+
+
+def claim_job(
+    checkpointer: SqliteSaver,
+    job_id: str,
+    heartbeat_seconds: float,
+    *,
+    owner: str = WORKER_ID,
+    include_failed: bool = False,
+) -> bool:
+    """Atomically claim a job for ``owner``; False if another worker is running it.
+
+    A claim whose heartbeat went stale can be taken over, and so can a failed
+    job's when ``include_failed`` is set (an explicit resume). ``owner`` can
+    always renew its own claim.
+    """
+    now = time.time()
+    with checkpointer.cursor() as cur:
+        cur.execute(
+            "INSERT INTO job_claims (thread_id, owner, heartbeat_at, failed) VALUES (?, ?, ?, 0)"
+            " ON CONFLICT (thread_id) DO UPDATE SET"
+            " owner = excluded.owner, heartbeat_at = excluded.heartbeat_at, failed = 0"
+            " WHERE job_claims.owner = excluded.owner"
+            " OR (job_claims.failed = 0 AND job_claims.heartbeat_at < ?)"
+            " OR (job_claims.failed = 1 AND ?)",
+            (job_id, owner, now, now - heartbeat_seconds * _STALE_HEARTBEATS, int(include_failed)),
+        )
+        return cur.rowcount == 1
+
+
+def heartbeat(checkpointer: SqliteSaver, owner: str = WORKER_ID) -> None:
+    """Renew every live claim ``owner`` holds."""
+    with checkpointer.cursor() as cur:
+        cur.execute(
+            "UPDATE job_claims SET heartbeat_at = ? WHERE owner = ? AND failed = 0", (time.time(), owner),
+        )
+
+
+def start_heartbeat(checkpointer: SqliteSaver, interval_seconds: float) -> None:
+    """Renew this process's claims on ``checkpointer`` every ``interval_seconds``, in a daemon thread."""
+
+    def run() -> None:
+        while True:
+            time.sleep(interval_seconds)
+            try:
+                heartbeat(checkpointer)
+            except sqlite3.Error as e:
+                logger.warning("Job heartbeat failed: %s", e)
+
+    with _heartbeats_lock:
+        if id(checkpointer) in _heartbeats:
+            return
+        thread = threading.Thread(target=run, name="job-heartbeat", daemon=True)
+        _heartbeats[id(checkpointer)] = thread
+        thread.start()
+
+
+def release_job(
+    checkpointer: SqliteSaver, job_id: str, *, finished: bool, failed: bool = False, owner: str = WORKER_ID,
+) -> None:
+    """Give up ``owner``'s claim on a job and delete its checkpoints once it has finished.
+
+    A failed job keeps its checkpoints and is marked failed, so start-up resumption
+    leaves it alone; any other release leaves it interrupted, to be resumed.
+    """
+    if finished:
+        checkpointer.delete_thread(job_id)
+    with checkpointer.cursor() as cur:
+        if finished:
+            cur.execute("DELETE FROM job_claims WHERE thread_id = ?", (job_id,))
+        elif failed:
+            cur.execute("UPDATE job_claims SET failed = 1 WHERE thread_id = ? AND owner = ?", (job_id, owner))
+        else:
+            cur.execute("DELETE FROM job_claims WHERE thread_id = ? AND owner = ?", (job_id, owner))
+
+
+_checkpointer: SharedSqliteSaver | None = None
+_checkpointer_lock = threading.Lock()
+
+
+def get_checkpointer() -> SharedSqliteSaver | None:
+    """Process-wide checkpointer, or None when checkpointing is disabled in settings."""
+    global _checkpointer
+    settings = get_settings()
+    if not settings.checkpoint_enabled:
+        return None
+    with _checkpointer_lock:
+        if _checkpointer is None:
+            _checkpointer = open_checkpointer(settings.checkpoint_path)
+    return _checkpointer
@@ -2,62 +2,118 @@ from __future__ import annotations
 
 import json
 import logging
+from collections import Counter
 
 from langchain_core.messages import SystemMessage, HumanMessage
 
 from src.config.models import TaskType
-from src.models.router import ModelRouter
+from src.config.settings import get_settings
+from src.models.router import get_model_router
 from src.graphs.state import ResearchState
-from src.utils.text import robust_json_loads
-from src.utils.llm_retry import resilient_invoke
-from src.utils.prompts.analysis import ANALYSIS_SYSTEM_PROMPT, ANALYSIS_USER_PROMPT
+from src.utils.text import robust_json_loads, estimate_tokens
+from src.utils.llm_retry import aresilient_invoke, resilient_invoke
+from src.utils.prompts.analysis import (
+    ANALYSIS_SYSTEM_PROMPT,
+    ANALYSIS_USER_PROMPT,
+    ANALYSIS_INCREMENTAL_USER_PROMPT,
+)
 
 logger = logging.getLogger(__name__)
 
+_DIGEST_MAX_CHARS = 1500
+
 
 def analyzer_node(state: ResearchState) -> dict:
-    """Analyze accumulated facts for risk patterns, connections, and inconsistencies."""
-    logger.info("Analyzer node: analyzing %d facts", len(state.get("extracted_facts", [])))
+    """Analyze accumulated facts for risk patterns, connections, and inconsistencies.
+
+    In incremental mode only the facts added since the last analysis are sent,
+    together with a compact rolling digest of everything analyzed before.
+    """
+    messages, update = _analysis_request(state)
+    if messages is None:
+        return update
+    response = resilient_invoke(get_model_router(), TaskType.ANALYSIS, messages, temperature=0.1, json_mode=True)
+    return _analysis_update(state, response, update)
+
+
+async def aanalyzer_node(state: ResearchState) -> dict:
+    """Async ``analyzer_node``."""
+    messages, update = _analysis_request(state)
+    if messages is None:
+        return update
+    response = await aresilient_invoke(
+        get_model_router(), TaskType.ANALYSIS, messages, temperature=0.1, json_mode=True,
+    )
+    return _analysis_update(state, response, update)
 
-    router = ModelRouter()
+
+def _analysis_request(state: ResearchState) -> tuple[list | None, dict]:
+    """The analysis prompt and the update to extend with its result.
+
+    Messages are None when there is nothing new to analyze; the update is then final.
+    """
+    logger.info("Analyzer node: analyzing %d facts", len(state.get("extracted_facts", [])))
 
     facts = state.get("extracted_facts", [])
     existing_risks = state.get("risk_flags", [])
 
-    facts_json = json.dumps(
-        [
-            {
-                "index": i,
-                "category": f.get("category", ""),
-                "claim": f.get("claim", ""),
-                "source_url": f.get("source_url", ""),
-                "entities": f.get("entities", []),
-                "confidence": f.get("confidence", 0.5),
-            }
-            for i, f in enumerate(facts)
-        ],
-        indent=2,
-    )
-
     existing_risks_json = json.dumps(
         [{"category": r["risk_category"], "description": r["description"]} for r in existing_risks],
         indent=2,
     ) if existing_risks else "[]"
 
-    user_prompt = ANALYSIS_USER_PROMPT.format(
+    full_prompt = ANALYSIS_USER_PROMPT.format(
         target_name=state["target_name"],
         target_context=state.get("target_context", ""),
         fact_count=len(facts),
-        extracted_facts=facts_json,
+        extracted_facts=json.dumps(_fact_rows(facts), indent=2),
         existing_risks=existing_risks_json,
     )
 
+    analyzed_count = state.get("analyzed_fact_count", 0)
+    digest = state.get("analysis_digest", "")
+    incremental = get_settings().incremental_analysis and analyzed_count > 0 and bool(digest)
+
+    if incremental:
+        new_facts = facts[analyzed_count:]
+        if not new_facts:
+            logger.info("No new facts since last analysis, skipping LLM call")
+            return None, {
+                "risk_flags": [],
+                "connections": [],
+                "status": "validating",
+                "run_metrics": {"analyzer_tokens_saved": estimate_tokens(full_prompt)},
+            }
+        user_prompt = ANALYSIS_INCREMENTAL_USER_PROMPT.format(
+            target_name=state["target_name"],
+            target_context=state.get("target_context", ""),
+            analyzed_count=analyzed_count,
+            analysis_digest=digest,
+            new_fact_count=len(new_facts),
+            fact_count=len(facts),
+            new_facts=json.dumps(_fact_rows(new_facts, offset=analyzed_count), separators=(",", ":")),
+            existing_risks=existing_risks_json,
+        )
+    else:
+        user_prompt = full_prompt
+
+    tokens_saved = estimate_tokens(full_prompt) - estimate_tokens(user_prompt)
+    if incremental:
+        logger.info(
+            "Incremental analysis: %d new of %d facts, ~%d prompt tokens saved",
+            len(facts) - analyzed_count, len(facts), tokens_saved,
+        )
+
     messages = [
         SystemMessage(content=ANALYSIS_SYSTEM_PROMPT),
         HumanMessage(content=user_prompt),
     ]
+    return messages, {"run_metrics": {"analyzer_tokens_saved": max(tokens_saved, 0)}}
 
-    response = resilient_invoke(router, TaskType.ANALYSIS, messages, temperature=0.1, json_mode=True)
+
+def _analysis_update(state: ResearchState, response, update: dict) -> dict:
+    facts = state.get("extracted_facts", [])
+    existing_risks = state.get("risk_flags", [])
     if response:
         analysis = _parse_analysis(response.content)
     else:
@@ -68,15 +124,59 @@ def analyzer_node(state: ResearchState) -> dict:
 
     logger.info("Identified %d new risks, %d connections", len(new_risks), len(new_connections))
 
-    return {
+    update = {
         "risk_flags": new_risks,
         "connections": new_connections,
         "status": "validating",
+        **update,
     }
+    if response:
+        # Only advance the watermark when the facts were actually analyzed
+        update["analyzed_fact_count"] = len(facts)
+        update["analysis_digest"] = _next_digest(analysis, facts, existing_risks + new_risks)
+        gaps = analysis.get("information_gaps")
+        update["information_gaps"] = [
+            g for g in (gaps if isinstance(gaps, list) else []) if isinstance(g, str) and g.strip()
+        ]
+    return update
+
+
+def _fact_rows(facts: list[dict], offset: int = 0) -> list[dict]:
+    return [
+        {
+            "index": offset + i,
+            "category": f.get("category", ""),
+            "claim": f.get("claim", ""),
+            "source_url": f.get("source_url", ""),
+            "entities": f.get("entities", []),
+            "confidence": f.get("confidence", 0.5),
+        }
+        for i, f in enumerate(facts)
+    ]
+
+
+def _next_digest(analysis: dict, facts: list[dict], risks: list[dict]) -> str:
+    """Use the LLM's updated digest, or build a compact one from state if it gave none."""
+    digest = analysis.get("analysis_digest")
+    if isinstance(digest, str) and digest.strip():
+        return digest.strip()[:_DIGEST_MAX_CHARS]
+
+    categories = Counter(f.get("category", "unknown") for f in facts)
+    entities = Counter(e for f in facts for e in f.get("entities", []) if isinstance(e, str))
+    lines = [
+        "Fact categories: " + ", ".join(f"{c} ({n})" for c, n in categories.most_common()),
+        "Key entities: " + ", ".join(e for e, _ in entities.most_common(15)),
+        "Risk themes: " + "; ".join(
+            f"{r.get('risk_category', '')}/{r.get('severity', '')}: {str(r.get('description', ''))[:80]}"
+            for r in risks[:10]
+            if isinstance(r, dict)
+        ),
+    ]
+    return "\n".join(lines)[:_DIGEST_MAX_CHARS]
 
 
 def _parse_analysis(content) -> dict:
-    parsed = robust_json_loads(content, context="analyzer._parse_analysis")
+    parsed = robust_json_loads(content, context="analyzer._parse_analysis", partial=True)
     if isinstance(parsed, dict):
         return parsed
     logger.warning("Analysis returned non-dict, returning empty")
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
 
 from langchain_core.messages import SystemMessage, HumanMessage
 
 from src.config.models import TaskType
-from src.models.router import ModelRouter
+from src.config.settings import get_settings
+from src.models.router import ModelRouter, get_model_router
 from src.graphs.state import ResearchState
-from src.utils.text import robust_json_loads
-from src.utils.llm_retry import resilient_invoke
+from src.tools.search import SeenDocuments, canonicalize_url
+from src.utils.fact_index import FactIndex, source_urls
+from src.utils.passage_index import get_passage_index, passages_as_search
+from src.utils.relevance import gap_query, rank_results, relevance_query
+from src.utils.text import robust_json_loads, estimate_tokens
+from src.utils.llm_retry import aresilient_invoke, resilient_invoke
 from src.utils.prompts.extraction import (
     EXTRACTION_SYSTEM_PROMPT,
     EXTRACTION_USER_PROMPT,
@@ -17,81 +25,392 @@ from src.utils.prompts.extraction import (
 
 logger = logging.getLogger(__name__)
 
+PASSAGES_QUERY = "Full-page passages on open questions"
+
+
+class _ExtractionPlan(NamedTuple):
+    chunks: list[list[dict]]
+    existing_summary: str
+    seen: SeenDocuments
+    search_count: int
+    metrics: dict
+
 
 def extractor_node(state: ResearchState) -> dict:
-    """Extract structured facts from this iteration's search results in a single batched LLM call."""
-    logger.info("Extractor node: processing search results")
+    """Extract structured facts from this iteration's search results.
+
+    Results are packed into token-budgeted chunks (EXTRACTION_CHUNK_TOKENS) that are
+    extracted in parallel (EXTRACTION_MAX_PARALLEL), then merged into the job's facts
+    through a ``FactIndex``: paraphrases of a known claim add a corroborating source
+    to it instead of becoming a new fact. The best unseen passages of full page
+    text for the current information gaps are extracted alongside the snippets.
+    Only documents of chunks whose extraction succeeded are marked seen, so a
+    failed chunk is sent again in the next iteration.
+    """
+    router = get_model_router()
+    settings = get_settings()
+    plan = _plan_extraction(state, settings)
+
+    def _extract(chunk: list[dict]) -> list[dict] | None:
+        try:
+            return extract_facts(router, state["target_name"], chunk, plan.existing_summary)
+        except Exception as e:
+            logger.error("Extraction chunk failed: %s", e)
+            return None
+
+    if len(plan.chunks) <= 1:
+        chunk_facts = [_extract(chunk) for chunk in plan.chunks]
+    else:
+        workers = max(1, min(settings.extraction_max_parallel, len(plan.chunks)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            chunk_facts = list(pool.map(_extract, plan.chunks))
+    return _merge_extraction(state, plan, chunk_facts, settings)
+
+
+async def aextractor_node(state: ResearchState) -> dict:
+    """Async ``extractor_node``: chunks are extracted as concurrent tasks, EXTRACTION_MAX_PARALLEL at a time."""
+    router = get_model_router()
+    settings = get_settings()
+    plan = _plan_extraction(state, settings)
+    slots = asyncio.Semaphore(max(1, settings.extraction_max_parallel))
+
+    async def _extract(chunk: list[dict]) -> list[dict] | None:
+        async with slots:
+            try:
+                return await aextract_facts(router, state["target_name"], chunk, plan.existing_summary)
+            except Exception as e:
+                logger.error("Extraction chunk failed: %s", e)
+                return None
 
-    router = ModelRouter()
+    chunk_facts = await asyncio.gather(*(_extract(chunk) for chunk in plan.chunks))
+    return _merge_extraction(state, plan, chunk_facts, settings)
+
+
+def _plan_extraction(state: ResearchState, settings) -> _ExtractionPlan:
+    """This iteration's unseen, relevant results and gap passages, packed into extraction chunks."""
+    logger.info("Extractor node: processing search results")
 
     search_history = state.get("search_history", [])
-    existing_facts = state.get("extracted_facts", [])
-    existing_claims = {f.get("claim", "") for f in existing_facts}
     plan_queries = set(state.get("research_plan", []))
 
-    existing_facts_summary = json.dumps(
-        [{"claim": f["claim"], "category": f["category"]} for f in existing_facts[:50]],
-        indent=2,
-    ) if existing_facts else "[]"
-
     new_searches = [
         s for s in search_history
         if s["query"] in plan_queries and s.get("results")
     ]
 
-    if not new_searches:
+    seen = seen_documents(state, settings)
+    documents, doc_metrics = filter_seen_documents(new_searches, seen)
+    if settings.relevance_filter_enabled:
+        documents, relevance_metrics = filter_relevant_results(
+            documents, relevance_query(state),
+            min_score=settings.relevance_min_score, top_k=settings.relevance_top_k,
+        )
+        doc_metrics.update(relevance_metrics)
+    passages, passage_metrics = take_gap_passages(state, settings)
+    documents += passages
+    doc_metrics.update(passage_metrics)
+
+    chunks = chunk_searches(documents, settings.extraction_chunk_tokens)
+    if not chunks:
         logger.info("No new search results to extract from")
-        return {"extracted_facts": [], "status": "analyzing"}
+    existing_summary = summarize_existing_facts(state.get("extracted_facts", []))
+    return _ExtractionPlan(chunks, existing_summary, seen, len(new_searches), doc_metrics)
 
-    all_results_text = _format_all_results(new_searches)
 
+def _merge_extraction(
+    state: ResearchState, plan: _ExtractionPlan, chunk_facts: list[list[dict] | None], settings,
+) -> dict:
+    existing_facts = state.get("extracted_facts", [])
+    index = FactIndex(existing_facts, threshold=settings.fact_dedup_threshold)
+    for chunk, facts in zip(plan.chunks, chunk_facts):
+        if facts is None:
+            continue
+        plan.seen.commit(chunk)
+        dedupe_new_facts(facts, index)
+    merged = index.merged
+    corroborated = credit_mirror_sources(existing_facts + index.changes(), plan.seen.mirrors, index)
+
+    logger.info(
+        "Extracted %d new facts from %d searches (%d LLM calls, %d merged into known facts, "
+        "%d corroborated by syndicated copies)",
+        index.added, plan.search_count, len(plan.chunks), merged, corroborated,
+    )
+    return {
+        "extracted_facts": index.changes(),
+        "seen_documents": plan.seen.new,
+        "document_fingerprints": plan.seen.new_fingerprints,
+        "run_metrics": {
+            "facts_merged": merged,
+            "facts_corroborated_by_syndication": corroborated,
+            **plan.metrics,
+        },
+        "status": "analyzing",
+    }
+
+
+def extract_facts(
+    router: ModelRouter,
+    target_name: str,
+    searches: list[dict],
+    existing_facts_summary: str,
+) -> list[dict] | None:
+    """Run one extraction LLM call over a group of searches and return the raw facts.
+
+    Returns None when the call failed or its response could not be parsed, as
+    opposed to an empty list for a response that found no facts.
+    """
+    messages = _extraction_messages(target_name, searches, existing_facts_summary)
+    response = resilient_invoke(router, TaskType.EXTRACTION, messages, temperature=0.0, json_mode=True)
+    if not response:
+        return None
+    return _parse_facts(response.content)
+
+
+async def aextract_facts(
+    router: ModelRouter,
+    target_name: str,
+    searches: list[dict],
+    existing_facts_summary: str,
+) -> list[dict] | None:
+    """Async ``extract_facts``."""
+    messages = _extraction_messages(target_name, searches, existing_facts_summary)
+    response = await aresilient_invoke(router, TaskType.EXTRACTION, messages, temperature=0.0, json_mode=True)
+    if not response:
+        return None
+    return _parse_facts(response.content)
+
+
+def _extraction_messages(target_name: str, searches: list[dict], existing_facts_summary: str) -> list:
     user_prompt = EXTRACTION_USER_PROMPT.format(
-        target_name=state["target_name"],
-        search_results=all_results_text,
+        target_name=target_name,
+        search_results=_format_all_results(searches),
         existing_facts=existing_facts_summary,
     )
-
-    messages = [
+    return [
         SystemMessage(content=EXTRACTION_SYSTEM_PROMPT),
         HumanMessage(content=user_prompt),
     ]
 
-    new_facts = []
-    response = resilient_invoke(router, TaskType.EXTRACTION, messages, temperature=0.0, json_mode=True)
-    if response:
-        facts = _parse_facts(response.content)
-        for fact in facts:
-            if fact.get("claim") and fact["claim"] not in existing_claims:
-                fact.setdefault("confidence", 0.5)
-                new_facts.append(fact)
-                existing_claims.add(fact["claim"])
-
-    logger.info("Extracted %d new facts from %d searches (single LLM call)", len(new_facts), len(new_searches))
-    return {
-        "extracted_facts": new_facts,
-        "status": "analyzing",
+
+def summarize_existing_facts(existing_facts: list[dict]) -> str:
+    """Compact JSON list of recently found claims, shown to the LLM to avoid duplicates.
+
+    Only the latest 50 are listed; duplicates of older claims are caught by the
+    ``FactIndex`` afterwards.
+    """
+    if not existing_facts:
+        return "[]"
+    return json.dumps(
+        [{"claim": f["claim"], "category": f.get("category", "")} for f in existing_facts[-50:]],
+        indent=2,
+    )
+
+
+def dedupe_new_facts(facts: list[dict], index: FactIndex) -> list[dict]:
+    """Add extracted facts to ``index``, merging near-duplicates into known facts.
+
+    Returns the facts that are new or were updated with another source. The same
+    index can be threaded through several chunks to dedupe across them; call
+    ``index.changes()`` for the final version of every touched fact.
+    """
+    changed = []
+    for fact in facts:
+        if not isinstance(fact, dict) or not fact.get("claim") or not fact["claim"].strip():
+            continue
+        result = index.add(fact)
+        if result is not None:
+            changed.append(result)
+    return changed
+
+
+def seen_documents(state: ResearchState, settings) -> SeenDocuments:
+    """The job's index of documents already sent to the extractor."""
+    return SeenDocuments(
+        state.get("seen_documents", {}),
+        state.get("document_fingerprints", {}),
+        max_distance=settings.simhash_max_distance,
+    )
+
+
+def filter_seen_documents(searches: list[dict], seen: SeenDocuments) -> tuple[list[dict], dict]:
+    """Drop or collapse results the job has already extracted; return them with run_metrics.
+
+    The kept results are only marked seen once ``seen.commit`` is called for them.
+    """
+    before = (seen.dropped, seen.collapsed, seen.clustered)
+    kept = seen.filter(searches)
+    dropped, collapsed, clustered = (
+        now - then for now, then in zip((seen.dropped, seen.collapsed, seen.clustered), before)
+    )
+    skipped = dropped + collapsed + clustered
+    tokens_avoided = 0
+    if skipped:
+        tokens_avoided = max(
+            0, estimate_tokens(_format_all_results(searches)) - estimate_tokens(_format_all_results(kept)),
+        )
+        logger.info(
+            "Skipped %d already-seen documents and %d syndicated copies, collapsed %d duplicates "
+            "(~%d prompt tokens avoided)",
+            dropped, clustered, collapsed, tokens_avoided,
+        )
+    return kept, {
+        "extractor_documents_skipped": skipped,
+        "extractor_syndicated_copies": clustered,
+        "extractor_tokens_avoided": tokens_avoided,
     }
 
 
+def take_gap_passages(state: ResearchState, settings) -> tuple[list[dict], dict]:
+    """Unseen passages from the job's full-page index that best cover the current gaps.
+
+    Passages must clear ``relevance_min_score`` against the target itself and
+    are ranked by ``gap_query``. Returns them as one search_history-shaped
+    entry (or none) with run_metrics.
+    """
+    index = get_passage_index(state.get("job_id"))
+    if index is None:
+        return [], {}
+    passages = index.take(
+        gap_query(state), settings.extractor_passage_top_k,
+        gate=relevance_query(state), min_score=settings.relevance_min_score,
+    )
+    if not passages:
+        return [], {}
+    search = passages_as_search(passages, PASSAGES_QUERY)
+    tokens = estimate_tokens(_format_all_results([search]))
+    logger.info("Added %d full-page passages (~%d tokens) for open questions", len(passages), tokens)
+    return [search], {"passages_extracted": len(passages), "passage_tokens_extracted": tokens}
+
+
+def filter_relevant_results(
+    searches: list[dict],
+    query: dict[str, float],
+    *,
+    min_score: float,
+    top_k: int = 0,
+) -> tuple[list[dict], dict]:
+    """Drop results scoring below ``min_score`` against ``query``, then keep the best ``top_k``.
+
+    Scores are BM25 relevance normalized to 0-1 (see ``BM25Ranker.relevance``);
+    ``top_k`` of 0 keeps every result above the threshold. Returns the
+    remaining searches, in their original order, with run_metrics.
+    """
+    flat = [r for s in searches for r in s.get("results", [])]
+    scores = rank_results(flat, query)
+    keep = [i for i, score in enumerate(scores) if score >= min_score]
+    if top_k and len(keep) > top_k:
+        keep = sorted(sorted(keep, key=lambda i: scores[i], reverse=True)[:top_k])
+    keep_ids = {id(flat[i]) for i in keep}
+
+    kept = []
+    for s in searches:
+        results = [r for r in s.get("results", []) if id(r) in keep_ids]
+        if results:
+            kept.append({**s, "results": results})
+
+    dropped = len(flat) - len(keep)
+    tokens_avoided = 0
+    if dropped:
+        tokens_avoided = max(
+            0, estimate_tokens(_format_all_results(searches)) - estimate_tokens(_format_all_results(kept)),
+        )
+        logger.info(
+            "Relevance filter dropped %d of %d results (~%d prompt tokens avoided)",
+            dropped, len(flat), tokens_avoided,
+        )
+    return kept, {"relevance_results_dropped": dropped, "relevance_tokens_avoided": tokens_avoided}
+
+
+def credit_mirror_sources(facts: list[dict], mirrors: dict[str, list[str]], index: FactIndex) -> int:
+    """Add the URLs of dropped syndicated copies to facts sourced from the copy that was kept.
+
+    ``mirrors`` maps a canonical URL to the URLs of its near-identical copies
+    (``SeenDocuments.mirrors``). Returns how many facts gained a source.
+    """
+    if not mirrors:
+        return 0
+    corroborated = []
+    for fact in facts:
+        extra = mirrors.get(canonicalize_url(fact.get("source_url", "")))
+        if extra:
+            corroborated.append({**fact, "source_urls": source_urls(fact) + extra})
+    return len(dedupe_new_facts(corroborated, index))
+
+
+def chunk_searches(searches: list[dict], token_budget: int) -> list[list[dict]]:
+    """Pack search results into groups whose formatted text fits ``token_budget``.
+
+    Each chunk is a list of ``{"query", "results"}`` entries in the same shape as
+    search_history, so it can be passed straight to ``extract_facts``. A single
+    result larger than the budget gets a chunk of its own with its content trimmed.
+    """
+    chunks: list[list[dict]] = []
+    current: list[dict] = []
+    used = 0
+
+    for search_entry in searches:
+        query = search_entry["query"]
+        header_tokens = estimate_tokens(_format_query_header(query))
+        for r in search_entry.get("results", []):
+            cost = estimate_tokens(format_result(r))
+            if cost + header_tokens > token_budget:
+                r = _trim_result(r, token_budget - header_tokens)
+                cost = estimate_tokens(format_result(r))
+
+            entry_open = bool(current) and current[-1]["query"] == query
+            extra = cost if entry_open else cost + header_tokens
+            if current and used + extra > token_budget:
+                chunks.append(current)
+                current, used = [], 0
+                entry_open = False
+                extra = cost + header_tokens
+
+            if entry_open:
+                current[-1]["results"].append(r)
+            else:
+                current.append({"query": query, "results": [r]})
+            used += extra
+
+    if current:
+        chunks.append(current)
+    return chunks
+
+
 def _format_all_results(searches: list[dict]) -> str:
     """Format all search results from multiple queries into a single text block."""
     sections = []
     for search_entry in searches:
-        query = search_entry["query"]
-        results = search_entry.get("results", [])
-        section = f"=== Query: {query} ===\n"
-        for r in results:
-            section += (
-                f"Title: {r.get('title', 'N/A')}\n"
-                f"URL: {r.get('url', 'N/A')}\n"
-                f"Content: {r.get('content', 'N/A')}\n---\n"
-            )
+        section = _format_query_header(search_entry["query"])
+        for r in search_entry.get("results", []):
+            section += format_result(r)
         sections.append(section)
     return "\n".join(sections)
 
 
-def _parse_facts(content) -> list[dict]:
-    parsed = robust_json_loads(content, context="extractor._parse_facts")
+def _format_query_header(query: str) -> str:
+    return f"=== Query: {query} ===\n"
+
+
+def format_result(r: dict) -> str:
+    """One search result as it appears in the extraction prompt."""
+    return (
+        f"Title: {r.get('title', 'N/A')}\n"
+        f"URL: {r.get('url', 'N/A')}\n"
+        f"Content: {r.get('content', 'N/A')}\n---\n"
+    )
+
+
+def _trim_result(r: dict, token_budget: int) -> dict:
+    """Return a copy of a result with its content cut to roughly ``token_budget`` tokens."""
+    overhead = estimate_tokens(format_result({**r, "content": ""}))
+    max_chars = max(0, token_budget - overhead) * 4
+    return {**r, "content": (r.get("content") or "")[:max_chars]}
+
+
+def _parse_facts(content) -> list[dict] | None:
+    parsed = robust_json_loads(content, context="extractor._parse_facts", partial=True)
+    if parsed is None:
+        return None
     if isinstance(parsed, list):
         return parsed
     if isinstance(parsed, dict):
@@ -0,0 +1,202 @@
+"""Pipelined search + extraction node -- replaces searcher -> extractor when streaming is enabled.
+
+Each query's results are handed to an extraction worker as soon as they arrive,
+so one slow search no longer holds back extraction of the others.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+from src.config.settings import get_settings
+from src.models.router import get_model_router
+from src.graphs.state import ResearchState
+from src.graphs.nodes.extractor import (
+    aextract_facts,
+    extract_facts,
+    chunk_searches,
+    summarize_existing_facts,
+    dedupe_new_facts,
+    filter_seen_documents,
+    credit_mirror_sources,
+    filter_relevant_results,
+    seen_documents,
+    take_gap_passages,
+)
+from src.tools.search_engine import get_search_engine
+from src.utils.fact_index import FactIndex
+from src.utils.passage_index import get_passage_index, index_raw_content
+from src.utils.relevance import relevance_query
+
+logger = logging.getLogger(__name__)
+
+
+def search_extract_node(state: ResearchState) -> dict:
+    """Run planned searches and extract facts from each one as soon as it completes."""
+    new_queries = _new_queries(state)
+    if not new_queries:
+        logger.info("All queries already executed, skipping")
+        return {"search_history": [], "extracted_facts": [], "status": "analyzing"}
+
+    settings = get_settings()
+    router = get_model_router()
+    engine = get_search_engine()
+    stream = _SearchStream(state, settings)
+    search_futures = {
+        engine.submit(q, max_results=5, include_raw_content=stream.full_pages): q for q in new_queries
+    }
+    extraction_futures: dict[Future, list[dict]] = {}
+
+    def _submit(chunk: list[dict]) -> None:
+        future = pool.submit(extract_facts, router, stream.target_name, chunk, stream.existing_summary)
+        extraction_futures[future] = chunk
+
+    with ThreadPoolExecutor(max_workers=settings.pipeline_extraction_workers) as pool:
+        for future in as_completed(search_futures):
+            query = search_futures[future]
+            try:
+                results = future.result()
+            except Exception as e:
+                logger.error("Search failed for query '%s': %s", query, e)
+                results = []
+            for chunk in stream.add(query, results):
+                _submit(chunk)
+
+        # Full-page passages can only be ranked once every page of this wave is indexed
+        for chunk in stream.gap_passages():
+            _submit(chunk)
+
+        for future in as_completed(extraction_futures):
+            try:
+                facts = future.result()
+            except Exception as e:
+                logger.error("Pipelined extraction failed: %s", e)
+                continue
+            stream.extracted(extraction_futures[future], facts)
+    return stream.update(len(extraction_futures))
+
+
+async def asearch_extract_node(state: ResearchState) -> dict:
+    """Async ``search_extract_node``: searches and extractions are tasks on the job's event loop.
+
+    At most PIPELINE_EXTRACTION_WORKERS extraction calls of the job run at once.
+    """
+    new_queries = _new_queries(state)
+    if not new_queries:
+        logger.info("All queries already executed, skipping")
+        return {"search_history": [], "extracted_facts": [], "status": "analyzing"}
+
+    settings = get_settings()
+    router = get_model_router()
+    engine = get_search_engine()
+    stream = _SearchStream(state, settings)
+    slots = asyncio.Semaphore(max(1, settings.pipeline_extraction_workers))
+    extractions: list[asyncio.Task] = []
+
+    async def _search(query: str) -> tuple[str, list[dict]]:
+        try:
+            return query, await engine.asearch(query, max_results=5, include_raw_content=stream.full_pages)
+        except Exception as e:
+            logger.error("Search failed for query '%s': %s", query, e)
+            return query, []
+
+    async def _extract(chunk: list[dict]) -> tuple[list[dict], list[dict] | None]:
+        async with slots:
+            try:
+                return chunk, await aextract_facts(router, stream.target_name, chunk, stream.existing_summary)
+            except Exception as e:
+                logger.error("Pipelined extraction failed: %s", e)
+                return chunk, None
+
+    for next_done in asyncio.as_completed([_search(q) for q in new_queries]):
+        for chunk in stream.add(*await next_done):
+            extractions.append(asyncio.ensure_future(_extract(chunk)))
+
+    # Full-page passages can only be ranked once every page of this wave is indexed
+    for chunk in stream.gap_passages():
+        extractions.append(asyncio.ensure_future(_extract(chunk)))
+
+    for next_done in asyncio.as_completed(extractions):
+        stream.extracted(*await next_done)
+    return stream.update(len(extractions))
+
+
+def _new_queries(state: ResearchState) -> list[str]:
+    queries = state.get("research_plan", [])
+    executed_queries = {sh["query"] for sh in state.get("search_history", [])}
+    new_queries = [q for q in queries if q not in executed_queries]
+    logger.info("Search+extract node: streaming %d queries", len(new_queries))
+    return new_queries
+
+
+class _SearchStream:
+    """Turns each query's results, as they arrive, into extraction chunks, and tallies the wave."""
+
+    def __init__(self, state: ResearchState, settings):
+        self._state = state
+        self._settings = settings
+        self.target_name = state["target_name"]
+        self.existing_facts = state.get("extracted_facts", [])
+        self.existing_summary = summarize_existing_facts(self.existing_facts)
+        self.index = FactIndex(self.existing_facts, threshold=settings.fact_dedup_threshold)
+        self._passages = get_passage_index(state.get("job_id"))
+        self.full_pages = self._passages is not None
+        self._seen = seen_documents(state, settings)
+        self._relevance = relevance_query(state)
+        self.search_history: list[dict] = []
+        self.metrics: dict[str, float] = {}
+
+    def add(self, query: str, results: list[dict]) -> list[list[dict]]:
+        """Record one query's results; return the chunks of them still worth extracting."""
+        logger.info("Query '%s' returned %d results", query, len(results))
+        results, index_metrics = index_raw_content(self._passages, results)
+        entry = {"query": query, "results": results}
+        self.search_history.append(entry)
+        documents, metrics = filter_seen_documents([entry], self._seen)
+        metrics.update(index_metrics)
+        if self._settings.relevance_filter_enabled:
+            # Results stream in per query, so only the threshold applies here, not top-K
+            documents, relevance_metrics = filter_relevant_results(
+                documents, self._relevance, min_score=self._settings.relevance_min_score,
+            )
+            metrics.update(relevance_metrics)
+        for key, value in metrics.items():
+            self.metrics[key] = self.metrics.get(key, 0) + value
+        return chunk_searches(documents, self._settings.extraction_chunk_tokens) if documents else []
+
+    def extracted(self, chunk: list[dict], facts: list[dict] | None) -> None:
+        """Merge a chunk's facts and mark its documents seen; a failed chunk (None) is left unseen."""
+        if facts is None:
+            return
+        self._seen.commit(chunk)
+        dedupe_new_facts(facts, self.index)
+
+    def gap_passages(self) -> list[list[dict]]:
+        passages, passage_metrics = take_gap_passages(self._state, self._settings)
+        self.metrics.update(passage_metrics)
+        return chunk_searches(passages, self._settings.extraction_chunk_tokens)
+
+    def update(self, llm_calls: int) -> dict:
+        merged = self.index.merged
+        corroborated = credit_mirror_sources(
+            self.existing_facts + self.index.changes(), self._seen.mirrors, self.index,
+        )
+        logger.info(
+            "Extracted %d new facts from %d searches (%d pipelined LLM calls, %d merged into known facts, "
+            "%d corroborated by syndicated copies)",
+            self.index.added, len(self.search_history), llm_calls, merged, corroborated,
+        )
+        return {
+            "search_history": self.search_history,
+            "extracted_facts": self.index.changes(),
+            "seen_documents": self._seen.new,
+            "document_fingerprints": self._seen.new_fingerprints,
+            "run_metrics": {
+                "facts_merged": merged,
+                "facts_corroborated_by_syndication": corroborated,
+                **self.metrics,
+            },
+            "status": "analyzing",
+        }
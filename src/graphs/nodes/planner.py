@@ -6,10 +6,13 @@ import logging
 from langchain_core.messages import SystemMessage, HumanMessage
 
 from src.config.models import TaskType
-from src.models.router import ModelRouter
+from src.config.settings import get_settings
+from src.models.router import get_model_router
 from src.graphs.state import ResearchState
+from src.utils.passage_index import get_passage_index
+from src.utils.relevance import gap_query, relevance_query
 from src.utils.text import robust_json_loads, ensure_str
-from src.utils.llm_retry import resilient_invoke
+from src.utils.llm_retry import aresilient_invoke, resilient_invoke
 from src.utils.prompts.planner import (
     PLANNER_SYSTEM_PROMPT,
     PLANNER_USER_PROMPT,
@@ -18,12 +21,27 @@ from src.utils.prompts.planner import (
 
 logger = logging.getLogger(__name__)
 
+_EXCERPT_CHARS = 400
+
 
 def planner_node(state: ResearchState) -> dict:
     """Generate or refine search queries based on current research state."""
-    logger.info("Planner node: iteration %d", state.get("iteration", 0))
+    response = resilient_invoke(
+        get_model_router(), TaskType.PLANNING, _planner_messages(state), temperature=0.2, json_mode=True,
+    )
+    return _planner_update(response)
+
 
-    router = ModelRouter()
+async def aplanner_node(state: ResearchState) -> dict:
+    """Async ``planner_node``."""
+    response = await aresilient_invoke(
+        get_model_router(), TaskType.PLANNING, _planner_messages(state), temperature=0.2, json_mode=True,
+    )
+    return _planner_update(response)
+
+
+def _planner_messages(state: ResearchState) -> list:
+    logger.info("Planner node: iteration %d", state.get("iteration", 0))
 
     iteration = state.get("iteration", 0)
 
@@ -44,14 +62,17 @@ def planner_node(state: ResearchState) -> dict:
             search_history=json.dumps(history, indent=2),
             extracted_facts=facts_summary,
             discovered_entities=json.dumps(entities),
+            information_gaps=json.dumps(state.get("information_gaps") or []),
+            page_excerpts=_page_excerpts(state),
         )
 
-    messages = [
+    return [
         SystemMessage(content=PLANNER_SYSTEM_PROMPT),
         HumanMessage(content=user_prompt),
     ]
 
-    response = resilient_invoke(router, TaskType.PLANNING, messages, temperature=0.2, json_mode=True)
+
+def _planner_update(response) -> dict:
     queries = _parse_queries(response.content) if response else []
     logger.info("Planner generated %d queries", len(queries))
 
@@ -61,8 +82,23 @@ def planner_node(state: ResearchState) -> dict:
     }
 
 
+def _page_excerpts(state: ResearchState) -> str:
+    """Top passages of the job's fetched pages for the current gaps, trimmed for the prompt."""
+    index = get_passage_index(state.get("job_id"))
+    if index is None:
+        return "None."
+    settings = get_settings()
+    passages = index.search(
+        gap_query(state), settings.planner_passage_top_k,
+        gate=relevance_query(state), min_score=settings.relevance_min_score,
+    )
+    if not passages:
+        return "None."
+    return "\n".join(f"- ({p.url}) {p.text[:_EXCERPT_CHARS]}" for p in passages)
+
+
 def _parse_queries(content) -> list[str]:
-    parsed = robust_json_loads(content, context="planner._parse_queries")
+    parsed = robust_json_loads(content, context="planner._parse_queries", partial=True)
     if isinstance(parsed, list):
         return [str(q) for q in parsed if q]
     if isinstance(parsed, dict):
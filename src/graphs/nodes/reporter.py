@@ -7,10 +7,12 @@ from datetime import datetime, timezone
 from langchain_core.messages import SystemMessage, HumanMessage
 
 from src.config.models import TaskType
-from src.models.router import ModelRouter
+from src.models.router import get_model_router
 from src.graphs.state import ResearchState
+from src.services.scoring_service import apply_corroboration
+from src.utils.fact_index import source_urls
 from src.utils.text import ensure_str
-from src.utils.llm_retry import resilient_invoke
+from src.utils.llm_retry import aresilient_invoke, resilient_invoke
 
 logger = logging.getLogger(__name__)
 
@@ -113,9 +115,21 @@ Do NOT add a title, date, or any content outside the template."""
 
 def reporter_node(state: ResearchState) -> dict:
     """Generate the final comprehensive research report."""
-    logger.info("Reporter node: generating final report")
+    facts, now, messages = _report_request(state)
+    response = resilient_invoke(get_model_router(), TaskType.REPORTING, messages, temperature=0.3)
+    return _report_update(state, facts, now, response)
+
+
+async def areporter_node(state: ResearchState) -> dict:
+    """Async ``reporter_node``."""
+    facts, now, messages = _report_request(state)
+    response = await aresilient_invoke(get_model_router(), TaskType.REPORTING, messages, temperature=0.3)
+    return _report_update(state, facts, now, response)
 
-    router = ModelRouter()
+
+def _report_request(state: ResearchState) -> tuple[list[dict], datetime, list]:
+    """The scored facts, the report timestamp and the prompt for the report body."""
+    logger.info("Reporter node: generating final report")
 
     facts = _apply_scores(
         state.get("extracted_facts", []),
@@ -124,11 +138,7 @@ def reporter_node(state: ResearchState) -> dict:
     risks = state.get("risk_flags", [])
     connections = state.get("connections", [])
     search_history = state.get("search_history", [])
-
-    confidences = [f.get("confidence", 0.5) for f in facts]
-    avg_conf = sum(confidences) / len(confidences) if confidences else 0.0
-    high_conf = sum(1 for c in confidences if c >= 0.7)
-    low_conf = sum(1 for c in confidences if c < 0.5)
+    avg_conf, high_conf, low_conf = _confidence_overview(facts)
     now = datetime.now(timezone.utc)
 
     user_prompt = REPORTER_USER_PROMPT.format(
@@ -153,8 +163,15 @@ def reporter_node(state: ResearchState) -> dict:
         SystemMessage(content=REPORTER_SYSTEM_PROMPT),
         HumanMessage(content=user_prompt),
     ]
+    return facts, now, messages
+
+
+def _report_update(state: ResearchState, facts: list[dict], now: datetime, response) -> dict:
+    risks = state.get("risk_flags", [])
+    connections = state.get("connections", [])
+    search_history = state.get("search_history", [])
+    avg_conf, high_conf, low_conf = _confidence_overview(facts)
 
-    response = resilient_invoke(router, TaskType.REPORTING, messages, temperature=0.3)
     if response:
         body = ensure_str(response.content)
     else:
@@ -184,13 +201,25 @@ def reporter_node(state: ResearchState) -> dict:
     }
 
 
+def _confidence_overview(facts: list[dict]) -> tuple[float, int, int]:
+    """Average confidence and the number of facts at or above 0.7 and below 0.5."""
+    confidences = [f.get("confidence", 0.5) for f in facts]
+    avg_conf = sum(confidences) / len(confidences) if confidences else 0.0
+    high_conf = sum(1 for c in confidences if c >= 0.7)
+    low_conf = sum(1 for c in confidences if c < 0.5)
+    return avg_conf, high_conf, low_conf
+
+
 def _apply_scores(facts: list[dict], scores: dict[str, float]) -> list[dict]:
-    """Return a copy of facts with confidence_scores applied."""
+    """Return a copy of facts with confidence_scores and corroboration applied."""
     updated = []
     for f in facts:
-        claim = f.get("claim", "")
-        if claim in scores:
-            updated.append({**f, "confidence": scores[claim]})
+        confidence = scores.get(f.get("claim", ""), f.get("confidence", 0.5))
+        confidence = apply_corroboration(
+            confidence, source_urls(f), f.get("corroboration_count", 1),
+        )
+        if confidence != f.get("confidence"):
+            updated.append({**f, "confidence": confidence})
         else:
             updated.append(f)
     return updated
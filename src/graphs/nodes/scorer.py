@@ -8,34 +8,55 @@ import logging
 from langchain_core.messages import SystemMessage, HumanMessage
 
 from src.config.models import TaskType
-from src.models.router import ModelRouter
+from src.models.router import get_model_router
 from src.graphs.state import ResearchState
-from src.utils.text import robust_json_loads
-from src.utils.llm_retry import resilient_invoke
+from src.utils.text import robust_json_loads, claim_id, estimate_tokens
+from src.utils.llm_retry import aresilient_invoke, resilient_invoke
 from src.utils.prompts.validation import VALIDATION_SYSTEM_PROMPT, VALIDATION_USER_PROMPT
 
 logger = logging.getLogger(__name__)
 
 
 def scorer_node(state: ResearchState) -> dict:
-    """Score NEW facts with confidence values via LLM."""
+    """Score facts that have not been scored yet, so each fact is sent to the LLM exactly once."""
+    new_facts, messages, metrics = _scoring_request(state)
+    if not new_facts:
+        return {"confidence_scores": {}, "run_metrics": metrics}
+    response = resilient_invoke(get_model_router(), TaskType.VALIDATION, messages, temperature=0.0, json_mode=True)
+    return _scoring_update(new_facts, response, metrics)
+
+
+async def ascorer_node(state: ResearchState) -> dict:
+    """Async ``scorer_node``."""
+    new_facts, messages, metrics = _scoring_request(state)
+    if not new_facts:
+        return {"confidence_scores": {}, "run_metrics": metrics}
+    response = await aresilient_invoke(
+        get_model_router(), TaskType.VALIDATION, messages, temperature=0.0, json_mode=True,
+    )
+    return _scoring_update(new_facts, response, metrics)
+
+
+def _scoring_request(state: ResearchState) -> tuple[list[dict], list, dict]:
+    """The facts still to score, the scoring prompt for them (empty if none) and run_metrics."""
     all_facts = state.get("extracted_facts", [])
-    new_facts = [f for f in all_facts if f.get("confidence", 0.5) == 0.5]
+    scored_ids = set(state.get("scored_fact_ids", []))
+    new_facts = [f for f in all_facts if _fact_key(f) not in scored_ids]
+    skipped = [f for f in all_facts if _fact_key(f) in scored_ids]
     logger.info("Scorer node: %d new facts to score (of %d total)", len(new_facts), len(all_facts))
 
+    tokens_avoided = estimate_tokens(json.dumps(_fact_rows(skipped), indent=2)) if skipped else 0
+    metrics = {"scorer_facts_skipped": len(skipped), "scorer_tokens_avoided": tokens_avoided}
+    if skipped:
+        logger.info(
+            "Scorer skipped %d already-scored facts (~%d prompt tokens avoided)",
+            len(skipped), tokens_avoided,
+        )
+
     if not new_facts:
-        return {"confidence_scores": {}}
+        return [], [], metrics
 
-    router = ModelRouter()
-
-    facts_json = json.dumps(
-        [
-            {"index": i, "claim": f["claim"], "source_url": f.get("source_url", ""),
-             "source_title": f.get("source_title", ""), "category": f.get("category", "")}
-            for i, f in enumerate(new_facts)
-        ],
-        indent=2,
-    )
+    facts_json = json.dumps(_fact_rows(new_facts), indent=2)
 
     history_summary = json.dumps(
         [{"query": sh["query"], "result_count": len(sh.get("results", []))}
@@ -53,12 +74,16 @@ def scorer_node(state: ResearchState) -> dict:
         SystemMessage(content=VALIDATION_SYSTEM_PROMPT),
         HumanMessage(content=user_prompt),
     ]
+    return new_facts, messages, metrics
 
-    response = resilient_invoke(router, TaskType.VALIDATION, messages, temperature=0.0, json_mode=True)
+
+def _scoring_update(new_facts: list[dict], response, metrics: dict) -> dict:
+    metrics["scorer_llm_calls"] = 1
     if not response:
-        return {"confidence_scores": {}}
+        # Leave the facts unscored so the next iteration retries them
+        return {"confidence_scores": {}, "run_metrics": metrics}
 
-    parsed = robust_json_loads(response.content, context="scorer._score_facts")
+    parsed = robust_json_loads(response.content, context="scorer._score_facts", partial=True)
     if isinstance(parsed, list):
         scores = parsed
     elif isinstance(parsed, dict):
@@ -66,12 +91,34 @@ def scorer_node(state: ResearchState) -> dict:
     else:
         scores = []
     result = {}
+    scored_ids = []
     for score_entry in scores:
         if not isinstance(score_entry, dict):
             continue
         idx = score_entry.get("fact_index", -1)
-        if 0 <= idx < len(new_facts):
+        if isinstance(idx, int) and 0 <= idx < len(new_facts):
             result[new_facts[idx]["claim"]] = score_entry.get("confidence", 0.5)
+            scored_ids.append(_fact_key(new_facts[idx]))
 
+    if len(result) < len(new_facts):
+        # Facts the response skipped or that failed to parse stay unscored for the next iteration
+        logger.warning("Scorer returned scores for %d of %d facts", len(result), len(new_facts))
     logger.info("Scored %d facts", len(result))
-    return {"confidence_scores": result}
+    return {
+        "confidence_scores": result,
+        "scored_fact_ids": list(dict.fromkeys(scored_ids)),
+        "run_metrics": metrics,
+    }
+
+
+def _fact_key(fact: dict) -> str:
+    return fact.get("fact_id") or claim_id(fact.get("claim", ""))
+
+
+def _fact_rows(facts: list[dict]) -> list[dict]:
+    return [
+        {"index": i, "claim": f["claim"], "source_url": f.get("source_url", ""),
+         "source_title": f.get("source_title", ""), "category": f.get("category", ""),
+         "corroborating_sources": f.get("corroboration_count", 1)}
+        for i, f in enumerate(facts)
+    ]
@@ -1,44 +1,93 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import as_completed
 
 from src.graphs.state import ResearchState
-from src.tools.search import TavilySearchTool
+from src.tools.search_engine import get_search_engine
+from src.utils.passage_index import PassageIndex, get_passage_index, index_raw_content
 
 logger = logging.getLogger(__name__)
 
 
 def searcher_node(state: ResearchState) -> dict:
-    """Execute all planned search queries via Tavily concurrently."""
-    queries = state.get("research_plan", [])
-    logger.info("Searcher node: executing %d queries", len(queries))
+    """Execute all planned search queries concurrently on the shared search engine.
 
-    tool = TavilySearchTool()
-    executed_queries = {sh["query"] for sh in state.get("search_history", [])}
-    new_queries = [q for q in queries if q not in executed_queries]
+    With the passage index enabled, full page text is requested too; it goes
+    into the job's passage index and is stripped from the results kept in state.
+    """
+    new_queries = _new_queries(state)
+    if not new_queries:
+        logger.info("All queries already executed, skipping")
+        return {"search_history": [], "status": "extracting"}
+
+    engine = get_search_engine()
+    passages = get_passage_index(state.get("job_id"))
+    futures = {
+        engine.submit(q, max_results=5, include_raw_content=passages is not None): q for q in new_queries
+    }
+
+    collected = _Collector(passages)
+    for future in as_completed(futures):
+        query = futures[future]
+        try:
+            results = future.result()
+        except Exception as e:
+            logger.error("Search failed for query '%s': %s", query, e)
+            results = []
+        collected.add(query, results)
+    return collected.update()
 
+
+async def asearcher_node(state: ResearchState) -> dict:
+    """Async ``searcher_node``: awaits the searches instead of blocking a thread on them."""
+    new_queries = _new_queries(state)
     if not new_queries:
         logger.info("All queries already executed, skipping")
         return {"search_history": [], "status": "extracting"}
 
-    new_results = []
+    engine = get_search_engine()
+    passages = get_passage_index(state.get("job_id"))
 
-    def _run_search(query: str) -> dict:
+    async def _search(query: str) -> tuple[str, list[dict]]:
         try:
-            results = tool.search(query=query, max_results=5)
-            logger.info("Query '%s' returned %d results", query, len(results))
-            return {"query": query, "results": results}
+            return query, await engine.asearch(query, max_results=5, include_raw_content=passages is not None)
         except Exception as e:
             logger.error("Search failed for query '%s': %s", query, e)
-            return {"query": query, "results": []}
+            return query, []
 
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        futures = {executor.submit(_run_search, q): q for q in new_queries}
-        for future in as_completed(futures):
-            new_results.append(future.result())
+    collected = _Collector(passages)
+    for next_done in asyncio.as_completed([_search(q) for q in new_queries]):
+        collected.add(*await next_done)
+    return collected.update()
 
-    return {
-        "search_history": new_results,
-        "status": "extracting",
-    }
+
+def _new_queries(state: ResearchState) -> list[str]:
+    queries = state.get("research_plan", [])
+    logger.info("Searcher node: executing %d queries", len(queries))
+    executed_queries = {sh["query"] for sh in state.get("search_history", [])}
+    return [q for q in queries if q not in executed_queries]
+
+
+class _Collector:
+    """Gathers search results in completion order, indexing and stripping their full page text."""
+
+    def __init__(self, passages: PassageIndex | None):
+        self._passages = passages
+        self._results: list[dict] = []
+        self._metrics: dict[str, float] = {}
+
+    def add(self, query: str, results: list[dict]) -> None:
+        logger.info("Query '%s' returned %d results", query, len(results))
+        results, index_metrics = index_raw_content(self._passages, results)
+        for key, value in index_metrics.items():
+            self._metrics[key] = self._metrics.get(key, 0) + value
+        self._results.append({"query": query, "results": results})
+
+    def update(self) -> dict:
+        return {
+            "search_history": self._results,
+            "run_metrics": self._metrics,
+            "status": "extracting",
+        }
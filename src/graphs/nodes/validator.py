@@ -11,22 +11,27 @@ import logging
 
 from src.config.models import TaskType
 from src.config.settings import get_settings
-from src.models.router import ModelRouter
+from src.models.router import get_model_router
 from src.graphs.state import ResearchState
+from src.services.scoring_service import apply_corroboration
+from src.utils.fact_index import source_urls
 from src.utils.text import robust_json_loads
-from src.utils.llm_retry import resilient_invoke
+from src.utils.llm_retry import aresilient_invoke, resilient_invoke
 from src.utils.prompts.validation import SUFFICIENCY_CHECK_PROMPT
 
 logger = logging.getLogger(__name__)
 
 
 def _apply_scores(facts: list[dict], scores: dict[str, float]) -> list[dict]:
-    """Return a copy of facts with confidence_scores applied."""
+    """Return a copy of facts with confidence_scores and corroboration applied."""
     updated = []
     for f in facts:
-        claim = f.get("claim", "")
-        if claim in scores:
-            updated.append({**f, "confidence": scores[claim]})
+        confidence = scores.get(f.get("claim", ""), f.get("confidence", 0.5))
+        confidence = apply_corroboration(
+            confidence, source_urls(f), f.get("corroboration_count", 1),
+        )
+        if confidence != f.get("confidence"):
+            updated.append({**f, "confidence": confidence})
         else:
             updated.append(f)
     return updated
@@ -34,14 +39,23 @@ def _apply_scores(facts: list[dict], scores: dict[str, float]) -> list[dict]:
 
 def validator_node(state: ResearchState) -> dict:
     """Apply scored confidence and decide whether to continue or report."""
-    all_facts = state.get("extracted_facts", [])
-    scores = state.get("confidence_scores", {})
-    logger.info("Sufficiency check: %d facts, %d scores available", len(all_facts), len(scores))
+    settings = get_settings()
+    prompt = _sufficiency_prompt(state, settings)
+    response = resilient_invoke(get_model_router(), TaskType.VALIDATION, prompt, temperature=0.0, json_mode=True)
+    return _next_step(state, _should_continue(state, response), settings)
+
 
-    router = ModelRouter()
+async def avalidator_node(state: ResearchState) -> dict:
+    """Async ``validator_node``."""
     settings = get_settings()
-    should_continue = _check_sufficiency(router, state, settings)
+    prompt = _sufficiency_prompt(state, settings)
+    response = await aresilient_invoke(
+        get_model_router(), TaskType.VALIDATION, prompt, temperature=0.0, json_mode=True,
+    )
+    return _next_step(state, _should_continue(state, response), settings)
+
 
+def _next_step(state: ResearchState, should_continue: bool, settings) -> dict:
     new_iteration = state.get("iteration", 0) + 1
     if should_continue and new_iteration < settings.max_research_iterations:
         next_status = "planning"
@@ -59,9 +73,10 @@ def validator_node(state: ResearchState) -> dict:
     }
 
 
-def _check_sufficiency(router: ModelRouter, state: ResearchState, settings) -> bool:
+def _sufficiency_prompt(state: ResearchState, settings) -> str:
     raw_facts = state.get("extracted_facts", [])
     scores = state.get("confidence_scores", {})
+    logger.info("Sufficiency check: %d facts, %d scores available", len(raw_facts), len(scores))
     facts = _apply_scores(raw_facts, scores)
     risks = state.get("risk_flags", [])
 
@@ -73,7 +88,7 @@ def _check_sufficiency(router: ModelRouter, state: ResearchState, settings) -> b
     confidences = [f.get("confidence", 0.5) for f in facts]
     avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
 
-    prompt = SUFFICIENCY_CHECK_PROMPT.format(
+    return SUFFICIENCY_CHECK_PROMPT.format(
         target_name=state["target_name"],
         iteration=state.get("iteration", 0),
         max_iterations=settings.max_research_iterations,
@@ -85,9 +100,10 @@ def _check_sufficiency(router: ModelRouter, state: ResearchState, settings) -> b
         confidence_threshold=settings.confidence_threshold,
     )
 
-    response = resilient_invoke(router, TaskType.VALIDATION, prompt, temperature=0.0, json_mode=True)
+
+def _should_continue(state: ResearchState, response) -> bool:
     if response:
-        result = robust_json_loads(response.content, context="validator._check_sufficiency")
+        result = robust_json_loads(response.content, context="validator._should_continue")
         if isinstance(result, dict):
             return result.get("continue", False)
     return state.get("iteration", 0) < 2
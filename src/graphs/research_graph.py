@@ -1,17 +1,28 @@
+from typing import Awaitable, Callable
+
+from langchain_core.runnables import RunnableLambda
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import StateGraph, END
 
+from src.config.settings import get_settings
 from src.graphs.state import ResearchState
-from src.graphs.nodes.planner import planner_node
-from src.graphs.nodes.searcher import searcher_node
-from src.graphs.nodes.extractor import extractor_node
-from src.graphs.nodes.analyzer import analyzer_node
-from src.graphs.nodes.scorer import scorer_node
-from src.graphs.nodes.validator import validator_node
-from src.graphs.nodes.reporter import reporter_node
+from src.graphs.nodes.planner import aplanner_node, planner_node
+from src.graphs.nodes.searcher import asearcher_node, searcher_node
+from src.graphs.nodes.extractor import aextractor_node, extractor_node
+from src.graphs.nodes.pipeline import asearch_extract_node, search_extract_node
+from src.graphs.nodes.analyzer import aanalyzer_node, analyzer_node
+from src.graphs.nodes.scorer import ascorer_node, scorer_node
+from src.graphs.nodes.validator import avalidator_node, validator_node
+from src.graphs.nodes.reporter import areporter_node, reporter_node
 from src.graphs.edges.routing import route_after_validation
 
 
-def build_research_graph() -> StateGraph:
+def _node(func: Callable[[ResearchState], dict], afunc: Callable[[ResearchState], Awaitable[dict]]):
+    """A graph node running ``func`` under ``invoke`` and ``afunc`` under ``ainvoke``."""
+    return RunnableLambda(func, afunc=afunc, name=func.__name__)
+
+
+def build_research_graph(checkpointer: BaseCheckpointSaver | None = None) -> StateGraph:
     """Construct and compile the research agent state graph.
 
     Flow:
@@ -19,25 +30,42 @@ def build_research_graph() -> StateGraph:
             -> validator (fan-in, sufficiency check)
             -> (conditional) -> planner  (loop for more research)
             -> (conditional) -> reporter -> END
+
+    With PIPELINED_EXTRACTION enabled, searcher and extractor are fused into a
+    single streaming node that feeds the analyzer and scorer directly.
+
+    Every node has a blocking and an async implementation: ``invoke`` runs
+    the blocking ones on threads, ``ainvoke`` awaits the async ones, so one
+    event loop can drive many jobs at once.
+
+    With a ``checkpointer``, state is saved after every step under the
+    ``thread_id`` in the run config, and ``invoke(None, config)`` continues an
+    unfinished run from its last completed node.
     """
+    pipelined = get_settings().pipelined_extraction
     graph = StateGraph(ResearchState)
 
-    graph.add_node("planner", planner_node)
-    graph.add_node("searcher", searcher_node)
-    graph.add_node("extractor", extractor_node)
-    graph.add_node("analyzer", analyzer_node)
-    graph.add_node("scorer", scorer_node)
-    graph.add_node("validator", validator_node)
-    graph.add_node("reporter", reporter_node)
+    graph.add_node("planner", _node(planner_node, aplanner_node))
+    if pipelined:
+        graph.add_node("searcher", _node(search_extract_node, asearch_extract_node))
+    else:
+        graph.add_node("searcher", _node(searcher_node, asearcher_node))
+        graph.add_node("extractor", _node(extractor_node, aextractor_node))
+    graph.add_node("analyzer", _node(analyzer_node, aanalyzer_node))
+    graph.add_node("scorer", _node(scorer_node, ascorer_node))
+    graph.add_node("validator", _node(validator_node, avalidator_node))
+    graph.add_node("reporter", _node(reporter_node, areporter_node))
 
     graph.set_entry_point("planner")
 
     graph.add_edge("planner", "searcher")
-    graph.add_edge("searcher", "extractor")
+    if not pipelined:
+        graph.add_edge("searcher", "extractor")
 
-    # Fan-out: extractor feeds both analyzer and scorer in parallel
-    graph.add_edge("extractor", "analyzer")
-    graph.add_edge("extractor", "scorer")
+    # Fan-out: extraction feeds both analyzer and scorer in parallel
+    extraction_node = "searcher" if pipelined else "extractor"
+    graph.add_edge(extraction_node, "analyzer")
+    graph.add_edge(extraction_node, "scorer")
 
     # Fan-in: validator waits for both analyzer and scorer to complete
     graph.add_edge("analyzer", "validator")
@@ -54,4 +82,4 @@ def build_research_graph() -> StateGraph:
 
     graph.add_edge("reporter", END)
 
-    return graph.compile()
+    return graph.compile(checkpointer=checkpointer)
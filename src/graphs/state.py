@@ -14,12 +14,36 @@ def _merge_dicts(left: dict, right: dict) -> dict:
     return {**left, **right}
 
 
+def _merge_facts(left: list, right: list) -> list:
+    """Reducer that appends new facts and updates merged ones in place by fact_id."""
+    positions = {f.get("fact_id"): i for i, f in enumerate(left) if f.get("fact_id")}
+    merged = list(left)
+    for fact in right:
+        i = positions.get(fact.get("fact_id"))
+        if i is None:
+            if fact.get("fact_id"):
+                positions[fact["fact_id"]] = len(merged)
+            merged.append(fact)
+        else:
+            merged[i] = fact
+    return merged
+
+
+def _sum_dicts(left: dict, right: dict) -> dict:
+    """Reducer that adds numeric counters key by key."""
+    merged = dict(left)
+    for key, value in right.items():
+        merged[key] = merged.get(key, 0) + value
+    return merged
+
+
 class SearchResult(TypedDict):
     query: str
     results: list[dict]
 
 
 class ExtractedFact(TypedDict):
+    fact_id: str
     category: str
     claim: str
     source_url: str
@@ -27,6 +51,9 @@ class ExtractedFact(TypedDict):
     date_mentioned: str | None
     entities: list[str]
     confidence: float
+    # Every source that stated this claim (or a near-duplicate of it)
+    source_urls: list[str]
+    corroboration_count: int
 
 
 class RiskFlag(TypedDict):
@@ -46,15 +73,30 @@ class Connection(TypedDict):
 
 
 class ResearchState(TypedDict):
+    job_id: str
     target_name: str
     target_context: str
 
     research_plan: list[str]
     search_history: Annotated[list[SearchResult], _merge_lists]
-    extracted_facts: Annotated[list[ExtractedFact], _merge_lists]
+    extracted_facts: Annotated[list[ExtractedFact], _merge_facts]
     connections: Annotated[list[Connection], _merge_lists]
     risk_flags: Annotated[list[RiskFlag], _merge_lists]
     confidence_scores: Annotated[dict[str, float], _merge_dicts]
+    scored_fact_ids: Annotated[list[str], _merge_lists]
+    # Digests of search results already sent to the extractor -> canonical URL
+    seen_documents: Annotated[dict[str, str], _merge_dicts]
+    # SimHash of each extracted page, keyed by canonical URL, to spot syndicated copies
+    document_fingerprints: Annotated[dict[str, int], _merge_dicts]
+
+    # Incremental analysis: rolling digest of everything analyzed so far
+    analysis_digest: str
+    analyzed_fact_count: int
+    # Areas the latest analysis found missing; steer passage retrieval and planning
+    information_gaps: list[str]
+
+    # Per-job counters (tokens saved, calls avoided, ...) summed across nodes
+    run_metrics: Annotated[dict[str, float], _sum_dicts]
 
     iteration: int
     status: str
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+
+import httpx
 from langchain_core.language_models import BaseChatModel
 
 
@@ -12,3 +14,17 @@ class BaseModelProvider(ABC):
     @abstractmethod
     def get_model_name(self) -> str:
         ...
+
+
+def build_http_clients(
+    max_connections: int, timeout: float = 60.0,
+) -> tuple[httpx.Client, httpx.AsyncClient]:
+    """Keep-alive connection pools shared by every chat model of one provider."""
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+    )
+    return (
+        httpx.Client(limits=limits, timeout=timeout),
+        httpx.AsyncClient(limits=limits, timeout=timeout),
+    )
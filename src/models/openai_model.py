@@ -1,16 +1,19 @@
 from langchain_openai import ChatOpenAI
 from langchain_core.language_models import BaseChatModel
 
-from src.models.base import BaseModelProvider
+from src.models.base import BaseModelProvider, build_http_clients
 from src.config.settings import get_settings
 
 
 class OpenAIProvider(BaseModelProvider):
     """Routes through OpenRouter using the OpenAI-compatible API."""
 
-    def __init__(self, model_override: str | None = None):
+    def __init__(self, model_override: str | None = None, max_connections: int | None = None):
         self._settings = get_settings()
         self._model_name = model_override or self._settings.openai_model
+        self._http_client, self._http_async_client = build_http_clients(
+            max_connections or self._settings.openai_max_connections,
+        )
 
     def get_chat_model(
         self, temperature: float = 0.0, json_mode: bool = False,
@@ -25,6 +28,8 @@ class OpenAIProvider(BaseModelProvider):
             base_url=self._settings.openrouter_base_url,
             model_kwargs=kwargs,
             request_timeout=60,
+            http_client=self._http_client,
+            http_async_client=self._http_async_client,
         )
 
     def get_model_name(self) -> str:
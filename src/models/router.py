@@ -1,3 +1,5 @@
+import threading
+
 from langchain_core.language_models import BaseChatModel
 
 from src.config.models import ModelProvider, TaskType, TASK_MODEL_MAP, FALLBACK_MODEL_MAP
@@ -7,7 +9,11 @@ from src.models.base import BaseModelProvider
 
 
 class ModelRouter:
-    """Routes task types to the appropriate AI model provider."""
+    """Routes task types to the appropriate AI model provider.
+
+    Use ``get_model_router()`` to share one router -- and its chat models and
+    HTTP connection pools -- across every node and job in the process.
+    """
 
     def __init__(self):
         self._providers: dict[ModelProvider, BaseModelProvider] = {
@@ -15,6 +21,7 @@ class ModelRouter:
             ModelProvider.GEMINI: GeminiProvider(),
         }
         self._cache: dict[tuple, BaseChatModel] = {}
+        self._lock = threading.Lock()
 
     def get_model(
         self,
@@ -40,12 +47,30 @@ class ModelRouter:
         self, provider: ModelProvider, temperature: float, json_mode: bool,
     ) -> BaseChatModel:
         key = (provider, temperature, json_mode)
-        if key not in self._cache:
-            self._cache[key] = self._providers[provider].get_chat_model(
-                temperature=temperature, json_mode=json_mode,
-            )
-        return self._cache[key]
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = self._providers[provider].get_chat_model(
+                    temperature=temperature, json_mode=json_mode,
+                )
+            return self._cache[key]
 
     def get_provider(self, task: TaskType) -> BaseModelProvider:
         provider_key = TASK_MODEL_MAP[task]
         return self._providers[provider_key]
+
+    def get_fallback_provider(self, task: TaskType) -> BaseModelProvider:
+        fallback = FALLBACK_MODEL_MAP[TASK_MODEL_MAP[task]]
+        return self._providers[fallback]
+
+
+_router: ModelRouter | None = None
+_router_lock = threading.Lock()
+
+
+def get_model_router() -> ModelRouter:
+    """Return the process-wide ModelRouter, creating it on first use."""
+    global _router
+    with _router_lock:
+        if _router is None:
+            _router = ModelRouter()
+    return _router
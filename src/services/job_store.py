@@ -0,0 +1,237 @@
+"""Where research jobs and their results live, so any worker process can serve them."""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from src.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class ResearchJob:
+    def __init__(self, job_id: str, target_name: str, target_context: str):
+        self.job_id = job_id
+        self.target_name = target_name
+        self.target_context = target_context
+        self.status = "pending"
+        self.created_at = datetime.now(timezone.utc)
+        self.completed_at: datetime | None = None
+        self.result: dict[str, Any] | None = None
+        self.error: str | None = None
+
+
+class JobStore(ABC):
+    """Job metadata and results, keyed by job ID.
+
+    ``ResearchService`` saves a job on every status change and reads it back
+    for status and result requests; the job objects it hands out are copies,
+    so a store may live in another process (or host) entirely.
+    """
+
+    @abstractmethod
+    def save(self, job: ResearchJob) -> None:
+        """Insert or update the job; its result is written only when set."""
+
+    @abstractmethod
+    def get(self, job_id: str, *, with_result: bool = True) -> ResearchJob | None:
+        """The job, or None if unknown; ``with_result=False`` skips loading the result."""
+
+    @abstractmethod
+    def job_ids(self, status: str) -> list[str]:
+        """IDs of the jobs currently in ``status``."""
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """Job counts per status, plus backend-specific storage figures."""
+
+
+class MemoryJobStore(JobStore):
+    """Jobs held in process memory, for tests and single-process runs; nothing is ever dropped."""
+
+    def __init__(self):
+        self._jobs: dict[str, ResearchJob] = {}
+        self._lock = threading.Lock()
+
+    def save(self, job: ResearchJob) -> None:
+        with self._lock:
+            stored = self._jobs.get(job.job_id)
+            result = job.result if job.result is not None else stored.result if stored else None
+            self._jobs[job.job_id] = _copy(job, result)
+
+    def get(self, job_id: str, *, with_result: bool = True) -> ResearchJob | None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        return _copy(job, job.result if with_result else None) if job else None
+
+    def job_ids(self, status: str) -> list[str]:
+        with self._lock:
+            return [job.job_id for job in self._jobs.values() if job.status == status]
+
+    def stats(self) -> dict:
+        with self._lock:
+            statuses = [job.status for job in self._jobs.values()]
+        return {"jobs": len(statuses), "by_status": dict(Counter(statuses))}
+
+
+class SQLiteJobStore(JobStore):
+    """Jobs in a SQLite file shared by every process on the host.
+
+    Results are stored as zlib-compressed JSON and only loaded when asked for;
+    the ``cache_size`` most recently read or written results are also kept
+    decoded in memory. A completed job's result never changes, so the cache
+    needs no invalidation across processes.
+    """
+
+    def __init__(self, path: str | Path, cache_size: int = 64):
+        self._path = Path(path)
+        self._cache_size = cache_size
+        self._results: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self._path), check_same_thread=False, timeout=30.0, isolation_level=None,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " job_id TEXT PRIMARY KEY,"
+            " target_name TEXT NOT NULL,"
+            " target_context TEXT NOT NULL,"
+            " status TEXT NOT NULL,"
+            " created_at TEXT NOT NULL,"
+            " completed_at TEXT,"
+            " error TEXT,"
+            " result BLOB,"
+            " result_bytes INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status)")
+
+    def save(self, job: ResearchJob) -> None:
+        blob = None
+        if job.result is not None:
+            blob = zlib.compress(json.dumps(job.result, default=str).encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, target_name, target_context, status, created_at,"
+                " completed_at, error, result, result_bytes) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(job_id) DO UPDATE SET"
+                " status = excluded.status, completed_at = excluded.completed_at, error = excluded.error,"
+                " result = COALESCE(excluded.result, jobs.result),"
+                " result_bytes = CASE WHEN excluded.result IS NULL THEN jobs.result_bytes"
+                " ELSE excluded.result_bytes END",
+                (
+                    job.job_id, job.target_name, job.target_context, job.status,
+                    job.created_at.isoformat(), _isoformat(job.completed_at), job.error,
+                    blob, len(blob) if blob is not None else 0,
+                ),
+            )
+            if job.result is not None:
+                self._remember(job.job_id, job.result)
+
+    def get(self, job_id: str, *, with_result: bool = True) -> ResearchJob | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT target_name, target_context, status, created_at, completed_at, error,"
+                " result_bytes > 0 FROM jobs WHERE job_id = ?",
+                (job_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            target_name, target_context, status, created_at, completed_at, error, has_result = row
+            job = ResearchJob(job_id, target_name, target_context)
+            job.status = status
+            job.created_at = datetime.fromisoformat(created_at)
+            job.completed_at = datetime.fromisoformat(completed_at) if completed_at else None
+            job.error = error
+            if with_result and has_result:
+                job.result = self._result(job_id)
+        return job
+
+    def job_ids(self, status: str) -> list[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT job_id FROM jobs WHERE status = ?", (status,)).fetchall()
+        return [row[0] for row in rows]
+
+    def stats(self) -> dict:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*), COALESCE(SUM(result_bytes), 0) FROM jobs GROUP BY status"
+            ).fetchall()
+            lookups = self._hits + self._misses
+            return {
+                "jobs": sum(count for _, count, _ in rows),
+                "by_status": {status: count for status, count, _ in rows},
+                "result_bytes": sum(size for _, _, size in rows),
+                "cached_results": len(self._results),
+                "cache_hits": self._hits,
+                "cache_misses": self._misses,
+                "cache_hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            }
+
+    def _result(self, job_id: str) -> dict:
+        result = self._results.get(job_id)
+        if result is not None:
+            self._hits += 1
+            self._results.move_to_end(job_id)
+            return result
+        self._misses += 1
+        (blob,) = self._conn.execute("SELECT result FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        result = json.loads(zlib.decompress(blob))
+        self._remember(job_id, result)
+        return result
+
+    def _remember(self, job_id: str, result: dict) -> None:
+        self._results[job_id] = result
+        self._results.move_to_end(job_id)
+        while len(self._results) > self._cache_size:
+            self._results.popitem(last=False)
+
+
+def _copy(job: ResearchJob, result: dict | None) -> ResearchJob:
+    copy = ResearchJob(job.job_id, job.target_name, job.target_context)
+    copy.status = job.status
+    copy.created_at = job.created_at
+    copy.completed_at = job.completed_at
+    copy.error = job.error
+    copy.result = result
+    return copy
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
+
+
+_store: JobStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_job_store() -> JobStore:
+    """The store chosen by JOB_STORE_BACKEND (``sqlite`` is shared by every worker on the host)."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            settings = get_settings()
+            if settings.job_store_backend == "sqlite":
+                _store = SQLiteJobStore(settings.job_store_path, cache_size=settings.job_result_cache_size)
+            else:
+                _store = MemoryJobStore()
+    return _store
+
+
+def job_store_stats() -> dict:
+    with _store_lock:
+        store = _store
+    return store.stats() if store is not None else {}
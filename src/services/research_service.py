@@ -1,57 +1,94 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from src.config.settings import get_settings
+from src.graphs.checkpoint import (
+    checkpoint_config,
+    claim_job,
+    get_checkpointer,
+    job_states,
+    live_claims,
+    release_job,
+    start_heartbeat,
+)
 from src.graphs.research_graph import build_research_graph
 from src.graphs.state import ResearchState
 from src.db.queries.identity_graph import IdentityGraphQueries
+from src.services.job_store import ResearchJob, get_job_store
 from src.services.scoring_service import aggregate_confidence_stats
+from src.utils.passage_index import drop_passage_index
 
 logger = logging.getLogger(__name__)
 
 
-class ResearchJob:
-    def __init__(self, job_id: str, target_name: str, target_context: str):
-        self.job_id = job_id
-        self.target_name = target_name
-        self.target_context = target_context
-        self.status = "pending"
-        self.created_at = datetime.now(timezone.utc)
-        self.completed_at: datetime | None = None
-        self.result: dict[str, Any] | None = None
-        self.error: str | None = None
+# Jobs executing in this process, or reserved for it with ``mark_running``. The job
+# store's status alone cannot tell a live run from one a crashed process left marked "running"
+_running_jobs: set[str] = set()
+_running_jobs_lock = threading.Lock()
 
 
-_jobs: dict[str, ResearchJob] = {}
+class ResearchService:
+    """Orchestrates LangGraph research runs and manages their lifecycle.
 
+    With checkpointing enabled, graph state is saved after every node under the
+    job's ID, and the worker running a job holds a claim on it that it renews
+    by heartbeat. A job that was interrupted (its worker stopped) or failed keeps
+    its checkpoints and can be continued with ``resume_research``; a finished
+    job's checkpoints are deleted. A new job is claimed as soon as it is created,
+    so one still queued when its worker stops is started again by another.
 
-class ResearchService:
-    """Orchestrates LangGraph research runs and manages their lifecycle."""
+    Jobs and their results are kept in the job store (JOB_STORE_BACKEND), which
+    is saved on every status change, so any worker can answer status and result
+    requests and nothing accumulates in process memory.
+    """
 
     def __init__(self):
-        self._graph = build_research_graph()
+        self._store = get_job_store()
+        self._checkpointer = get_checkpointer()
+        self._graph = build_research_graph(checkpointer=self._checkpointer)
+        if self._checkpointer is not None:
+            start_heartbeat(self._checkpointer, get_settings().checkpoint_heartbeat_seconds)
 
     def start_research(self, target_name: str, target_context: str = "") -> str:
         job_id = str(uuid.uuid4())
-        job = ResearchJob(job_id, target_name, target_context)
-        _jobs[job_id] = job
+        self._store.save(ResearchJob(job_id, target_name, target_context))
+        if self._checkpointer is not None:
+            # Held while the job waits for a slot, so other workers' start-up leaves it alone
+            claim_job(self._checkpointer, job_id, get_settings().checkpoint_heartbeat_seconds)
         logger.info("Created research job %s for target '%s'", job_id, target_name)
         return job_id
 
     def run_research(self, job_id: str) -> dict[str, Any]:
         """Execute the research graph synchronously."""
-        job = _jobs.get(job_id)
+        job = self._pending_job(job_id)
+        return self._execute(job, self._initial_state(job))
+
+    async def arun_research(self, job_id: str) -> dict[str, Any]:
+        """Execute the research graph on the caller's event loop with ``ainvoke``.
+
+        Every LLM, search and database call is awaited, so one loop can run
+        many jobs concurrently.
+        """
+        job = self._pending_job(job_id)
+        return await self._aexecute(job, self._initial_state(job))
+
+    def _pending_job(self, job_id: str) -> ResearchJob:
+        job = self._store.get(job_id, with_result=False)
         if not job:
             raise ValueError(f"Job {job_id} not found")
-
-        job.status = "running"
         logger.info("Starting research execution for job %s", job_id)
+        return job
 
-        initial_state: ResearchState = {
+    def _initial_state(self, job: ResearchJob) -> ResearchState:
+        return {
+            "job_id": job.job_id,
             "target_name": job.target_name,
             "target_context": job.target_context,
             "research_plan": [],
@@ -60,34 +97,232 @@ class ResearchService:
             "connections": [],
             "risk_flags": [],
             "confidence_scores": {},
+            "scored_fact_ids": [],
+            "seen_documents": {},
+            "document_fingerprints": {},
+            "analysis_digest": "",
+            "analyzed_fact_count": 0,
+            "information_gaps": [],
+            "run_metrics": {},
             "iteration": 0,
             "status": "planning",
             "final_report": None,
         }
 
+    def restore_job(self, job_id: str) -> ResearchJob | None:
+        """A job that can be resumed, rebuilt from its checkpoint if this process never saw it.
+
+        Returns None when the job has no checkpoint (finished, unknown, or
+        checkpointing disabled).
+        """
+        if self._checkpointer is None:
+            return None
+        values = self._graph.get_state(checkpoint_config(job_id)).values
+        if not values:
+            return None
+        job = self._store.get(job_id, with_result=False)
+        if job is None:
+            job = ResearchJob(job_id, values["target_name"], values.get("target_context", ""))
+            self._store.save(job)
+        return job
+
+    def resume_research(self, job_id: str, *, reserved: bool = False) -> dict[str, Any]:
+        """Continue a job from its last checkpoint, re-running only the unfinished nodes.
+
+        Works for jobs interrupted by a restart and for failed jobs. Pass
+        ``reserved`` when the caller already marked the job with ``mark_running``.
+        """
+        return self._execute(self._resumable_job(job_id, reserved), None)
+
+    async def aresume_research(self, job_id: str, *, reserved: bool = False) -> dict[str, Any]:
+        """Async ``resume_research``."""
+        job = await asyncio.to_thread(self._resumable_job, job_id, reserved)
+        return await self._aexecute(job, None)
+
+    def _resumable_job(self, job_id: str, reserved: bool) -> ResearchJob:
+        if not reserved and not self.mark_running(job_id):
+            raise ValueError(f"Job {job_id} is already running")
         try:
-            final_state = self._graph.invoke(initial_state)
-            job.status = "completed"
-            job.completed_at = datetime.now(timezone.utc)
-            job.result = self._format_result(final_state)
+            job = self.restore_job(job_id)
+            if job is None:
+                raise ValueError(f"No checkpoint for job {job_id}")
+        except BaseException:
+            _running_jobs.discard(job_id)
+            raise
+        job.error = None
+        pending = self._graph.get_state(checkpoint_config(job_id)).next
+        logger.info("Resuming research job %s at %s", job_id, ", ".join(pending) or "post-processing")
+        return job
+
+    def resume_interrupted_jobs(self) -> list[str]:
+        """Claim the interrupted jobs this process should resume at start-up.
+
+        Only jobs whose worker stopped heartbeating count: jobs running in a live
+        worker are left alone, and failed jobs wait for an explicit
+        ``resume_research``. Checkpoints older than CHECKPOINT_MAX_AGE_HOURS are
+        discarded instead. With several workers sharing the checkpoint file,
+        each job is claimed by exactly one of them. Claimed jobs are restored
+        (visible to status polling) and returned for the caller to pass to
+        ``resume_research``.
+        """
+        if self._checkpointer is None:
+            return []
+        settings = get_settings()
+        max_age = settings.checkpoint_max_age_hours * 3600
+        heartbeat_seconds = settings.checkpoint_heartbeat_seconds
+        now = datetime.now(timezone.utc)
+        claimed = []
+        for job_id, state in job_states(self._checkpointer, heartbeat_seconds).items():
+            if state == "running" or self.is_running(job_id):
+                continue
+            snapshot = self._graph.get_state(checkpoint_config(job_id))
+            created = datetime.fromisoformat(snapshot.created_at) if snapshot.created_at else now
+            if (now - created).total_seconds() > max_age:
+                logger.info("Discarding checkpoints of stale job %s (last saved %s)", job_id, snapshot.created_at)
+                release_job(self._checkpointer, job_id, finished=True)
+            elif state == "interrupted" and claim_job(self._checkpointer, job_id, heartbeat_seconds):
+                self.restore_job(job_id)
+                claimed.append(job_id)
+        if claimed:
+            logger.info("Resuming %d interrupted research jobs", len(claimed))
+        return claimed
 
-            self._save_report(job)
+    def requeue_abandoned_jobs(self) -> list[str]:
+        """Claim the queued jobs a stopped worker never started, to run from the beginning.
+
+        A job is abandoned when it is still "pending" and no worker holds a live
+        claim on it. Ones created more than CHECKPOINT_MAX_AGE_HOURS ago are
+        marked failed instead. Claimed jobs are returned for the caller to pass
+        to ``run_research``.
+        """
+        if self._checkpointer is None:
+            return []
+        settings = get_settings()
+        max_age = settings.checkpoint_max_age_hours * 3600
+        heartbeat_seconds = settings.checkpoint_heartbeat_seconds
+        now = datetime.now(timezone.utc)
+        live = live_claims(self._checkpointer, heartbeat_seconds)
+        claimed = []
+        for job_id in self._store.job_ids("pending"):
+            if job_id in live or self.is_running(job_id):
+                continue
+            if not claim_job(self._checkpointer, job_id, heartbeat_seconds):
+                continue
+            job = self._store.get(job_id, with_result=False)
+            if (now - job.created_at).total_seconds() > max_age:
+                logger.info("Failing research job %s, queued since %s and never started", job_id, job.created_at)
+                job.status = "failed"
+                job.error = "Job was queued on a worker that stopped before starting it"
+                self._store.save(job)
+                release_job(self._checkpointer, job_id, finished=False)
+            else:
+                claimed.append(job_id)
+        if claimed:
+            logger.info("Re-queueing %d research jobs a stopped worker never started", len(claimed))
+        return claimed
+
+    def _execute(self, job: ResearchJob, initial_state: ResearchState | None) -> dict[str, Any]:
+        """Run the graph from ``initial_state``, or from the job's last checkpoint when None."""
+        self._start(job)
+        config = checkpoint_config(job.job_id)
+        finished = failed = False
+        try:
+            if initial_state is None and not self._graph.get_state(config).next:
+                # The graph had already finished; only post-processing was interrupted
+                final_state = self._graph.get_state(config).values
+            else:
+                final_state = self._graph.invoke(initial_state, config)
+            self._complete(job, final_state)
             self._build_identity_graph(job, final_state)
+            finished = True
+
+            logger.info("Research job %s completed successfully", job.job_id)
+            return job.result
 
-            logger.info("Research job %s completed successfully", job_id)
+        except Exception as e:
+            failed = True
+            self._fail(job, e)
+            raise
+        finally:
+            self._release(job, finished, failed)
+
+    async def _aexecute(self, job: ResearchJob, initial_state: ResearchState | None) -> dict[str, Any]:
+        """Async ``_execute``."""
+        await asyncio.to_thread(self._start, job)
+        config = checkpoint_config(job.job_id)
+        finished = failed = False
+        try:
+            snapshot = await self._graph.aget_state(config) if initial_state is None else None
+            if snapshot is not None and not snapshot.next:
+                # The graph had already finished; only post-processing was interrupted
+                final_state = snapshot.values
+            else:
+                final_state = await self._graph.ainvoke(initial_state, config)
+            await asyncio.to_thread(self._complete, job, final_state)
+            await self._abuild_identity_graph(job, final_state)
+            finished = True
+
+            logger.info("Research job %s completed successfully", job.job_id)
             return job.result
 
         except Exception as e:
-            job.status = "failed"
-            job.error = str(e)
-            logger.error("Research job %s failed: %s", job_id, e, exc_info=True)
+            failed = True
+            await asyncio.to_thread(self._fail, job, e)
             raise
+        finally:
+            await asyncio.to_thread(self._release, job, finished, failed)
+
+    def _start(self, job: ResearchJob) -> None:
+        """Claim the job for this worker (its heartbeat keeps the claim) and mark it running."""
+        if self._checkpointer is not None and not claim_job(
+            self._checkpointer, job.job_id, get_settings().checkpoint_heartbeat_seconds, include_failed=True,
+        ):
+            _running_jobs.discard(job.job_id)
+            raise ValueError(f"Job {job.job_id} is running in another worker")
+        _running_jobs.add(job.job_id)
+        job.status = "running"
+        self._store.save(job)
+
+    def _complete(self, job: ResearchJob, final_state: dict) -> None:
+        job.status = "completed"
+        job.completed_at = datetime.now(timezone.utc)
+        job.result = self._format_result(final_state)
+        self._save_report(job)
+        self._store.save(job)
+
+    def _fail(self, job: ResearchJob, error: Exception) -> None:
+        job.status = "failed"
+        job.error = str(error)
+        logger.error("Research job %s failed: %s", job.job_id, error, exc_info=True)
+        self._store.save(job)
+
+    def _release(self, job: ResearchJob, finished: bool, failed: bool = False) -> None:
+        _running_jobs.discard(job.job_id)
+        drop_passage_index(job.job_id)
+        if self._checkpointer is not None:
+            release_job(self._checkpointer, job.job_id, finished=finished, failed=failed)
 
     def get_job(self, job_id: str) -> ResearchJob | None:
-        return _jobs.get(job_id)
+        return self._store.get(job_id)
+
+    def is_running(self, job_id: str) -> bool:
+        """Whether this process is executing the job right now (or has it reserved)."""
+        return job_id in _running_jobs
+
+    def mark_running(self, job_id: str) -> bool:
+        """Reserve the job for a run in this process; False if it is already running here.
+
+        Lets a caller that runs the job later (e.g. on a background loop) claim
+        it at once, so a second request in between sees it running.
+        """
+        with _running_jobs_lock:
+            if job_id in _running_jobs:
+                return False
+            _running_jobs.add(job_id)
+            return True
 
     def get_job_status(self, job_id: str) -> dict:
-        job = _jobs.get(job_id)
+        job = self._store.get(job_id, with_result=False)
         if not job:
             return {"error": "Job not found"}
         return {
@@ -110,6 +345,7 @@ class ResearchService:
             "connections": state.get("connections", []),
             "confidence_stats": stats,
             "search_queries_executed": len(state.get("search_history", [])),
+            "metrics": state.get("run_metrics", {}),
         }
 
     def _save_report(self, job: ResearchJob) -> None:
@@ -134,3 +370,14 @@ class ResearchService:
             )
         except Exception as e:
             logger.warning("Identity graph construction failed (Neo4j may be offline): %s", e)
+
+    async def _abuild_identity_graph(self, job: ResearchJob, state: dict) -> None:
+        try:
+            graph_queries = IdentityGraphQueries()
+            await graph_queries.abuild_from_research(
+                target_name=job.target_name,
+                facts=state.get("extracted_facts", []),
+                connections=state.get("connections", []),
+            )
+        except Exception as e:
+            logger.warning("Identity graph construction failed (Neo4j may be offline): %s", e)
@@ -46,6 +46,13 @@ def compute_confidence(
     return round(min(1.0, max(0.0, score)), 2)
 
 
+def apply_corroboration(confidence: float, source_urls: list[str], corroboration_count: int = 1) -> float:
+    """Raise a fact's confidence when independent sources corroborate it; never lower it."""
+    if corroboration_count <= 1:
+        return confidence
+    return max(confidence, compute_confidence(source_urls, corroboration_count))
+
+
 def aggregate_confidence_stats(facts: list[dict]) -> dict:
     """Produce summary confidence statistics for a set of facts."""
     if not facts:
@@ -0,0 +1,243 @@
+"""Main-content extraction for scraped pages: boilerplate stripping and passage selection."""
+
+from __future__ import annotations
+
+import re
+from html.parser import HTMLParser
+from typing import NamedTuple
+
+from src.utils.relevance import BM25Ranker
+
+# Elements whose whole subtree is chrome rather than content. <header> is kept:
+# inside an <article> it holds the title, and a site header is mostly a <nav>.
+_SKIP_TAGS = frozenset(
+    "script style noscript template svg canvas iframe nav footer aside form "
+    "button select dialog menu".split()
+)
+_VOID_TAGS = frozenset("area base br col embed hr img input link meta param source track wbr".split())
+_BLOCK_TAGS = frozenset(
+    "p div li ul ol dl dt dd h1 h2 h3 h4 h5 h6 title tr td th table section article main "
+    "blockquote pre figcaption hr caption".split()
+)
+_HEADINGS = {f"h{i}": i for i in range(1, 7)} | {"title": 1}
+# A class or id token is chrome when it is made only of these words (split on - and _)
+# and names at least one of the first set: "cookie-banner", "share_bar" and "site-footer"
+# are, while "has-sidebar", "nav-fixed" and "ad-free" describe the page, not a widget.
+_BOILERPLATE_WORDS = frozenset(
+    "nav navbar menu footer sidebar cookie cookies consent gdpr banner breadcrumb breadcrumbs "
+    "share sharing social subscribe newsletter signup promo advert ad ads sponsored related "
+    "comment comments popup modal skip".split()
+)
+_QUALIFIER_WORDS = frozenset(
+    "site global main primary secondary top bottom header bar box links link list buttons button btn "
+    "icons widget widgets wrapper wrap container inner area section block notice message stories "
+    "posts articles items to content".split()
+)
+_TOKEN_PARTS = re.compile(r"[-_]+")
+# Page-level containers are never skipped on class/id: themes hang state classes such as
+# "modal-open" or "has-sidebar" on <body>, and skipping it would drop the whole page
+_CONTAINER_TAGS = frozenset("html body main article".split())
+_BOILERPLATE_ROLES = frozenset("navigation banner contentinfo complementary search dialog alert".split())
+
+# A body block needs this many words to count as prose, and at most this share
+# of its text may be link text (menus, tag clouds and "related" lists are mostly links).
+MIN_WORDS = 4
+MAX_LINK_DENSITY = 0.5
+
+
+class Block(NamedTuple):
+    text: str
+    heading: int  # 1-6 for headings, 0 for body text
+    link_density: float
+
+
+class MainContentParser(HTMLParser):
+    """Incremental HTML parser that yields the content blocks of a page.
+
+    ``feed`` can be called with chunks as they arrive. Subtrees that are page
+    chrome (navigation, headers and footers, forms, and elements whose class,
+    id or ARIA role marks them as menus, cookie banners, share bars, ads and
+    the like) are skipped outright; the rest is split into headings and
+    paragraph-level blocks.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.blocks: list[Block] = []
+        self._skip_tag: str | None = None
+        self._skip_nesting = 0
+        self._heading = 0
+        self._links = 0
+        self._parts: list[str] = []
+        self._link_chars = 0
+
+    def handle_starttag(self, tag, attrs):
+        if self._skip_tag is not None:
+            if tag == self._skip_tag:
+                self._skip_nesting += 1
+            return
+        if tag not in _VOID_TAGS and _is_boilerplate(tag, attrs):
+            self._flush()
+            self._skip_tag, self._skip_nesting = tag, 1
+            return
+        if tag in _BLOCK_TAGS:
+            self._flush()
+            self._heading = _HEADINGS.get(tag, 0)
+        elif tag == "a":
+            self._links += 1
+        elif tag == "br":
+            self._parts.append(" ")
+
+    def handle_endtag(self, tag):
+        if self._skip_tag is not None:
+            if tag == self._skip_tag:
+                self._skip_nesting -= 1
+                if not self._skip_nesting:
+                    self._skip_tag = None
+            return
+        if tag in _BLOCK_TAGS:
+            self._flush()
+        elif tag == "a" and self._links:
+            self._links -= 1
+
+    def handle_data(self, data):
+        if self._skip_tag is not None:
+            return
+        self._parts.append(data)
+        if self._links:
+            self._link_chars += len(data) - sum(map(data.count, " \t\n\r"))
+
+    def close(self) -> list[Block]:
+        super().close()
+        self._flush()
+        return self.blocks
+
+    def _flush(self) -> None:
+        text = " ".join("".join(self._parts).split())
+        if text:
+            density = min(self._link_chars / (len(text) - text.count(" ")), 1.0)
+            self.blocks.append(Block(text, self._heading, density))
+        self._parts.clear()
+        self._link_chars = 0
+        self._heading = 0
+
+
+def _is_boilerplate(tag: str, attrs: list[tuple[str, str | None]]) -> bool:
+    if tag in _SKIP_TAGS:
+        return True
+    for name, value in attrs:
+        if name == "hidden" or (name == "aria-hidden" and value == "true"):
+            return True
+        if name == "role" and value in _BOILERPLATE_ROLES:
+            return True
+        if name in ("class", "id") and value and tag not in _CONTAINER_TAGS and _is_chrome_name(value):
+            return True
+    return False
+
+
+def _is_chrome_name(value: str) -> bool:
+    for token in value.lower().split():
+        parts = set(_TOKEN_PARTS.split(token.strip("-_")))
+        if parts & _BOILERPLATE_WORDS and parts <= _BOILERPLATE_WORDS | _QUALIFIER_WORDS:
+            return True
+    return False
+
+
+def content_blocks(blocks: list[Block]) -> list[Block]:
+    """Drop link lists, fragments too short to be prose, and repeated blocks."""
+    kept, seen = [], set()
+    for block in blocks:
+        key = block.text.lower()
+        if key in seen:
+            continue
+        if not block.heading:
+            if block.link_density > MAX_LINK_DENSITY or len(block.text.split()) < MIN_WORDS:
+                continue
+        seen.add(key)
+        kept.append(block)
+    # A heading followed by nothing but a same- or higher-level heading (an empty
+    # section, a widget title) carries nothing
+    out = []
+    for i, block in enumerate(kept):
+        following = kept[i + 1] if i + 1 < len(kept) else None
+        if block.heading and (following is None or 0 < following.heading <= block.heading):
+            continue
+        out.append(block)
+    return out
+
+
+def select_passages(blocks: list[Block], query: dict[str, float] | None, max_chars: int) -> list[Block]:
+    """Choose blocks that fit ``max_chars``, most relevant to ``query`` first, in page order.
+
+    Without a query, or when everything fits, this is the leading blocks of the
+    page. Otherwise body blocks are ranked with BM25 and taken best-first while
+    they fit, each with the heading it sits under, so the target's passages
+    survive even when they are deep in a long page. Blocks sharing no term
+    with the query are left out; if none match, the leading blocks are kept.
+    """
+    if sum(_size(b) for b in blocks) <= max_chars or not query:
+        chosen, used = [], 0
+        for block in blocks:
+            if used + _size(block) > max_chars:
+                if max_chars - used > 1 and not block.heading:
+                    chosen.append(block._replace(text=block.text[:max_chars - used - 1]))
+                break
+            chosen.append(block)
+            used += _size(block)
+        return chosen
+
+    body = [i for i, b in enumerate(blocks) if not b.heading]
+    scores = BM25Ranker([blocks[i].text for i in body]).relevance(query)
+    parent, current = {}, None
+    for i, block in enumerate(blocks):
+        if block.heading:
+            current = i
+        else:
+            parent[i] = current
+
+    picked: set[int] = set()
+    used = 0
+    for score, i in sorted(zip(scores, body), key=lambda s: (-s[0], s[1])):
+        if score <= 0:
+            break
+        cost = _size(blocks[i])
+        heading = parent[i]
+        if heading is not None and heading not in picked:
+            cost += _size(blocks[heading])
+        if used + cost > max_chars:
+            continue
+        picked.add(i)
+        if heading is not None:
+            picked.add(heading)
+        used += cost
+    if not picked:
+        return select_passages(blocks, None, max_chars)
+    return [blocks[i] for i in sorted(picked)]
+
+
+def _size(block: Block) -> int:
+    """Rendered length of a block, including its heading marker and newline."""
+    return len(block.text) + 1 + (block.heading + 1 if block.heading else 0)
+
+
+def render(blocks: list[Block]) -> str:
+    return "\n".join(f"{'#' * b.heading} {b.text}" if b.heading else b.text for b in blocks)
+
+
+def extract_main_content(markup: str, query: dict[str, float] | None = None, max_chars: int = 10_000) -> str:
+    """Main text of an HTML page: headings as ``#`` lines and one paragraph per line.
+
+    Boilerplate is removed first; if the remainder exceeds ``max_chars``, the
+    passages most relevant to ``query`` (see ``relevance.build_query``) are kept
+    rather than the first ``max_chars`` characters.
+    """
+    parser = MainContentParser()
+    parser.feed(markup)
+    return render(select_passages(content_blocks(parser.close()), query, max_chars))
+
+
+def extract_plain_text(text: str, query: dict[str, float] | None = None, max_chars: int = 10_000) -> str:
+    """The same passage selection for text/plain bodies, split into paragraphs at blank lines."""
+    paragraphs = (" ".join(p.split()) for p in re.split(r"\n\s*\n", text))
+    blocks = [Block(p, 0, 0.0) for p in paragraphs if p]
+    return render(select_passages(blocks, query, max_chars))
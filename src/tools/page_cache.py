@@ -0,0 +1,223 @@
+"""Content-addressed on-disk cache of scraped pages with their HTTP validators."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import NamedTuple
+
+from src.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class CachedPage(NamedTuple):
+    body: str
+    content_type: str
+    etag: str | None
+    last_modified: str | None
+    fresh: bool
+
+    def validators(self) -> dict[str, str]:
+        """Headers for a conditional GET that the server can answer with 304."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class PageCache:
+    """SQLite store of fetched pages, shared by every thread and process using the file.
+
+    Bodies are stored once per SHA-256 of their content, so a page served under
+    several URLs takes space once. Each URL row keeps the page's ETag and
+    Last-Modified: within ``fresh_seconds`` of the last fetch or revalidation a
+    page is served without touching the network; after that the scraper sends a
+    conditional GET and a 304 renews it. Pages not revalidated for
+    ``max_age_seconds`` are dropped, and least recently read pages go first once
+    bodies exceed ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        fresh_seconds: float = 3600.0,
+        max_age_seconds: float = 30 * 86400.0,
+        max_bytes: int = 500 * 1024 * 1024,
+    ):
+        self._path = Path(path)
+        self._fresh = fresh_seconds
+        self._max_age = max_age_seconds
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._evictions = 0
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS blobs ("
+            " hash TEXT PRIMARY KEY,"
+            " body TEXT NOT NULL,"
+            " size INTEGER NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            " url TEXT PRIMARY KEY,"
+            " hash TEXT NOT NULL,"
+            " content_type TEXT NOT NULL,"
+            " etag TEXT,"
+            " last_modified TEXT,"
+            " validated_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_accessed ON pages(accessed_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_hash ON pages(hash)")
+        self._conn.commit()
+
+    def get(self, url: str) -> CachedPage | None:
+        """The cached page for ``url``, marked fresh or due for revalidation; None if absent or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT b.body, p.content_type, p.etag, p.last_modified, p.validated_at"
+                " FROM pages p JOIN blobs b ON b.hash = p.hash WHERE p.url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            body, content_type, etag, last_modified, validated_at = row
+            if now - validated_at > self._max_age:
+                self._conn.execute("DELETE FROM pages WHERE url = ?", (url,))
+                self._drop_orphans()
+                self._conn.commit()
+                return None
+            self._conn.execute("UPDATE pages SET accessed_at = ? WHERE url = ?", (now, url))
+            self._conn.commit()
+        return CachedPage(body, content_type, etag, last_modified, now - validated_at <= self._fresh)
+
+    def set(
+        self,
+        url: str,
+        body: str,
+        content_type: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        digest = hashlib.sha256(body.encode("utf-8")).hexdigest()
+        now = time.time()
+        with self._lock:
+            previous = self._conn.execute("SELECT hash FROM pages WHERE url = ?", (url,)).fetchone()
+            self._conn.execute(
+                "INSERT OR IGNORE INTO blobs (hash, body, size) VALUES (?, ?, ?)",
+                (digest, body, len(body.encode("utf-8"))),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages"
+                " (url, hash, content_type, etag, last_modified, validated_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, digest, content_type, etag, last_modified, now, now),
+            )
+            if previous is not None and previous[0] != digest:
+                self._drop_blob(previous[0])
+            self._evict()
+            self._conn.commit()
+
+    def revalidated(self, url: str, etag: str | None = None, last_modified: str | None = None) -> None:
+        """Record a 304: the cached page is fresh again (with any updated validators)."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE pages SET validated_at = ?, accessed_at = ?,"
+                " etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified)"
+                " WHERE url = ?",
+                (now, now, etag, last_modified, url),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM pages")
+            self._conn.execute("DELETE FROM blobs")
+            self._conn.commit()
+            self._evictions = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            (pages,) = self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()
+            blobs, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs"
+            ).fetchone()
+        return {"pages": pages, "bodies": blobs, "bytes": size, "evictions": self._evictions}
+
+    def _evict(self) -> None:
+        """Drop pages past max age, then least recently read ones until bodies fit the byte budget."""
+        cur = self._conn.execute(
+            "DELETE FROM pages WHERE validated_at < ?", (time.time() - self._max_age,)
+        )
+        if cur.rowcount > 0:
+            self._evictions += cur.rowcount
+            self._drop_orphans()
+
+        (total,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()
+        if total <= self._max_bytes:
+            return
+        excess = total - self._max_bytes
+        victims = []
+        rows = self._conn.execute(
+            "SELECT p.url, p.hash, b.size FROM pages p JOIN blobs b ON b.hash = p.hash"
+            " ORDER BY p.accessed_at ASC"
+        ).fetchall()
+        refs = Counter(digest for _, digest, _ in rows)
+        for url, digest, size in rows:
+            victims.append((url,))
+            # A body shared by several URLs is freed with the last of them
+            refs[digest] -= 1
+            if not refs[digest]:
+                excess -= size
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM pages WHERE url = ?", victims)
+        self._evictions += len(victims)
+        self._drop_orphans()
+        logger.debug("PageCache evicted %d pages over byte budget", len(victims))
+
+    def _drop_orphans(self) -> None:
+        """Delete every body no page refers to; a full scan, so only after pages were deleted."""
+        self._conn.execute("DELETE FROM blobs WHERE hash NOT IN (SELECT hash FROM pages)")
+
+    def _drop_blob(self, digest: str) -> None:
+        """Delete one body if no page refers to it any more (an index lookup)."""
+        self._conn.execute(
+            "DELETE FROM blobs WHERE hash = ? AND NOT EXISTS (SELECT 1 FROM pages WHERE hash = ?)",
+            (digest, digest),
+        )
+
+
+_page_cache: PageCache | None = None
+_page_cache_lock = threading.Lock()
+
+
+def get_page_cache() -> PageCache | None:
+    """Process-wide page cache, or None when disabled in settings."""
+    global _page_cache
+    settings = get_settings()
+    if not settings.page_cache_enabled:
+        return None
+    with _page_cache_lock:
+        if _page_cache is None:
+            _page_cache = PageCache(
+                settings.page_cache_path,
+                fresh_seconds=settings.page_cache_fresh_seconds,
+                max_age_seconds=settings.page_cache_max_age_seconds,
+                max_bytes=settings.page_cache_max_mb * 1024 * 1024,
+            )
+    return _page_cache
@@ -1,31 +1,264 @@
+"""Process-wide async web scraper shared by all research jobs."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections import Counter
+from concurrent.futures import Future
+from urllib.parse import urlsplit
+
 import httpx
-from langchain_community.document_loaders import WebBaseLoader
+
+from src.config.settings import get_settings
+from src.tools.content import extract_main_content, extract_plain_text
+from src.tools.page_cache import PageCache, get_page_cache
+from src.tools.search import canonicalize_url
+from src.utils.aio import BackgroundLoop
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (compatible; deep-research-agent/1.0)"
+_TEXT_TYPES = ("text/html", "application/xhtml+xml", "text/plain")
+_CACHE_METRICS = {
+    "hit": "page_cache_hits",
+    "revalidated": "page_cache_revalidated",
+    "miss": "page_cache_misses",
+}
 
 
 class WebScraper:
-    """Optional webpage scraper for deeper content extraction."""
+    """Fetches pages on one pooled keep-alive HTTP client.
+
+    All jobs submit URLs to the same background event loop. In-flight requests
+    are bounded process-wide by ``max_concurrency`` and per host by
+    ``per_host_concurrency``, so a deep dive into 30 sources runs in parallel
+    without hammering any one site. Each fetch has an overall ``timeout``, and
+    bodies are read as a stream that stops at ``max_bytes``. Pages are reduced
+    to their main content (see ``src.tools.content``); given a relevance
+    query, a page longer than ``max_chars`` keeps its most relevant passages.
+
+    With a ``PageCache``, recently fetched pages are served from disk, and older
+    ones are revalidated with a conditional GET so an unchanged page costs a
+    304 instead of a download.
+    """
 
-    def __init__(self, timeout: float = 30.0):
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 16,
+        per_host_concurrency: int = 2,
+        max_connections: int = 20,
+        timeout: float = 15.0,
+        max_bytes: int = 2_000_000,
+        max_chars: int = 10_000,
+        cache: PageCache | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self._max_concurrency = max_concurrency
+        self._per_host_concurrency = per_host_concurrency
         self._timeout = timeout
+        self._max_bytes = max_bytes
+        self._max_chars = max_chars
+        self._cache = cache
+        self._loop = BackgroundLoop("web-scraper")
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            headers={"User-Agent": USER_AGENT, "Accept": "text/html,application/xhtml+xml,text/plain"},
+            transport=transport,
+        )
+        # Created lazily on the loop thread, which is the only place they are used
+        self._semaphore: asyncio.Semaphore | None = None
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._in_flight = 0
+        self._requests = 0
+        self._failures = 0
+        self._truncated = 0
+        self._bytes_read = 0
+        self._cache_outcomes: Counter = Counter()
 
-    def scrape_url(self, url: str) -> str:
-        """Scrape a URL and return its text content."""
-        try:
-            loader = WebBaseLoader(url)
-            docs = loader.load()
-            if docs:
-                return docs[0].page_content[:10000]
-            return ""
-        except Exception:
-            return self._fallback_scrape(url)
-
-    def _fallback_scrape(self, url: str) -> str:
+    def submit(self, url: str, query: dict[str, float] | None = None) -> Future:
+        """Schedule a scrape and return a future resolving to the page text ("" on failure)."""
+        return self._loop.submit(self._scrape_text(url, query))
+
+    def scrape_url(self, url: str, query: dict[str, float] | None = None) -> str:
+        """Blocking scrape for synchronous callers."""
+        return self.submit(url, query).result()
+
+    async def ascrape(self, url: str, query: dict[str, float] | None = None) -> str:
+        """Await a scrape from any event loop."""
+        return await asyncio.wrap_future(self.submit(url, query))
+
+    def scrape_multiple(
+        self,
+        urls: list[str],
+        query: dict[str, float] | None = None,
+        metrics: dict | None = None,
+    ) -> dict[str, str]:
+        """Scrape ``urls`` concurrently; returns text per URL in input order.
+
+        If ``metrics`` is given, this call's page-cache outcomes are added to it
+        (``page_cache_hits``, ``page_cache_revalidated``, ``page_cache_misses``),
+        ready to merge into a job's run_metrics.
+        """
+        futures = {url: self._loop.submit(self._scrape(url, query)) for url in dict.fromkeys(urls)}
+        results = {}
+        for url, future in futures.items():
+            results[url], outcome = future.result()
+            if metrics is not None and outcome in _CACHE_METRICS:
+                key = _CACHE_METRICS[outcome]
+                metrics[key] = metrics.get(key, 0) + 1
+        return results
+
+    def cache_stats(self) -> dict:
+        """Page-cache hit rate over every scrape so far (hits and 304 revalidations count as hits)."""
+        if self._cache is None:
+            return {}
+        hits = self._cache_outcomes["hit"] + self._cache_outcomes["revalidated"]
+        lookups = hits + self._cache_outcomes["miss"]
+        return {
+            "hits": self._cache_outcomes["hit"],
+            "revalidated": self._cache_outcomes["revalidated"],
+            "misses": self._cache_outcomes["miss"],
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            **self._cache.stats(),
+        }
+
+    def stats(self) -> dict:
+        return {
+            "requests": self._requests,
+            "in_flight": self._in_flight,
+            "failures": self._failures,
+            "truncated": self._truncated,
+            "bytes_read": self._bytes_read,
+            "max_concurrency": self._max_concurrency,
+            "per_host_concurrency": self._per_host_concurrency,
+            "page_cache": self.cache_stats(),
+        }
+
+    def close(self) -> None:
+        self._loop.run(self._client.aclose())
+        self._loop.stop()
+
+    async def _scrape_text(self, url: str, query: dict[str, float] | None) -> str:
+        text, _ = await self._scrape(url, query)
+        return text
+
+    async def _scrape(self, url: str, query: dict[str, float] | None = None) -> tuple[str, str]:
+        """Return the page text and how the cache was used: hit, revalidated, miss, uncached or error."""
         try:
-            resp = httpx.get(url, timeout=self._timeout, follow_redirects=True)
+            key = canonicalize_url(url)
+            host = (urlsplit(url).hostname or "").lower()
+        except ValueError as e:
+            self._failures += 1
+            logger.warning("Scrape failed for %s: %s", url, e)
+            return "", "error"
+        # Page-cache calls are SQLite I/O on bodies up to max_bytes; keep them off the fetch loop
+        cached = await asyncio.to_thread(self._cache.get, key) if self._cache is not None else None
+        if cached is not None and cached.fresh:
+            return await self._finish(cached.body, cached.content_type, query, "hit")
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        host_semaphore = self._host_semaphores.get(host)
+        if host_semaphore is None:
+            host_semaphore = self._host_semaphores[host] = asyncio.Semaphore(self._per_host_concurrency)
+
+        headers = cached.validators() if cached is not None else {}
+        # Take the host slot first so requests queued for a busy host don't hold global slots
+        async with host_semaphore, self._semaphore:
+            self._in_flight += 1
+            self._requests += 1
+            try:
+                resp, body, truncated = await asyncio.wait_for(self._fetch(url, headers), self._timeout)
+            except (httpx.HTTPError, httpx.InvalidURL, asyncio.TimeoutError, UnicodeError) as e:
+                self._failures += 1
+                logger.warning("Scrape failed for %s: %s", url, e or type(e).__name__)
+                return "", "error"
+            finally:
+                self._in_flight -= 1
+
+        etag = resp.headers.get("etag")
+        last_modified = resp.headers.get("last-modified")
+        if resp.status_code == 304 and cached is not None:
+            await asyncio.to_thread(self._cache.revalidated, key, etag, last_modified)
+            return await self._finish(cached.body, cached.content_type, query, "revalidated")
+
+        content_type = resp.headers.get("content-type", "text/html").lower()
+        if self._cache is None:
+            return await self._finish(body, content_type, query, "uncached")
+        if body and truncated:
+            # Without validators a stale copy is fetched again in full, not renewed by a 304
+            await asyncio.to_thread(self._cache.set, key, body, content_type)
+        elif body:
+            await asyncio.to_thread(self._cache.set, key, body, content_type, etag, last_modified)
+        return await self._finish(body, content_type, query, "miss")
+
+    async def _finish(
+        self, body: str, content_type: str, query: dict[str, float] | None, outcome: str
+    ) -> tuple[str, str]:
+        if outcome in _CACHE_METRICS:
+            self._cache_outcomes[outcome] += 1
+        if not body:
+            return "", outcome
+        extract = extract_plain_text if content_type.startswith("text/plain") else extract_main_content
+        # Parsing a large page takes milliseconds of CPU; keep it off the fetch loop
+        text = await asyncio.to_thread(extract, body, query, self._max_chars)
+        return text, outcome
+
+    async def _fetch(self, url: str, headers: dict[str, str]) -> tuple[httpx.Response, str, bool]:
+        """GET ``url``, reading at most ``max_bytes`` of a text body; returns (response, body, truncated)."""
+        async with self._client.stream("GET", url, headers=headers) as resp:
+            if resp.status_code == 304:
+                return resp, "", False
             resp.raise_for_status()
-            return resp.text[:10000]
-        except Exception:
-            return ""
+            content_type = resp.headers.get("content-type", "text/html").lower()
+            if not content_type.startswith(_TEXT_TYPES):
+                logger.debug("Skipping %s: unsupported content type %s", url, content_type)
+                return resp, "", False
+
+            chunks: list[bytes] = []
+            size = 0
+            truncated = False
+            async for chunk in resp.aiter_bytes():
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= self._max_bytes:
+                    self._truncated += 1
+                    truncated = True
+                    break
+            self._bytes_read += size
+            raw = b"".join(chunks)[:self._max_bytes]
+            return resp, raw.decode(resp.encoding or "utf-8", errors="replace"), truncated
+
+
+_scraper: WebScraper | None = None
+_scraper_lock = threading.Lock()
+
+
+def get_web_scraper() -> WebScraper:
+    """Return the process-wide scraper, creating it on first use."""
+    global _scraper
+    with _scraper_lock:
+        if _scraper is None:
+            settings = get_settings()
+            _scraper = WebScraper(
+                max_concurrency=settings.scrape_max_concurrency,
+                per_host_concurrency=settings.scrape_per_host_concurrency,
+                max_connections=settings.scrape_max_connections,
+                timeout=settings.scrape_timeout_seconds,
+                max_bytes=settings.scrape_max_bytes,
+                max_chars=settings.scrape_max_chars,
+                cache=get_page_cache(),
+            )
+    return _scraper
+
 
-    def scrape_multiple(self, urls: list[str]) -> dict[str, str]:
-        return {url: self.scrape_url(url) for url in urls}
+def web_scraper_stats() -> dict:
+    return _scraper.stats() if _scraper is not None else {}
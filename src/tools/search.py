@@ -1,14 +1,29 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import threading
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
 from tavily import TavilyClient
 
 from src.config.settings import get_settings
+from src.utils.disk_cache import DiskCache
+from src.utils.simhash import SimHashIndex, simhash
+from src.utils.rate_limiter import get_rate_limiter
+
+logger = logging.getLogger(__name__)
 
 
 class TavilySearchTool:
-    """Wraps the Tavily API for deep web search."""
+    """Wraps the Tavily API for deep web search, with an on-disk result cache."""
 
-    def __init__(self):
+    def __init__(self, cache: DiskCache | None = None):
         settings = get_settings()
         self._client = TavilyClient(api_key=settings.tavily_api_key)
+        self._cache = cache if cache is not None else get_search_cache()
+        self._rate_limiter = get_rate_limiter("tavily")
 
     def search(
         self,
@@ -16,28 +31,248 @@ class TavilySearchTool:
         max_results: int = 10,
         search_depth: str = "advanced",
         include_raw_content: bool = False,
+        *,
+        bypass_cache: bool = False,
     ) -> list[dict]:
+        """Search Tavily. Set ``bypass_cache`` to force a fresh request (the result is still cached)."""
+        key = search_cache_key("search", query, max_results, search_depth, include_raw_content)
+        if self._cache is not None and not bypass_cache:
+            cached = self._cache.get(key)
+            if cached is not None:
+                logger.debug("Search cache hit for '%s'", query)
+                return cached
+
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
         response = self._client.search(
             query=query,
             max_results=max_results,
             search_depth=search_depth,
             include_raw_content=include_raw_content,
         )
-        return [
-            {
-                "title": r.get("title", ""),
-                "url": r.get("url", ""),
-                "content": r.get("content", ""),
-                "score": r.get("score", 0.0),
-                "raw_content": r.get("raw_content"),
-            }
-            for r in response.get("results", [])
-        ]
-
-    def search_context(self, query: str, max_results: int = 5) -> str:
+        results = normalize_results(response)
+        if self._cache is not None:
+            self._cache.set(key, results)
+        return results
+
+    def search_context(self, query: str, max_results: int = 5, *, bypass_cache: bool = False) -> str:
         """Returns a single concatenated string of search results for LLM context."""
-        return self._client.get_search_context(
+        key = search_cache_key("context", query, max_results, "advanced", False)
+        if self._cache is not None and not bypass_cache:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+        context = self._client.get_search_context(
             query=query,
             max_results=max_results,
             search_depth="advanced",
         )
+        if self._cache is not None:
+            self._cache.set(key, context)
+        return context
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a query, used for cache keys."""
+    return re.sub(r"\s+", " ", query).strip().lower()
+
+
+_TRACKING_PARAMS = frozenset({
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "ref", "ref_src", "ref_url", "cmpid", "srsltid", "_ga", "_gl",
+})
+
+
+def canonicalize_url(url: str) -> str:
+    """Key under which different spellings of the same document URL collide.
+
+    Drops the scheme (http and https copies are one document), a leading
+    ``www.``, default ports, the fragment, tracking parameters (``utm_*``,
+    ``fbclid``, ...) and trailing slashes, and sorts the remaining query
+    parameters. The result is a key, not a fetchable URL.
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parts = urlsplit(url if re.match(r"([a-z][\w+.-]*:)?//", url, re.I) else f"//{url}")
+    host = (parts.hostname or "").lower().removeprefix("www.")
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and port not in (80, 443):
+        host = f"{host}:{port}"
+    path = re.sub(r"/{2,}", "/", parts.path).rstrip("/")
+    params = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not (k.lower().startswith("utm_") or k.lower() in _TRACKING_PARAMS)
+    )
+    query = urlencode(params)
+    return f"{host}{path}?{query}" if query else f"{host}{path}"
+
+
+class SeenDocuments:
+    """Per-job index of search results already sent to the extractor.
+
+    Documents are identified by a digest of their canonical URL and normalized
+    text, so the same snippet returned for another query, in a later
+    iteration, or under a tracking-parameter or http/https variant of the URL
+    is dropped. Within one batch, different snippets of the same page are
+    collapsed into one result.
+
+    Longer texts are also fingerprinted with SimHash: a wire story or press
+    release republished on other domains is sent to the LLM once, and the
+    URLs of the dropped copies are kept in ``mirrors`` (canonical URL of the
+    copy that was kept -> other URLs) so they can be credited as
+    corroborating sources.
+
+    ``seen`` and ``fingerprints`` are the job's ``seen_documents`` (digest ->
+    canonical URL) and ``document_fingerprints`` (canonical URL -> SimHash)
+    state. Documents kept by ``filter`` are only held back from later batches
+    of the same run; ``commit`` them once they have been extracted, which moves
+    their entries (and those of copies clustered into them) to ``new`` and
+    ``new_fingerprints`` for the state update. A document that was never
+    extracted is therefore sent again in the next iteration.
+    """
+
+    def __init__(
+        self,
+        seen: dict[str, str] | None = None,
+        fingerprints: dict[str, int] | None = None,
+        *,
+        max_distance: int = 6,
+    ):
+        self._seen = dict(seen or {})
+        self._fingerprints = SimHashIndex(max_distance)
+        for url, fingerprint in (fingerprints or {}).items():
+            self._fingerprints.add(fingerprint, url)
+        self.new: dict[str, str] = {}
+        self.new_fingerprints: dict[str, int] = {}
+        # Kept but not yet committed: canonical URL -> (digests, fingerprints)
+        self._pending: dict[str, tuple[dict[str, str], dict[str, int]]] = {}
+        self.mirrors: dict[str, list[str]] = {}
+        self.dropped = 0
+        self.collapsed = 0
+        self.clustered = 0
+
+    def filter(self, searches: list[dict]) -> list[dict]:
+        """Copy of ``searches`` without documents already seen; queries left empty are removed."""
+        kept: list[dict] = []
+        by_url: dict[str, dict] = {}
+        for entry in searches:
+            results = []
+            for r in entry.get("results", []):
+                url = canonicalize_url(r.get("url", ""))
+                text = " ".join((r.get("content") or "").split())
+                # Short snippets ("Page not found") are too generic to match across URLs
+                shared = len(text) >= _MIN_SHARED_TEXT
+                digest = _document_digest(text if shared else f"{url}\n{text}")
+                if digest in self._seen:
+                    self._add_mirror(self._seen[digest], url, r)
+                    self.dropped += 1
+                    continue
+                self._seen[digest] = url
+
+                if shared:
+                    fingerprint = r.get("page_fingerprint")
+                    if fingerprint is None:
+                        fingerprint = simhash(r.get("raw_content") or text)
+                    original = self._fingerprints.find(fingerprint)
+                    if original is not None and original != url:
+                        self._add_mirror(original, url, r)
+                        self.clustered += 1
+                        if original in self._pending:
+                            self._pending[original][0][digest] = url
+                        else:
+                            # The original was extracted in an earlier iteration
+                            self.new[digest] = url
+                        continue
+                    if original is None:
+                        self._fingerprints.add(fingerprint, url)
+                        self._pending.setdefault(url, ({}, {}))[1][url] = fingerprint
+                self._pending.setdefault(url, ({}, {}))[0][digest] = url
+
+                first = by_url.get(url) if url else None
+                if first is not None:
+                    first["content"] = f"{first.get('content') or ''}\n...\n{r.get('content') or ''}"
+                    self.collapsed += 1
+                    continue
+                r = dict(r)
+                if url:
+                    by_url[url] = r
+                results.append(r)
+            if results:
+                kept.append({**entry, "results": results})
+        return kept
+
+    def commit(self, searches: list[dict]) -> None:
+        """Record the documents in ``searches`` (as returned by ``filter``) as extracted."""
+        for entry in searches:
+            for r in entry.get("results", []):
+                pending = self._pending.pop(canonicalize_url(r.get("url", "")), None)
+                if pending is not None:
+                    self.new.update(pending[0])
+                    self.new_fingerprints.update(pending[1])
+
+    def _add_mirror(self, original: str, url: str, result: dict) -> None:
+        if not url or url == original:
+            return
+        mirrors = self.mirrors.setdefault(original, [])
+        if result["url"] not in mirrors:
+            mirrors.append(result["url"])
+
+
+_MIN_SHARED_TEXT = 200
+
+
+def _document_digest(text: str) -> str:
+    return hashlib.sha1(text.lower().encode("utf-8")).hexdigest()[:16]
+
+
+def search_cache_key(
+    kind: str, query: str, max_results: int, search_depth: str, include_raw_content: bool,
+) -> str:
+    return DiskCache.make_key(
+        kind, normalize_query(query), max_results, search_depth, include_raw_content,
+    )
+
+
+def normalize_results(response: dict) -> list[dict]:
+    """Flatten a raw Tavily response into the result dicts stored in search_history."""
+    return [
+        {
+            "title": r.get("title", ""),
+            "url": r.get("url", ""),
+            "content": r.get("content", ""),
+            "score": r.get("score", 0.0),
+            "raw_content": r.get("raw_content"),
+        }
+        for r in response.get("results", [])
+    ]
+
+
+_search_cache: DiskCache | None = None
+_search_cache_lock = threading.Lock()
+
+
+def get_search_cache() -> DiskCache | None:
+    """Process-wide search cache, or None when disabled in settings."""
+    global _search_cache
+    settings = get_settings()
+    if not settings.search_cache_enabled:
+        return None
+    with _search_cache_lock:
+        if _search_cache is None:
+            _search_cache = DiskCache(
+                settings.search_cache_path,
+                ttl_seconds=settings.search_cache_ttl_seconds,
+                max_entries=settings.search_cache_max_entries,
+            )
+    return _search_cache
+
+
+def search_cache_stats() -> dict:
+    return _search_cache.stats() if _search_cache is not None else {}
@@ -0,0 +1,159 @@
+"""Process-wide async Tavily search engine shared by all research jobs."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+
+import httpx
+
+from src.config.settings import get_settings
+from src.tools.search import get_search_cache, normalize_results, search_cache_key
+from src.utils.aio import BackgroundLoop
+from src.utils.disk_cache import DiskCache
+from src.utils.rate_limiter import RateLimiter, get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+
+
+class SearchEngine:
+    """Runs Tavily searches on one pooled keep-alive HTTP client.
+
+    All jobs submit queries to the same background event loop, so the number of
+    open sockets and in-flight requests is bounded process-wide by
+    ``max_connections`` and ``max_concurrency`` rather than per job.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        max_concurrency: int = 8,
+        max_connections: int = 10,
+        timeout: float = 30.0,
+        cache: DiskCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self._api_key = api_key
+        self._max_concurrency = max_concurrency
+        self._cache = cache
+        self._rate_limiter = rate_limiter
+        self._loop = BackgroundLoop("search-engine")
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            headers={"Authorization": f"Bearer {api_key}"},
+            transport=transport,
+        )
+        self._semaphore: asyncio.Semaphore | None = None
+        self._in_flight = 0
+        self._requests = 0
+
+    def submit(
+        self,
+        query: str,
+        max_results: int = 10,
+        search_depth: str = "advanced",
+        include_raw_content: bool = False,
+        *,
+        bypass_cache: bool = False,
+    ) -> Future:
+        """Schedule a search and return a future resolving to the normalized results."""
+        return self._loop.submit(
+            self._search(query, max_results, search_depth, include_raw_content, bypass_cache)
+        )
+
+    def search(self, query: str, **kwargs) -> list[dict]:
+        """Blocking search for synchronous callers."""
+        return self.submit(query, **kwargs).result()
+
+    async def asearch(self, query: str, **kwargs) -> list[dict]:
+        """Await a search from any event loop."""
+        return await asyncio.wrap_future(self.submit(query, **kwargs))
+
+    def stats(self) -> dict:
+        return {
+            "requests": self._requests,
+            "in_flight": self._in_flight,
+            "max_concurrency": self._max_concurrency,
+        }
+
+    def close(self) -> None:
+        self._loop.run(self._client.aclose())
+        self._loop.stop()
+
+    async def _search(
+        self,
+        query: str,
+        max_results: int,
+        search_depth: str,
+        include_raw_content: bool,
+        bypass_cache: bool,
+    ) -> list[dict]:
+        key = search_cache_key("search", query, max_results, search_depth, include_raw_content)
+        if self._cache is not None and not bypass_cache:
+            # DiskCache is SQLite; keep its I/O off the loop every job's searches share
+            cached = await asyncio.to_thread(self._cache.get, key)
+            if cached is not None:
+                logger.debug("Search cache hit for '%s'", query)
+                return cached
+
+        if self._rate_limiter is not None:
+            await self._rate_limiter.aacquire()
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async with self._semaphore:
+            self._in_flight += 1
+            self._requests += 1
+            try:
+                resp = await self._client.post(
+                    TAVILY_SEARCH_URL,
+                    json={
+                        "query": query,
+                        "max_results": max_results,
+                        "search_depth": search_depth,
+                        "include_raw_content": include_raw_content,
+                    },
+                )
+                resp.raise_for_status()
+            finally:
+                self._in_flight -= 1
+
+        results = normalize_results(resp.json())
+        if self._cache is not None:
+            await asyncio.to_thread(self._cache.set, key, results)
+        return results
+
+
+_engine: SearchEngine | None = None
+_engine_lock = threading.Lock()
+
+
+def get_search_engine() -> SearchEngine:
+    """Return the process-wide search engine, creating it on first use."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            settings = get_settings()
+            _engine = SearchEngine(
+                settings.tavily_api_key,
+                max_concurrency=settings.search_max_concurrency,
+                max_connections=settings.search_max_connections,
+                timeout=settings.search_timeout_seconds,
+                cache=get_search_cache(),
+                rate_limiter=get_rate_limiter("tavily"),
+            )
+    return _engine
+
+
+def search_engine_stats() -> dict:
+    return _engine.stats() if _engine is not None else {}
@@ -0,0 +1,36 @@
+"""Helpers for driving asyncio code from the synchronous graph nodes."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine
+
+
+class BackgroundLoop:
+    """An asyncio event loop running forever on a daemon thread.
+
+    Lets process-wide async resources (pooled HTTP clients, semaphores) be shared
+    by every job: sync callers submit coroutines and block on the returned future,
+    async callers await it from their own loop via ``asyncio.wrap_future``.
+    """
+
+    def __init__(self, name: str):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> Future:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run(self, coro: Coroutine[Any, Any, Any], timeout: float | None = None) -> Any:
+        return self.submit(coro).result(timeout)
+
+    def stop(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
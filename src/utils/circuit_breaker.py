@@ -0,0 +1,119 @@
+"""Per-provider circuit breakers for LLM calls."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from enum import Enum
+
+from src.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class BreakerState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Classic three-state breaker.
+
+    CLOSED: requests flow; ``failure_threshold`` consecutive provider failures trip it.
+    OPEN: requests are refused until ``recovery_timeout`` seconds have passed.
+    HALF_OPEN: a single probe request is let through; success closes the
+    breaker, failure re-opens it.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 3, recovery_timeout: float = 30.0):
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._state = BreakerState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._trips = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> BreakerState:
+        with self._lock:
+            return self._state
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self._state == BreakerState.CLOSED:
+                return True
+            if self._state == BreakerState.OPEN:
+                if time.monotonic() - self._opened_at < self._recovery_timeout:
+                    self._rejected += 1
+                    return False
+                self._state = BreakerState.HALF_OPEN
+                self._probe_in_flight = False
+                logger.info("Circuit %s half-open, probing", self.name)
+            if self._probe_in_flight:
+                self._rejected += 1
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != BreakerState.CLOSED:
+                logger.info("Circuit %s closed after successful probe", self.name)
+            self._state = BreakerState.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_inconclusive(self) -> None:
+        """An outcome that says nothing about the provider's health: free the probe slot, keep the counts."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == BreakerState.HALF_OPEN or self._failures >= self._failure_threshold:
+                if self._state != BreakerState.OPEN:
+                    self._trips += 1
+                    logger.warning(
+                        "Circuit %s opened after %d consecutive failures", self.name, self._failures,
+                    )
+                self._state = BreakerState.OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "state": self._state.value,
+                "consecutive_failures": self._failures,
+                "trips": self._trips,
+                "rejected": self._rejected,
+            }
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """Return the process-wide breaker for a provider, creating it on first use."""
+    with _breakers_lock:
+        if name not in _breakers:
+            settings = get_settings()
+            _breakers[name] = CircuitBreaker(
+                name,
+                failure_threshold=settings.breaker_failure_threshold,
+                recovery_timeout=settings.breaker_recovery_seconds,
+            )
+        return _breakers[name]
+
+
+def breaker_metrics() -> dict[str, dict]:
+    with _breakers_lock:
+        return {name: b.snapshot() for name, b in _breakers.items()}
@@ -0,0 +1,151 @@
+"""SQLite-backed key/value cache with TTL expiry and LRU eviction."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """Persistent JSON cache shared by every thread (and process) using the same file.
+
+    Entries expire ``ttl_seconds`` after they were written. When the cache grows
+    past ``max_entries`` (or ``max_bytes`` if set), the least recently read
+    entries are evicted first.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        ttl_seconds: float = 86400.0,
+        max_entries: int = 5000,
+        max_bytes: int | None = None,
+    ):
+        self._path = Path(path)
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed_at)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Hash arbitrary JSON-serializable parts into a stable cache key."""
+        raw = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value, or None on a miss or an expired entry."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            value, created_at = row
+            if now - created_at > self._ttl:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._conn.commit()
+                self._misses += 1
+                return None
+            self._conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self._hits += 1
+        return json.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        payload = json.dumps(value, default=str)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, payload, len(payload), now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+                "evictions": self._evictions,
+                "entries": entries,
+                "bytes": size,
+            }
+
+    def _evict(self) -> None:
+        """Drop expired entries, then least-recently-used ones until within bounds."""
+        cur = self._conn.execute(
+            "DELETE FROM entries WHERE created_at < ?", (time.time() - self._ttl,)
+        )
+        self._evictions += max(cur.rowcount, 0)
+
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+        if count > self._max_entries:
+            cur = self._conn.execute(
+                "DELETE FROM entries WHERE key IN ("
+                " SELECT key FROM entries ORDER BY accessed_at ASC LIMIT ?)",
+                (count - self._max_entries,),
+            )
+            self._evictions += max(cur.rowcount, 0)
+
+        if self._max_bytes is None:
+            return
+        (total,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        if total <= self._max_bytes:
+            return
+        excess = total - self._max_bytes
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM entries ORDER BY accessed_at ASC"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+        self._evictions += len(victims)
+        logger.debug("DiskCache %s evicted %d entries over byte budget", self._path.name, len(victims))
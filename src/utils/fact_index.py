@@ -0,0 +1,165 @@
+"""Near-duplicate fact index: MinHash signatures over claim tokens, bucketed with LSH."""
+
+from __future__ import annotations
+
+import random
+import zlib
+from collections import defaultdict
+from functools import lru_cache
+from typing import Iterable
+
+from src.utils.text import claim_id, normalize_claim
+
+# 16 bands x 4 rows: pairs at Jaccard 0.7 share a band with ~98% probability,
+# pairs at 0.3 with ~12%, so few non-duplicates reach the exact check.
+_BANDS = 16
+_ROWS = 4
+_PRIME = (1 << 61) - 1
+_rng = random.Random(20240601)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(_BANDS * _ROWS)
+]
+
+_STOPWORDS = frozenset(
+    "a an the of in on at to for and or is was are were be been being has have had "
+    "as by with from that this his her their its he she it they who which also".split()
+)
+
+
+def claim_tokens(claim: str) -> frozenset[str]:
+    """Content words of a normalized claim, the unit near-duplicates are compared on."""
+    return frozenset(t for t in normalize_claim(claim).split() if t not in _STOPWORDS)
+
+
+@lru_cache(maxsize=20_000)
+def minhash_signature(tokens: frozenset[str]) -> tuple[int, ...]:
+    hashes = [zlib.crc32(t.encode("utf-8")) for t in tokens] or [0]
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS)
+
+
+def jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def source_urls(fact: dict) -> list[str]:
+    """All source URLs of a fact, whether merged (``source_urls``) or as extracted."""
+    urls = fact.get("source_urls")
+    if urls:
+        return list(urls)
+    return [fact["source_url"]] if fact.get("source_url") else []
+
+
+class FactIndex:
+    """Per-job index that folds paraphrased duplicates into the fact already known.
+
+    Candidates come from LSH buckets over MinHash signatures, so a lookup touches
+    only the facts sharing a band rather than every fact. A candidate is a
+    duplicate when the Jaccard similarity of the content words reaches
+    ``threshold`` and both claims mention the same numbers (so "founded in
+    2005" never absorbs "founded in 2007").
+    """
+
+    def __init__(self, facts: Iterable[dict] = (), threshold: float = 0.7):
+        self._threshold = threshold
+        self._facts: dict[str, dict] = {}
+        self._tokens: dict[str, frozenset[str]] = {}
+        self._buckets: dict[tuple[int, tuple[int, ...]], list[str]] = defaultdict(list)
+        self._changed: dict[str, dict] = {}
+        self.added = 0
+        self.merged = 0
+        for fact in facts:
+            if isinstance(fact, dict) and fact.get("claim"):
+                self._insert(fact.get("fact_id") or claim_id(fact["claim"]), fact)
+
+    def __len__(self) -> int:
+        return len(self._facts)
+
+    def find(self, claim: str) -> dict | None:
+        """The indexed fact ``claim`` duplicates, if any."""
+        fact_id = self._find_id(claim)
+        return self._facts[fact_id] if fact_id is not None else None
+
+    def _find_id(self, claim: str) -> str | None:
+        fact_id = claim_id(claim)
+        if fact_id in self._facts:
+            return fact_id
+        tokens = claim_tokens(claim)
+        if not tokens:
+            return None
+        numbers = _numbers(tokens)
+        best, best_score = None, self._threshold
+        for candidate in self._candidates(tokens):
+            other = self._tokens[candidate]
+            if _numbers(other) != numbers:
+                continue
+            score = jaccard(tokens, other)
+            if score >= best_score:
+                best, best_score = candidate, score
+        return best
+
+    def add(self, fact: dict) -> dict | None:
+        """Index a newly extracted fact, or merge it into its near-duplicate.
+
+        Returns the new fact, the updated existing fact, or None when the fact
+        was a duplicate that brought no new source or entity.
+        """
+        existing_id = self._find_id(fact["claim"])
+        if existing_id is None:
+            fact_id = claim_id(fact["claim"])
+            fact["fact_id"] = fact_id
+            fact.setdefault("confidence", 0.5)
+            fact["source_urls"] = source_urls(fact)
+            fact["corroboration_count"] = max(1, len(fact["source_urls"]))
+            self._insert(fact_id, fact)
+            self._changed[fact_id] = fact
+            self.added += 1
+            return fact
+
+        existing = self._facts[existing_id]
+        urls = source_urls(existing)
+        new_urls = [u for u in source_urls(fact) if u not in urls]
+        entities = list(existing.get("entities") or [])
+        new_entities = [e for e in fact.get("entities") or [] if e not in entities]
+        if not new_urls and not new_entities:
+            return None
+
+        urls += new_urls
+        merged = {
+            **existing,
+            "fact_id": existing_id,
+            "source_urls": urls,
+            "entities": entities + new_entities,
+            "corroboration_count": max(1, len(urls)),
+        }
+        self._facts[existing_id] = merged
+        self._changed[existing_id] = merged
+        self.merged += 1
+        return merged
+
+    def changes(self) -> list[dict]:
+        """Facts added or updated since the index was built, latest version of each."""
+        return list(self._changed.values())
+
+    def _insert(self, fact_id: str, fact: dict) -> None:
+        tokens = claim_tokens(fact["claim"])
+        self._facts[fact_id] = fact
+        self._tokens[fact_id] = tokens
+        if not tokens:
+            return
+        signature = minhash_signature(tokens)
+        for band in range(_BANDS):
+            key = (band, signature[band * _ROWS:(band + 1) * _ROWS])
+            self._buckets[key].append(fact_id)
+
+    def _candidates(self, tokens: frozenset[str]) -> set[str]:
+        signature = minhash_signature(tokens)
+        candidates: set[str] = set()
+        for band in range(_BANDS):
+            candidates.update(self._buckets.get((band, signature[band * _ROWS:(band + 1) * _ROWS]), ()))
+        return candidates
+
+
+def _numbers(tokens: frozenset[str]) -> frozenset[str]:
+    return frozenset(t for t in tokens if any(c.isdigit() for c in t))
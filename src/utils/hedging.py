@@ -0,0 +1,183 @@
+"""Request hedging: race a duplicate request against a slow one, first response wins."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    TimeoutError as FuturesTimeoutError,
+    wait,
+)
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """Rolling window of recent latencies per key, for percentile-based hedge delays."""
+
+    def __init__(self, window: int = 200):
+        self._window = window
+        self._samples: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, seconds: float) -> None:
+        with self._lock:
+            self._samples.setdefault(key, deque(maxlen=self._window)).append(seconds)
+
+    def percentile(self, key: str, q: float, min_samples: int = 1) -> float | None:
+        """The ``q`` (0-1) latency percentile for ``key``, or None with too few samples."""
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if len(samples) < max(1, min_samples):
+            return None
+        idx = min(len(samples) - 1, max(0, math.ceil(q * len(samples)) - 1))
+        return samples[idx]
+
+
+class HedgeBudget:
+    """Caps hedges at ``ratio`` of all hedge-eligible calls (always allowing the first)."""
+
+    def __init__(self, ratio: float = 0.1):
+        self._ratio = ratio
+        self._calls = 0
+        self._hedges = 0
+        self._lock = threading.Lock()
+
+    def record_call(self) -> None:
+        with self._lock:
+            self._calls += 1
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self._hedges + 1 <= max(1.0, self._ratio * self._calls):
+                self._hedges += 1
+                return True
+            return False
+
+
+class HedgeStats:
+    """Counters of hedges fired and won, per key."""
+
+    def __init__(self):
+        self._fired: Counter = Counter()
+        self._won: Counter = Counter()
+        self._calls: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, key: str, fired: bool, won: bool) -> None:
+        with self._lock:
+            self._calls[key] += 1
+            self._fired[key] += int(fired)
+            self._won[key] += int(won)
+
+    def snapshot(self) -> dict[str, dict]:
+        with self._lock:
+            return {
+                key: {
+                    "calls": self._calls[key],
+                    "hedges_fired": self._fired[key],
+                    "hedges_won": self._won[key],
+                }
+                for key in self._calls
+            }
+
+
+def hedged_call(
+    primary: Callable[[], T],
+    hedge: Callable[[], T],
+    delay: float,
+    *,
+    executor: Executor,
+    budget: HedgeBudget,
+    on_primary_latency: Callable[[float], None] | None = None,
+) -> tuple[T, bool, bool]:
+    """Run ``primary``; if it has not finished after ``delay`` seconds, also run ``hedge``.
+
+    Returns ``(result, hedge_fired, hedge_won)``. The first successful result wins
+    and the other future is cancelled. A call that is already running on a thread
+    cannot be interrupted, so its result is simply discarded. If both fail, the
+    primary's exception is raised.
+    """
+    budget.record_call()
+    start = time.monotonic()
+    first = executor.submit(primary)
+
+    if on_primary_latency is not None:
+        def _record(f: Future) -> None:
+            if not f.cancelled() and f.exception() is None:
+                on_primary_latency(time.monotonic() - start)
+        first.add_done_callback(_record)
+
+    try:
+        return first.result(timeout=delay), False, False
+    except FuturesTimeoutError:
+        pass
+
+    if not budget.try_acquire():
+        return first.result(), False, False
+
+    second = executor.submit(hedge)
+    pending = {first, second}
+    error: BaseException | None = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for f in done:
+            if f.exception() is None:
+                for loser in pending:
+                    loser.cancel()
+                return f.result(), True, f is second
+            if f is first or error is None:
+                error = f.exception()
+    raise error
+
+
+async def ahedged_call(
+    primary: Callable[[], Awaitable[T]],
+    hedge: Callable[[], Awaitable[T]],
+    delay: float,
+    *,
+    budget: HedgeBudget,
+    on_primary_latency: Callable[[float], None] | None = None,
+) -> tuple[T, bool, bool]:
+    """Async ``hedged_call``: both calls are tasks on the running loop.
+
+    Unlike a call on a thread, the losing task is actually cancelled, so its
+    connection is released as soon as the other response arrives.
+    """
+    budget.record_call()
+    start = time.monotonic()
+    first = asyncio.ensure_future(primary())
+
+    if on_primary_latency is not None:
+        def _record(task: asyncio.Future) -> None:
+            if not task.cancelled() and task.exception() is None:
+                on_primary_latency(time.monotonic() - start)
+        first.add_done_callback(_record)
+
+    pending = {first}
+    try:
+        done, _ = await asyncio.wait(pending, timeout=delay)
+        if done or not budget.try_acquire():
+            return await first, False, False
+
+        second = asyncio.ensure_future(hedge())
+        pending.add(second)
+        error: BaseException | None = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result(), True, task is second
+                if task is first or error is None:
+                    error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
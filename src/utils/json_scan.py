@@ -0,0 +1,234 @@
+"""Single-pass tolerant scanner that pulls a JSON value out of free-form LLM output."""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+from typing import Any, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Outside any brackets only an opening bracket matters; prose is skipped in one search.
+_OPEN = re.compile(r"[\[{]")
+
+# Inside brackets: complete strings are consumed whole so their contents are never
+# mistaken for structure; bare words are candidates for key quoting / literal repair.
+_TOKEN = re.compile(
+    r"""
+    (?P<str>"[^"\\]*(?:\\.[^"\\]*)*")
+  | (?P<open_str>")
+  | (?P<open>[\[{])
+  | (?P<close>[\]}])
+  | (?P<comma>,)
+  | (?P<word>[A-Za-z_$][\w$]*)
+    """,
+    re.VERBOSE,
+)
+
+_DECODER = json.JSONDecoder(strict=False)
+_PAIRS = {"]": "[", "}": "{"}
+_CLOSERS = {"[": "]", "{": "}"}
+_PY_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_FAILED = object()
+
+
+def scan_json(text: str, *, partial: bool = False) -> Any | None:
+    """Return the largest JSON array or object embedded in ``text``, or None.
+
+    Jumps from one opening bracket to the next, skipping prose in between. Each
+    candidate is first decoded in place by the C decoder; only if that fails is
+    it walked token by token, tracking bracket depth and string boundaries,
+    quoting bare object keys (``{continue: true}``), dropping trailing commas
+    and mapping Python ``True``/``False``/``None`` to JSON before one more
+    ``json.loads``. Scanning resumes after each parsed value, and after a
+    failed one where its walk stopped, so every character is walked a bounded
+    number of times however unbalanced the text is.
+
+    With ``partial``, a value cut off before its closing bracket (e.g. an LLM
+    response that hit max tokens) is salvaged: see ``_salvage``. Without it, such
+    a value is rejected whole rather than replaced by one of its elements.
+    """
+    best: Any | None = None
+    best_len = -1
+    for value, length in _scan_values(text, 0, len(text), partial):
+        if length > best_len:
+            best, best_len = value, length
+    return best
+
+
+def _scan_values(text: str, pos: int, limit: int, partial: bool) -> Iterator[tuple[Any, int]]:
+    """Yield ``(value, span length)`` for each value parsed from ``text[pos:limit]``.
+
+    When a candidate fails, every bracket its walk saw open would fail the same
+    way (the token stream from it is a suffix of the one already walked), so only
+    the values the walk saw close are tried before resuming where it stopped.
+    """
+    while True:
+        m = _OPEN.search(text, pos, limit)
+        if m is None:
+            return
+        start = m.start()
+        nested: list[tuple[int, int]] = []
+        try:
+            value, end = _DECODER.raw_decode(text, start)
+        except (ValueError, RecursionError):
+            value, end = _scan_value(text, start, partial, nested)
+        if value is _FAILED:
+            for span_start, span_end in nested:
+                yield from _scan_values(text, span_start, span_end, False)
+        else:
+            yield value, end - start
+        pos = end
+
+
+def scan_outer_json(text: str) -> Any | None:
+    """Parse only the value opening at the first bracket in ``text``.
+
+    Unlike ``scan_json`` this never falls back to a nested value, so it returns
+    None when the outermost value is truncated or malformed.
+    """
+    m = _OPEN.search(text)
+    if m is None:
+        return None
+    try:
+        return _DECODER.raw_decode(text, m.start())[0]
+    except ValueError:
+        value, _ = _scan_value(text, m.start())
+    return None if value is _FAILED else value
+
+
+def _scan_value(
+    text: str, start: int, partial: bool = False, nested: list[tuple[int, int]] | None = None,
+) -> tuple[Any, int]:
+    """Repair and parse the bracketed value opening at ``start``.
+
+    Returns ``(value, end)``, or ``(_FAILED, stop)`` if the brackets never
+    balance or the repaired span is still not valid JSON, where ``stop`` is the
+    first position the walk did not account for. On failure ``nested`` receives
+    the outermost ``(start, end)`` spans that did balance inside the value,
+    unless the text ran out before it closed and ``partial`` is off.
+    While walking, it remembers the latest point at each depth where the value
+    could be cut and closed cleanly (after a complete element), for ``_salvage``.
+    """
+    stack: list[str] = []
+    opens: list[int] = []
+    closed: list[tuple[int, int]] = []
+    out: list[str] = []
+    last = start  # text[last:] has not been copied to ``out`` yet
+    prev_kind = ""
+    prev_end = start
+    cuts: dict[int, tuple[int, int, int, tuple[str, ...]]] = {}
+
+    for m in _TOKEN.finditer(text, start):
+        kind = m.lastgroup
+        tok_start = m.start()
+
+        if kind == "open_str":
+            # Unterminated string: the text was cut off inside it
+            stop = tok_start + 1
+            break
+        if kind == "open":
+            stack.append(m.group())
+            opens.append(tok_start)
+        elif kind == "close":
+            if not stack or stack[-1] != _PAIRS[m.group()]:
+                return _failed(m.end(), closed, nested)
+            if prev_kind == "comma" and _blank(text, prev_end, tok_start):
+                out.append(text[last:prev_end - 1])
+                last = prev_end
+            stack.pop()
+            opened = opens.pop()
+            if not stack:
+                end = m.end()
+                out.append(text[last:end])
+                try:
+                    return json.loads("".join(out), strict=False), end
+                except ValueError:
+                    return _failed(end, closed, nested)
+            closed.append((opened, m.end()))
+            if partial:
+                cuts[len(stack)] = (len(out), last, m.end(), tuple(stack))
+        elif kind == "comma":
+            if partial and not (prev_kind in ("open", "comma") and _blank(text, prev_end, tok_start)):
+                cuts[len(stack)] = (len(out), last, tok_start, tuple(stack))
+        elif kind == "word":
+            word = m.group()
+            if stack[-1] == "{" and prev_kind in ("open", "comma") and _blank(text, prev_end, tok_start):
+                out.append(text[last:tok_start])
+                out.append(f'"{word}"')
+                last = m.end()
+            elif word in _PY_LITERALS:
+                out.append(text[last:tok_start])
+                out.append(_PY_LITERALS[word])
+                last = m.end()
+
+        prev_kind = kind
+        prev_end = m.end()
+    else:
+        stop = len(text)
+
+    if partial and stack:
+        value, end = _salvage(text, start, out, stack, cuts)
+        if value is not _FAILED:
+            return value, end
+        # Junk before the array being cut may be what broke the repair; cut from the array itself
+        array = next((opens[i] for i, b in enumerate(stack) if b == "["), start)
+        if array != start:
+            value, end = _scan_value(text, array, partial=True)
+            if value is not _FAILED:
+                return value, end
+    # Truncated: its finished elements are only worth keeping when salvaging
+    return _failed(stop, closed if partial else [], nested)
+
+
+def _failed(
+    stop: int, closed: list[tuple[int, int]], nested: list[tuple[int, int]] | None,
+) -> tuple[Any, int]:
+    if nested is not None:
+        # Spans are recorded as they close, innermost first; keep only the outermost ones
+        last_end = -1
+        for span in sorted(closed):
+            if span[0] >= last_end:
+                nested.append(span)
+                last_end = span[1]
+    return _FAILED, stop
+
+
+def _salvage(
+    text: str,
+    start: int,
+    out: list[str],
+    stack: list[str],
+    cuts: dict[int, tuple[int, int, int, tuple[str, ...]]],
+) -> tuple[Any, int]:
+    """Close a truncated value after its last complete element.
+
+    The cut is taken in the outermost array still open at the truncation point
+    (or the top-level object if there is none), so an incomplete trailing fact
+    is dropped whole while every finished one, and every finished sibling
+    field of a wrapping object, is kept.
+    """
+    depth = next((i + 1 for i, b in enumerate(stack) if b == "["), 1)
+    candidates = [cut for d, cut in cuts.items() if d <= depth]
+    if not candidates:
+        return _FAILED, start
+    n_out, cut_last, cut_pos, open_stack = max(candidates, key=lambda c: c[2])
+    repaired = (
+        "".join(out[:n_out])
+        + text[cut_last:cut_pos]
+        + "".join(_CLOSERS[b] for b in reversed(open_stack))
+    )
+    try:
+        value = json.loads(repaired, strict=False)
+    except ValueError:
+        return _FAILED, start
+    logger.warning(
+        "Salvaged truncated JSON: kept %d of %d characters", cut_pos - start, len(text) - start,
+    )
+    # The rest of the text is the truncated tail; nothing after it can be complete
+    return value, len(text)
+
+
+def _blank(text: str, start: int, end: int) -> bool:
+    return start == end or text[start:end].isspace()
@@ -0,0 +1,89 @@
+"""Content-addressed on-disk cache for LLM responses."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any
+
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+
+from src.config.models import TaskType, TASK_CACHE_POLICY
+from src.config.settings import get_settings
+from src.utils.disk_cache import DiskCache
+from src.utils.text import ensure_str, is_complete_json
+
+logger = logging.getLogger(__name__)
+
+_llm_cache: DiskCache | None = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache(task: TaskType) -> DiskCache | None:
+    """Return the process-wide LLM cache if caching is enabled for ``task``."""
+    global _llm_cache
+    settings = get_settings()
+    if not settings.llm_cache_enabled or not TASK_CACHE_POLICY.get(task, False):
+        return None
+    with _llm_cache_lock:
+        if _llm_cache is None:
+            _llm_cache = DiskCache(
+                settings.llm_cache_path,
+                ttl_seconds=settings.llm_cache_ttl_seconds,
+                max_entries=1_000_000,
+                max_bytes=settings.llm_cache_max_mb * 1024 * 1024,
+            )
+    return _llm_cache
+
+
+def llm_cache_key(model_name: str, temperature: float, json_mode: bool, messages: Any) -> str:
+    """Hash of everything that determines the response: model, sampling params and prompt."""
+    return DiskCache.make_key(model_name, temperature, json_mode, _serialize_messages(messages))
+
+
+def load_response(cache: DiskCache, key: str) -> BaseMessage | None:
+    data = cache.get(key)
+    if data is None:
+        return None
+    try:
+        return messages_from_dict([data])[0]
+    except Exception as e:
+        logger.warning("Discarding unreadable LLM cache entry: %s", e)
+        cache.delete(key)
+        return None
+
+
+def store_response(cache: DiskCache, key: str, response: BaseMessage, *, json_mode: bool = False) -> None:
+    """Cache ``response`` unless it is empty or, for ``json_mode`` calls, not complete JSON.
+
+    A bad answer would otherwise be replayed for the whole TTL instead of retried.
+    """
+    content = ensure_str(response.content)
+    if not content.strip():
+        logger.debug("Not caching empty LLM response")
+        return
+    if json_mode and not is_complete_json(content):
+        logger.debug("Not caching LLM response that is not complete JSON")
+        return
+    try:
+        cache.set(key, message_to_dict(response))
+    except Exception as e:
+        logger.warning("Failed to cache LLM response: %s", e)
+
+
+def llm_cache_stats() -> dict:
+    return _llm_cache.stats() if _llm_cache is not None else {}
+
+
+def _serialize_messages(messages: Any) -> list:
+    if isinstance(messages, str):
+        return [["human", messages]]
+    serialized = []
+    for m in messages:
+        if isinstance(m, BaseMessage):
+            serialized.append([m.type, m.content])
+        elif isinstance(m, (tuple, list)) and len(m) == 2:
+            serialized.append([str(m[0]), m[1]])
+        else:
+            serialized.append(["unknown", str(m)])
+    return serialized
@@ -1,17 +1,53 @@
-"""Resilient LLM invocation with retry and cross-provider fallback."""
+"""Resilient LLM invocation with retry, circuit breaking and cross-provider fallback."""
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
 from typing import Any
 
+import httpx
+import openai
 from langchain_core.language_models import BaseChatModel
 
-from src.config.models import TaskType
+from src.config.models import (
+    TaskType,
+    ModelProvider,
+    TASK_MODEL_MAP,
+    FALLBACK_MODEL_MAP,
+    TASK_HEDGE_POLICY,
+)
+from src.config.settings import get_settings
 from src.models.router import ModelRouter
+from src.utils.circuit_breaker import BreakerState, get_breaker
+from src.utils.hedging import HedgeBudget, HedgeStats, LatencyTracker, ahedged_call, hedged_call
+from src.utils.llm_cache import get_llm_cache, llm_cache_key, load_response, store_response
+from src.utils.rate_limiter import get_rate_limiter
+from src.utils.text import ensure_str, estimate_tokens
 
 logger = logging.getLogger(__name__)
 
+# Error classes worth retrying on the same provider
+RETRYABLE_ERRORS = {"timeout", "rate_limit", "server_error", "connection", "parse_error"}
+# Error classes that indicate the provider itself is unhealthy (count toward the breaker)
+PROVIDER_ERRORS = {"timeout", "rate_limit", "server_error", "connection"}
+
+_error_counts: Counter = Counter()
+_error_lock = threading.Lock()
+
+_latencies = LatencyTracker()
+_hedge_stats = HedgeStats()
+_hedge_budget: HedgeBudget | None = None
+_hedge_executor: ThreadPoolExecutor | None = None
+_hedge_lock = threading.Lock()
+
 
 def resilient_invoke(
     router: ModelRouter,
@@ -24,30 +60,435 @@ def resilient_invoke(
     """Invoke an LLM with retry + cross-provider fallback.
 
     Strategy:
-    1. Call the primary model (from TASK_MODEL_MAP).
-    2. On any error, retry the primary model once.
-    3. If retry fails, fall back to the alternate provider.
-    4. If fallback also fails, return None.
+    1. Serve from the response cache if enabled for this task.
+    2. Call the primary model (from TASK_MODEL_MAP) unless its circuit is open.
+    3. On a retryable error (timeout, 429, 5xx, connection, parse), retry with
+       exponential backoff and jitter, honouring Retry-After, up to LLM_MAX_ATTEMPTS.
+    4. If the primary is unavailable or exhausted, fall back to the alternate
+       provider under the same policy.
+    5. If fallback also fails, return None.
+    Successful responses are written to the cache under the model that produced them.
+
+    When hedging is enabled for the task, a call still running past the task's
+    latency percentile is duplicated (same model or fallback, per LLM_HEDGE_TARGET)
+    and the first response wins. Every attempt first acquires the provider's
+    rate-limit bucket (requests and estimated prompt tokens).
+    """
+    cache = get_llm_cache(task)
+
+    def _key(provider: ModelProvider) -> str | None:
+        return _cache_key(cache, router, task, provider, temperature, json_mode, messages)
+
+    primary_provider = TASK_MODEL_MAP[task]
+    if cache is not None:
+        cached = load_response(cache, _key(primary_provider))
+        if cached is not None:
+            logger.info("LLM cache hit for %s", task.value)
+            return cached
+
+    primary = router.get_model(task, temperature=temperature, json_mode=json_mode)
+    hedge = _hedge_model(router, task, primary, temperature, json_mode)
+    response, served_by = _invoke_with_breaker(primary_provider, primary, messages, task, hedge)
+    if response is not None:
+        # A hedge to the fallback model may have won; cache under the model that answered
+        return _store(cache, _key(served_by), response, json_mode)
+
+    logger.warning("Primary provider exhausted for %s. Falling back...", task.value)
+    fallback_provider = FALLBACK_MODEL_MAP[primary_provider]
+    if cache is not None:
+        cached = load_response(cache, _key(fallback_provider))
+        if cached is not None:
+            return cached
+
+    fallback = router.get_fallback_model(task, temperature=temperature, json_mode=json_mode)
+    response, _ = _invoke_with_breaker(fallback_provider, fallback, messages, task)
+    if response is not None:
+        return _store(cache, _key(fallback_provider), response, json_mode)
+
+    logger.error("Fallback invoke failed for %s. Giving up.", task.value)
+    return None
+
+
+async def aresilient_invoke(
+    router: ModelRouter,
+    task: TaskType,
+    messages: Any,
+    *,
+    temperature: float = 0.0,
+    json_mode: bool = False,
+):
+    """Async ``resilient_invoke``, with the same cache, retry, breaker, hedging and fallback policy.
+
+    Calls go through the model's ``ainvoke`` and backoff and rate-limit waits
+    sleep on the event loop, so one thread can drive many jobs' calls at once.
+    Cache reads and writes (SQLite) run in worker threads so they never stall it.
     """
+    cache = get_llm_cache(task)
+
+    def _key(provider: ModelProvider) -> str | None:
+        return _cache_key(cache, router, task, provider, temperature, json_mode, messages)
+
+    primary_provider = TASK_MODEL_MAP[task]
+    if cache is not None:
+        cached = await asyncio.to_thread(load_response, cache, _key(primary_provider))
+        if cached is not None:
+            logger.info("LLM cache hit for %s", task.value)
+            return cached
+
     primary = router.get_model(task, temperature=temperature, json_mode=json_mode)
+    hedge = _hedge_model(router, task, primary, temperature, json_mode)
+    response, served_by = await _ainvoke_with_breaker(primary_provider, primary, messages, task, hedge)
+    if response is not None:
+        # A hedge to the fallback model may have won; cache under the model that answered
+        return await asyncio.to_thread(_store, cache, _key(served_by), response, json_mode)
+
+    logger.warning("Primary provider exhausted for %s. Falling back...", task.value)
+    fallback_provider = FALLBACK_MODEL_MAP[primary_provider]
+    if cache is not None:
+        cached = await asyncio.to_thread(load_response, cache, _key(fallback_provider))
+        if cached is not None:
+            return cached
+
+    fallback = router.get_fallback_model(task, temperature=temperature, json_mode=json_mode)
+    response, _ = await _ainvoke_with_breaker(fallback_provider, fallback, messages, task)
+    if response is not None:
+        return await asyncio.to_thread(_store, cache, _key(fallback_provider), response, json_mode)
+
+    logger.error("Fallback invoke failed for %s. Giving up.", task.value)
+    return None
+
+
+def classify_error(exc: BaseException) -> str:
+    """Map an invocation error to timeout, rate_limit, server_error, connection,
+    parse_error, client_error or unknown."""
+    if isinstance(exc, (openai.APITimeoutError, httpx.TimeoutException, TimeoutError)):
+        return "timeout"
+    status = _status_code(exc)
+    if isinstance(exc, openai.RateLimitError) or status == 429:
+        return "rate_limit"
+    if status is not None and status >= 500:
+        return "server_error"
+    if isinstance(exc, (openai.APIConnectionError, httpx.TransportError, ConnectionError)):
+        return "connection"
+    if isinstance(exc, (json.JSONDecodeError, ValueError)):
+        return "parse_error"
+    if status is not None and 400 <= status < 500:
+        return "client_error"
+    return "unknown"
 
-    # Attempt 1: primary
+
+def retry_after_seconds(exc: BaseException) -> float | None:
+    """Seconds requested by a Retry-After / retry-after-ms response header, if any."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    if headers.get("retry-after-ms"):
+        try:
+            return float(headers["retry-after-ms"]) / 1000
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if not value:
+        return None
     try:
-        return primary.invoke(messages)
-    except Exception as e:
-        logger.warning("Primary invoke failed for %s: %s. Retrying...", task.value, e)
+        return max(0.0, float(value))
+    except ValueError:
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+def backoff_delay(attempt: int, base: float, cap: float, retry_after: float | None = None) -> float:
+    """Exponential backoff with full jitter; a server-provided Retry-After wins (capped)."""
+    if retry_after is not None:
+        return min(cap, retry_after)
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def hedge_metrics() -> dict[str, dict]:
+    """Hedge-eligible calls, hedges fired and hedges won, per task."""
+    return _hedge_stats.snapshot()
+
+
+def llm_error_metrics() -> dict[str, dict[str, int]]:
+    """Error counts per provider and error class since process start."""
+    with _error_lock:
+        metrics: dict[str, dict[str, int]] = {}
+        for (provider, kind), count in _error_counts.items():
+            metrics.setdefault(provider, {})[kind] = count
+        return metrics
+
+
+def _invoke_with_breaker(
+    provider: ModelProvider,
+    model: BaseChatModel,
+    messages: Any,
+    task: TaskType,
+    hedge: tuple[ModelProvider, BaseChatModel] | None = None,
+) -> tuple[Any, ModelProvider]:
+    """The response (None once retries are exhausted) and the provider that produced it."""
+    breaker = get_breaker(provider.value)
+    if not breaker.allow_request():
+        logger.warning("Circuit for %s is open, skipping it for %s", provider.value, task.value)
+        return None, provider
+
+    attempts = get_settings().llm_max_attempts
+    for attempt in range(attempts):
+        try:
+            if hedge is not None:
+                response, served_by = _hedged_invoke(provider, model, hedge, messages, task)
+            else:
+                response, served_by = _call(provider, model, messages), provider
+        except Exception as e:
+            delay = _record_failure(provider, task, breaker, e, attempt, attempts)
+            if delay is None:
+                return None, provider
+            time.sleep(delay)
+        else:
+            _record_success(provider, served_by, breaker)
+            return response, served_by
+    return None, provider
+
+
+async def _ainvoke_with_breaker(
+    provider: ModelProvider,
+    model: BaseChatModel,
+    messages: Any,
+    task: TaskType,
+    hedge: tuple[ModelProvider, BaseChatModel] | None = None,
+) -> tuple[Any, ModelProvider]:
+    """The response (None once retries are exhausted) and the provider that produced it."""
+    breaker = get_breaker(provider.value)
+    if not breaker.allow_request():
+        logger.warning("Circuit for %s is open, skipping it for %s", provider.value, task.value)
+        return None, provider
+
+    attempts = get_settings().llm_max_attempts
+    for attempt in range(attempts):
+        try:
+            if hedge is not None:
+                response, served_by = await _ahedged_invoke(provider, model, hedge, messages, task)
+            else:
+                response, served_by = await _acall(provider, model, messages), provider
+        except Exception as e:
+            delay = _record_failure(provider, task, breaker, e, attempt, attempts)
+            if delay is None:
+                return None, provider
+            await asyncio.sleep(delay)
+        else:
+            _record_success(provider, served_by, breaker)
+            return response, served_by
+    return None, provider
+
+
+def _record_success(provider: ModelProvider, served_by: ModelProvider, breaker) -> None:
+    """Credit the provider that answered; a primary beaten by a fallback hedge counts as failing."""
+    if served_by == provider:
+        breaker.record_success()
+        return
+    get_breaker(served_by.value).record_success()
+    # Too slow to answer before the fallback did: a hanging primary must still trip its breaker
+    breaker.record_failure()
+
+
+def _record_failure(
+    provider: ModelProvider, task: TaskType, breaker, exc: Exception, attempt: int, attempts: int,
+) -> float | None:
+    """Count a failed attempt against the provider; return the backoff before retrying, or None to give up."""
+    kind = classify_error(exc)
+    with _error_lock:
+        _error_counts[(provider.value, kind)] += 1
+    if kind in PROVIDER_ERRORS or kind == "unknown":
+        breaker.record_failure()
+    else:
+        # The provider answered, but a request it rejected or a reply we could not
+        # parse says nothing about its health either way
+        breaker.record_inconclusive()
 
-    # Attempt 2: primary retry
+    last_attempt = attempt == attempts - 1
+    if last_attempt or kind not in RETRYABLE_ERRORS or breaker.state == BreakerState.OPEN:
+        logger.warning("%s invoke failed for %s (%s): %s", provider.value, task.value, kind, exc)
+        return None
+
+    settings = get_settings()
+    delay = backoff_delay(
+        attempt,
+        settings.llm_backoff_base_seconds,
+        settings.llm_backoff_max_seconds,
+        retry_after_seconds(exc),
+    )
+    logger.warning(
+        "%s invoke failed for %s (%s): %s. Retrying in %.1fs...",
+        provider.value, task.value, kind, exc, delay,
+    )
+    return delay
+
+
+def _call(provider: ModelProvider, model: BaseChatModel, messages: Any):
+    """Invoke ``model`` once under its provider's rate limit, then settle actual token usage."""
+    limiter = get_rate_limiter(provider.value)
+    if limiter is None:
+        return model.invoke(messages)
+    reserved = limiter.acquire(_estimate_prompt_tokens(messages)).tokens
     try:
-        return primary.invoke(messages)
-    except Exception as e:
-        logger.warning("Primary retry failed for %s: %s. Falling back...", task.value, e)
+        response = model.invoke(messages)
+    except BaseException:
+        # The failed call used no quota; give the reservation back before any retry
+        limiter.record_usage(-reserved)
+        raise
+    _settle_usage(limiter, response, reserved)
+    return response
 
-    # Attempt 3: fallback provider
+
+async def _acall(provider: ModelProvider, model: BaseChatModel, messages: Any):
+    """Async ``_call``: awaits the rate limit and ``ainvoke``."""
+    limiter = get_rate_limiter(provider.value)
+    if limiter is None:
+        return await model.ainvoke(messages)
+    reserved = (await limiter.aacquire(_estimate_prompt_tokens(messages))).tokens
     try:
-        fallback = router.get_fallback_model(task, temperature=temperature, json_mode=json_mode)
-        return fallback.invoke(messages)
-    except Exception as e:
-        logger.error("Fallback invoke failed for %s: %s. Giving up.", task.value, e)
+        response = await model.ainvoke(messages)
+    except BaseException:
+        # Also refunds a hedge loser cancelled mid-call; shielded so a second
+        # cancellation cannot drop the refund
+        await asyncio.shield(asyncio.to_thread(limiter.record_usage, -reserved))
+        raise
+    # A shared backend settles usage with a SQLite write; keep it off the loop
+    await asyncio.to_thread(_settle_usage, limiter, response, reserved)
+    return response
 
-    return None
+
+def _settle_usage(limiter, response, reserved: float) -> None:
+    """Charge the difference between the tokens the call used and those ``acquire`` reserved."""
+    usage = getattr(response, "usage_metadata", None) or {}
+    if usage.get("total_tokens"):
+        limiter.record_usage(usage["total_tokens"] - reserved)
+
+
+def _estimate_prompt_tokens(messages: Any) -> int:
+    if isinstance(messages, str):
+        return estimate_tokens(messages)
+    return sum(estimate_tokens(ensure_str(getattr(m, "content", m))) for m in messages)
+
+
+def _hedge_model(
+    router: ModelRouter, task: TaskType, primary: BaseChatModel, temperature: float, json_mode: bool,
+) -> tuple[ModelProvider, BaseChatModel] | None:
+    """The provider and model to race against a slow primary call, or None if hedging is off."""
+    settings = get_settings()
+    if not settings.llm_hedging_enabled or not TASK_HEDGE_POLICY.get(task, False):
+        return None
+    primary_provider = TASK_MODEL_MAP[task]
+    if settings.llm_hedge_target != "fallback":
+        return primary_provider, primary
+    fallback_provider = FALLBACK_MODEL_MAP[primary_provider]
+    if get_breaker(fallback_provider.value).state != BreakerState.CLOSED:
+        return None
+    fallback = router.get_fallback_model(task, temperature=temperature, json_mode=json_mode)
+    return fallback_provider, fallback
+
+
+def _hedged_invoke(
+    provider: ModelProvider,
+    model: BaseChatModel,
+    hedge: tuple[ModelProvider, BaseChatModel],
+    messages: Any,
+    task: TaskType,
+) -> tuple[Any, ModelProvider]:
+    """Race ``model`` against ``hedge``; return the winning response and the provider that sent it."""
+    global _hedge_executor
+    settings = get_settings()
+    with _hedge_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(
+                max_workers=settings.llm_hedge_max_workers, thread_name_prefix="llm-hedge",
+            )
+
+    delay = _hedge_delay(task)
+    response, fired, won = hedged_call(
+        lambda: _call(provider, model, messages),
+        lambda: _call(*hedge, messages),
+        delay,
+        executor=_hedge_executor,
+        budget=_get_hedge_budget(),
+        on_primary_latency=lambda seconds: _latencies.record(task.value, seconds),
+    )
+    _record_hedge(task, delay, fired, won)
+    return response, hedge[0] if won else provider
+
+
+async def _ahedged_invoke(
+    provider: ModelProvider,
+    model: BaseChatModel,
+    hedge: tuple[ModelProvider, BaseChatModel],
+    messages: Any,
+    task: TaskType,
+) -> tuple[Any, ModelProvider]:
+    """Async ``_hedged_invoke``."""
+    delay = _hedge_delay(task)
+    response, fired, won = await ahedged_call(
+        lambda: _acall(provider, model, messages),
+        lambda: _acall(*hedge, messages),
+        delay,
+        budget=_get_hedge_budget(),
+        on_primary_latency=lambda seconds: _latencies.record(task.value, seconds),
+    )
+    _record_hedge(task, delay, fired, won)
+    return response, hedge[0] if won else provider
+
+
+def _get_hedge_budget() -> HedgeBudget:
+    global _hedge_budget
+    with _hedge_lock:
+        if _hedge_budget is None:
+            _hedge_budget = HedgeBudget(get_settings().llm_hedge_budget_ratio)
+        return _hedge_budget
+
+
+def _hedge_delay(task: TaskType) -> float:
+    """Seconds to wait before hedging: the task's latency percentile once there are enough samples."""
+    settings = get_settings()
+    delay = _latencies.percentile(
+        task.value, settings.llm_hedge_percentile, settings.llm_hedge_min_samples,
+    )
+    return settings.llm_hedge_initial_delay_seconds if delay is None else delay
+
+
+def _record_hedge(task: TaskType, delay: float, fired: bool, won: bool) -> None:
+    _hedge_stats.record(task.value, fired, won)
+    if fired:
+        logger.info(
+            "Hedged %s call after %.1fs; %s request won",
+            task.value, delay, "hedge" if won else "primary",
+        )
+
+
+def _status_code(exc: BaseException) -> int | None:
+    status = getattr(exc, "status_code", None)
+    if isinstance(status, int):
+        return status
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def _cache_key(
+    cache, router: ModelRouter, task: TaskType, provider: ModelProvider,
+    temperature: float, json_mode: bool, messages: Any,
+) -> str | None:
+    """Cache key for a response from ``provider``'s model, as the task's primary or fallback."""
+    if cache is None:
+        return None
+    if provider == TASK_MODEL_MAP[task]:
+        model_name = router.get_provider(task).get_model_name()
+    else:
+        model_name = router.get_fallback_provider(task).get_model_name()
+    return llm_cache_key(model_name, temperature, json_mode, messages)
+
+
+def _store(cache, key: str | None, response, json_mode: bool):
+    if cache is not None and key is not None and response is not None:
+        store_response(cache, key, response, json_mode=json_mode)
+    return response
@@ -0,0 +1,225 @@
+"""Per-job BM25 index over passages of full page text (Tavily ``raw_content``)."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import threading
+from collections import Counter, OrderedDict
+from typing import NamedTuple
+
+from src.config.settings import get_settings
+from src.utils.relevance import BM25Ranker
+from src.utils.simhash import simhash
+from src.utils.text import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Lines with fewer words than this are menu entries, captions and the like, not
+# prose; passages need a few more to be worth ranking
+_MIN_LINE_WORDS = 4
+_MIN_PASSAGE_WORDS = 8
+
+
+class Passage(NamedTuple):
+    url: str
+    title: str
+    text: str
+
+
+def split_passages(text: str, max_words: int = 120) -> list[str]:
+    """Split page text into passages of at most ``max_words``, keeping paragraphs together.
+
+    Consecutive short paragraphs are packed into one passage; a paragraph
+    longer than ``max_words`` is cut into windows. Lines of only a few words
+    (navigation, bylines, button labels) are dropped.
+    """
+    passages: list[str] = []
+    current: list[str] = []
+    for line in re.split(r"\n+", text):
+        words = line.split()
+        if sum(any(c.isalpha() for c in w) for w in words) < _MIN_LINE_WORDS:
+            continue
+        if len(current) + len(words) > max_words and current:
+            passages.append(" ".join(current))
+            current = []
+        while len(words) > max_words:
+            passages.append(" ".join(words[:max_words]))
+            words = words[max_words:]
+        current.extend(words)
+    if current:
+        passages.append(" ".join(current))
+    return [p for p in passages if len(p.split()) >= _MIN_PASSAGE_WORDS]
+
+
+class PassageIndex:
+    """BM25 index of the passages of every page a job has fetched in full.
+
+    Feeding whole pages to the LLM is too expensive, so pages are split into
+    passages (``split_passages``) and only the best-matching few are pulled
+    for a query. Passages are deduplicated by content, so boilerplate shared
+    by pages of one site and syndicated copies are indexed once. ``take``
+    hands out each passage at most once, for the extractor; ``search``
+    only peeks, for prompts that just need context.
+    """
+
+    def __init__(self, max_words: int = 120):
+        self._max_words = max_words
+        self._ranker = BM25Ranker()
+        self._passages: list[Passage] = []
+        self._digests: set[str] = set()
+        self._urls: set[str] = set()
+        self._taken: set[int] = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._passages)
+
+    def add_document(self, url: str, title: str, text: str) -> int:
+        """Index a page's text; returns the number of new passages (0 if the URL is known)."""
+        with self._lock:
+            if not text or url in self._urls:
+                return 0
+            self._urls.add(url)
+            added = 0
+            for passage in split_passages(text, self._max_words):
+                digest = hashlib.sha1(passage.lower().encode("utf-8")).hexdigest()[:16]
+                if digest in self._digests:
+                    continue
+                self._digests.add(digest)
+                self._ranker.add(f"{title} {passage}")
+                self._passages.append(Passage(url, title, passage))
+                added += 1
+            return added
+
+    def search(
+        self,
+        query: dict[str, float],
+        k: int,
+        *,
+        gate: dict[str, float] | None = None,
+        min_score: float = 0.0,
+        max_per_url: int = 2,
+    ) -> list[Passage]:
+        """The ``k`` passages ranked best for ``query``, at most ``max_per_url`` from any page.
+
+        ``min_score`` applies to the 0-1 relevance against ``gate`` (``query``
+        itself by default), so a query padded with gap terms can still be
+        held to the target's own terms.
+        """
+        with self._lock:
+            return [self._passages[i] for i in self._top(query, k, gate, min_score, max_per_url, set())]
+
+    def take(
+        self,
+        query: dict[str, float],
+        k: int,
+        *,
+        gate: dict[str, float] | None = None,
+        min_score: float = 0.0,
+        max_per_url: int = 2,
+    ) -> list[Passage]:
+        """Like ``search``, but skips passages already taken and marks the returned ones taken."""
+        with self._lock:
+            top = self._top(query, k, gate, min_score, max_per_url, self._taken)
+            self._taken.update(top)
+            return [self._passages[i] for i in top]
+
+    def stats(self) -> dict:
+        return {"documents": len(self._urls), "passages": len(self._passages), "taken": len(self._taken)}
+
+    def _top(
+        self,
+        query: dict[str, float],
+        k: int,
+        gate: dict[str, float] | None,
+        min_score: float,
+        max_per_url: int,
+        exclude: set[int],
+    ) -> list[int]:
+        if not self._passages or k <= 0:
+            return []
+        scores = self._ranker.relevance(query)
+        gate_scores = self._ranker.relevance(gate) if gate is not None else scores
+        per_url: Counter = Counter()
+        top = []
+        for i in sorted(range(len(scores)), key=lambda i: -scores[i]):
+            if scores[i] <= 0:
+                break
+            if gate_scores[i] < min_score or i in exclude or per_url[self._passages[i].url] >= max_per_url:
+                continue
+            per_url[self._passages[i].url] += 1
+            top.append(i)
+            if len(top) == k:
+                break
+        return top
+
+
+def index_raw_content(index: PassageIndex | None, results: list[dict]) -> tuple[list[dict], dict]:
+    """Index the ``raw_content`` of search results and return the results without it.
+
+    Full page text is kept only in the job's passage index, never in graph
+    state; its SimHash stays on the result as ``page_fingerprint`` so
+    ``SeenDocuments`` can still match syndicated copies on the whole page.
+    Returns the stripped results and run_metrics.
+    """
+    passages = raw_tokens = 0
+    stripped = []
+    for r in results:
+        if "raw_content" not in r:
+            stripped.append(r)
+            continue
+        raw = r["raw_content"]
+        if raw and index is not None:
+            passages += index.add_document(r.get("url", ""), r.get("title", ""), raw)
+            raw_tokens += estimate_tokens(raw)
+        r = {k: v for k, v in r.items() if k != "raw_content"}
+        if raw:
+            r["page_fingerprint"] = simhash(raw)
+        stripped.append(r)
+    return stripped, {"passages_indexed": passages, "raw_content_tokens_indexed": raw_tokens}
+
+
+def passages_as_search(passages: list[Passage], label: str) -> dict:
+    """Passages in the ``{"query", "results"}`` shape of search_history, for the extraction prompt."""
+    return {
+        "query": label,
+        "results": [{"title": p.title, "url": p.url, "content": p.text} for p in passages],
+    }
+
+
+_indexes: OrderedDict[str, PassageIndex] = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def get_passage_index(job_id: str | None) -> PassageIndex | None:
+    """The job's passage index, created on first use; None when disabled or outside a job.
+
+    Indexes live in memory for the job's lifetime. Only the most recently used
+    PASSAGE_INDEX_MAX_JOBS are kept, in case a job ends without dropping its index.
+    """
+    settings = get_settings()
+    if not settings.passage_index_enabled or not job_id:
+        return None
+    with _indexes_lock:
+        index = _indexes.get(job_id)
+        if index is None:
+            index = _indexes[job_id] = PassageIndex(max_words=settings.passage_max_words)
+            while len(_indexes) > settings.passage_index_max_jobs:
+                evicted, _ = _indexes.popitem(last=False)
+                logger.info("Evicted passage index of job %s", evicted)
+        else:
+            _indexes.move_to_end(job_id)
+        return index
+
+
+def drop_passage_index(job_id: str) -> None:
+    with _indexes_lock:
+        _indexes.pop(job_id, None)
+
+
+def passage_index_stats() -> dict:
+    with _indexes_lock:
+        indexes = list(_indexes.values())
+    return {"jobs": len(indexes), "passages": sum(len(i) for i in indexes)}
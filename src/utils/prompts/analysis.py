@@ -45,3 +45,20 @@ Previously identified risks:
 
 Analyze all facts and identify NEW risk patterns, connections, inconsistencies, \
 and information gaps. Return a JSON object matching the schema defined above."""
+
+ANALYSIS_INCREMENTAL_USER_PROMPT = """Subject: {target_name}
+Context: {target_context}
+
+Analysis digest of the {analyzed_count} facts already analyzed:
+{analysis_digest}
+
+NEW facts since the last analysis ({new_fact_count} new, {fact_count} total; indices are global):
+{new_facts}
+
+Previously identified risks:
+{existing_risks}
+
+Analyze the NEW facts in light of the digest and identify NEW risk patterns, connections, \
+inconsistencies, and information gaps. Return a JSON object matching the schema defined above, \
+with one extra key "analysis_digest": an updated digest (at most 200 words) covering the \
+subject's profile, key entities, and risk themes across ALL facts so far."""
@@ -30,8 +30,14 @@ Key facts discovered so far:
 Key entities discovered so far:
 {discovered_entities}
 
+Information gaps from the latest analysis:
+{information_gaps}
+
+Excerpts from pages already fetched that bear on those gaps:
+{page_excerpts}
+
 Generate the next wave of 3-5 search queries to deepen the investigation. \
-Focus on areas not yet explored and follow up on newly discovered leads.
+Focus on areas not yet explored, close the information gaps, and follow up on newly discovered leads.
 
 JSON schema: ["<query string>", ...]"""
 
@@ -0,0 +1,266 @@
+"""Storage backends for rate-limit buckets: in-process, or shared by every process on a host."""
+
+from __future__ import annotations
+
+import os
+import socket
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import NamedTuple
+
+
+class TokenBucket:
+    """A token bucket that hands out reservations instead of blocking.
+
+    ``reserve`` deducts immediately, letting the balance go negative, and returns
+    how long the caller must wait before using what it reserved, along with the
+    amount actually deducted (requests larger than the bucket are capped).
+    Callers sleep outside any lock, and later callers queue behind earlier ones
+    in FIFO order.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_per_second: float,
+        tokens: float | None = None,
+        updated: float | None = None,
+    ):
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self.tokens = self.capacity if tokens is None else tokens
+        self.updated = time.time() if updated is None else updated
+
+    def reserve(self, amount: float, now: float | None = None) -> tuple[float, float]:
+        """Take ``amount`` tokens (capped at capacity); return the wait in seconds and the amount taken."""
+        self._refill(time.time() if now is None else now)
+        taken = min(amount, self.capacity)
+        self.tokens -= taken
+        if self.tokens >= 0:
+            return 0.0, taken
+        return -self.tokens / self.refill_per_second, taken
+
+    def adjust(self, amount: float, now: float | None = None) -> None:
+        """Debit (positive) or refund (negative) tokens without waiting."""
+        self._refill(time.time() if now is None else now)
+        self.tokens = min(self.capacity, self.tokens - amount)
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self.updated)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_second)
+        self.updated = now
+
+
+class BucketSpec(NamedTuple):
+    """Shape of one bucket of a limiter (e.g. ``requests`` or ``tokens``)."""
+
+    name: str
+    capacity: float
+    refill_per_second: float
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class RateLimitBackend(ABC):
+    """Where bucket balances live.
+
+    A backend must make ``reserve`` atomic across every process that shares it;
+    ``RateLimiter`` does the sleeping. Implementations for a networked store
+    (e.g. Redis with a Lua script) only need these four methods.
+    """
+
+    worker_id: str
+
+    @abstractmethod
+    def reserve(self, key: str, demands: list[tuple[BucketSpec, float]]) -> tuple[float, list[float]]:
+        """Atomically take each ``(bucket, amount)`` for ``key``.
+
+        Returns the longest wait and the amount taken from each bucket, in the
+        order of ``demands`` (an amount larger than the bucket is capped). Also
+        counts the acquisition (and any wait) towards this worker's usage.
+        """
+
+    @abstractmethod
+    def adjust(self, key: str, spec: BucketSpec, amount: float) -> None:
+        """Debit or refund ``amount`` on one bucket without waiting."""
+
+    @abstractmethod
+    def reset(self, key: str) -> None:
+        """Refill every bucket of ``key`` and forget its worker usage."""
+
+    @abstractmethod
+    def worker_usage(self, key: str) -> dict[str, dict]:
+        """Acquisitions and waits per worker for ``key``."""
+
+
+class LocalBackend(RateLimitBackend):
+    """Buckets held in process memory; limits apply to this process only."""
+
+    def __init__(self, worker_id: str | None = None):
+        self.worker_id = worker_id or default_worker_id()
+        self._buckets: dict[tuple[str, str], TokenBucket] = {}
+        self._usage: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, key: str, demands: list[tuple[BucketSpec, float]]) -> tuple[float, list[float]]:
+        with self._lock:
+            now = time.time()
+            delay, taken = 0.0, []
+            for spec, amount in demands:
+                wait, took = self._bucket(key, spec).reserve(amount, now)
+                delay = max(delay, wait)
+                taken.append(took)
+            usage = self._usage.setdefault(key, _empty_usage())
+            _count(usage, delay)
+            return delay, taken
+
+    def adjust(self, key: str, spec: BucketSpec, amount: float) -> None:
+        with self._lock:
+            self._bucket(key, spec).adjust(amount)
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            for bucket_key in [k for k in self._buckets if k[0] == key]:
+                del self._buckets[bucket_key]
+            self._usage.pop(key, None)
+
+    def worker_usage(self, key: str) -> dict[str, dict]:
+        with self._lock:
+            usage = self._usage.get(key)
+            return {self.worker_id: dict(usage)} if usage else {}
+
+    def _bucket(self, key: str, spec: BucketSpec) -> TokenBucket:
+        bucket = self._buckets.get((key, spec.name))
+        if bucket is None:
+            bucket = self._buckets[(key, spec.name)] = TokenBucket(
+                spec.capacity, spec.refill_per_second,
+            )
+        return bucket
+
+
+class SQLiteBackend(RateLimitBackend):
+    """Buckets in a SQLite file shared by every process on the host.
+
+    Each reservation is one ``BEGIN IMMEDIATE`` transaction, so SQLite's file lock
+    serializes reservations across uvicorn workers. Balances use wall-clock time,
+    which all processes agree on.
+    """
+
+    def __init__(self, path: str | Path, worker_id: str | None = None, active_seconds: float = 600.0):
+        self.worker_id = worker_id or default_worker_id()
+        self._path = Path(path)
+        self._active_seconds = active_seconds
+        self._lock = threading.Lock()
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self._path), check_same_thread=False, timeout=30.0, isolation_level=None,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            " key TEXT NOT NULL,"
+            " bucket TEXT NOT NULL,"
+            " tokens REAL NOT NULL,"
+            " updated_at REAL NOT NULL,"
+            " PRIMARY KEY (key, bucket))"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS workers ("
+            " key TEXT NOT NULL,"
+            " worker TEXT NOT NULL,"
+            " acquired INTEGER NOT NULL,"
+            " throttled INTEGER NOT NULL,"
+            " wait_seconds REAL NOT NULL,"
+            " last_seen REAL NOT NULL,"
+            " PRIMARY KEY (key, worker))"
+        )
+
+    def reserve(self, key: str, demands: list[tuple[BucketSpec, float]]) -> tuple[float, list[float]]:
+        with self._transaction():
+            now = time.time()
+            delay, taken = 0.0, []
+            for spec, amount in demands:
+                bucket = self._load(key, spec)
+                wait, took = bucket.reserve(amount, now)
+                delay = max(delay, wait)
+                taken.append(took)
+                self._save(key, spec, bucket)
+            self._conn.execute(
+                "INSERT INTO workers (key, worker, acquired, throttled, wait_seconds, last_seen)"
+                " VALUES (?, ?, 1, ?, ?, ?)"
+                " ON CONFLICT(key, worker) DO UPDATE SET"
+                " acquired = acquired + 1,"
+                " throttled = throttled + excluded.throttled,"
+                " wait_seconds = wait_seconds + excluded.wait_seconds,"
+                " last_seen = excluded.last_seen",
+                (key, self.worker_id, int(delay > 0), delay, now),
+            )
+        return delay, taken
+
+    def adjust(self, key: str, spec: BucketSpec, amount: float) -> None:
+        with self._transaction():
+            bucket = self._load(key, spec)
+            bucket.adjust(amount)
+            self._save(key, spec, bucket)
+
+    def reset(self, key: str) -> None:
+        with self._transaction():
+            self._conn.execute("DELETE FROM buckets WHERE key = ?", (key,))
+            self._conn.execute("DELETE FROM workers WHERE key = ?", (key,))
+
+    def worker_usage(self, key: str) -> dict[str, dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT worker, acquired, throttled, wait_seconds FROM workers"
+                " WHERE key = ? AND last_seen >= ?",
+                (key, time.time() - self._active_seconds),
+            ).fetchall()
+        return {
+            worker: {"acquired": acquired, "throttled": throttled, "wait_seconds": wait}
+            for worker, acquired, throttled, wait in rows
+        }
+
+    @contextmanager
+    def _transaction(self):
+        """Hold the host-wide SQLite write lock for the duration of the block."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _load(self, key: str, spec: BucketSpec) -> TokenBucket:
+        row = self._conn.execute(
+            "SELECT tokens, updated_at FROM buckets WHERE key = ? AND bucket = ?",
+            (key, spec.name),
+        ).fetchone()
+        if row is None:
+            return TokenBucket(spec.capacity, spec.refill_per_second)
+        return TokenBucket(spec.capacity, spec.refill_per_second, tokens=row[0], updated=row[1])
+
+    def _save(self, key: str, spec: BucketSpec, bucket: TokenBucket) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO buckets (key, bucket, tokens, updated_at) VALUES (?, ?, ?, ?)",
+            (key, spec.name, bucket.tokens, bucket.updated),
+        )
+
+
+def _empty_usage() -> dict:
+    return {"acquired": 0, "throttled": 0, "wait_seconds": 0.0}
+
+
+def _count(usage: dict, delay: float) -> None:
+    usage["acquired"] += 1
+    if delay > 0:
+        usage["throttled"] += 1
+        usage["wait_seconds"] += delay
@@ -1,29 +1,179 @@
-import time
+"""Token-bucket rate limiting for outbound API calls (search and LLM providers)."""
+
+from __future__ import annotations
+
+import asyncio
 import threading
+import time
+from typing import NamedTuple
+
+from src.config.settings import get_settings
+from src.utils.rate_limit_backends import (
+    BucketSpec,
+    LocalBackend,
+    RateLimitBackend,
+    SQLiteBackend,
+)
+
+
+class Reservation(NamedTuple):
+    """What an acquire cost: seconds waited and tokens taken from the token bucket."""
+
+    delay: float
+    tokens: float
 
 
 class RateLimiter:
-    """Token-bucket rate limiter for API calls."""
+    """Request (and optionally token) rate limiter for one API or provider.
+
+    Allows bursts of up to ``max_calls`` requests, refilled at
+    ``max_calls / period_seconds`` per second. With ``tokens_per_minute`` set, each
+    acquire also reserves its estimated token count from a second bucket holding
+    ``burst_seconds`` worth of tokens. ``acquire`` blocks the calling thread and
+    ``aacquire`` yields to the event loop; neither holds a lock while waiting.
 
-    def __init__(self, max_calls: int = 5, period_seconds: float = 10.0):
-        self._max_calls = max_calls
-        self._period = period_seconds
-        self._calls: list[float] = []
+    Bucket balances live in ``backend``: in process memory by default, or in a
+    store shared by every worker process (see ``SQLiteBackend``), in which case
+    the limit is enforced across all of them.
+    """
+
+    def __init__(
+        self,
+        max_calls: int = 5,
+        period_seconds: float = 10.0,
+        *,
+        tokens_per_minute: int | None = None,
+        burst_seconds: float = 10.0,
+        name: str = "default",
+        backend: RateLimitBackend | None = None,
+    ):
+        self.name = name
+        self._backend = backend if backend is not None else LocalBackend()
+        self._requests = BucketSpec("requests", max_calls, max_calls / period_seconds)
+        self._tokens: BucketSpec | None = None
+        if tokens_per_minute:
+            rate = tokens_per_minute / 60.0
+            self._tokens = BucketSpec("tokens", max(1.0, rate * burst_seconds), rate)
         self._lock = threading.Lock()
+        self._acquired = 0
+        self._throttled = 0
+        self._wait_seconds = 0.0
+
+    def acquire(self, tokens: int = 0) -> Reservation:
+        """Block until a request (and ``tokens`` tokens) may be spent.
+
+        The returned ``Reservation`` holds the seconds waited and the tokens
+        actually reserved, which is less than ``tokens`` when they exceed the
+        bucket; refunds and usage corrections should be made against the latter.
+        """
+        reservation = self._reserve(tokens)
+        if reservation.delay > 0:
+            time.sleep(reservation.delay)
+        return reservation
+
+    async def aacquire(self, tokens: int = 0) -> Reservation:
+        """Async ``acquire``: sleeps on the event loop instead of the thread.
+
+        The reservation itself runs in a worker thread, as a shared backend does
+        blocking I/O (a SQLite write transaction) that would stall the loop.
+        """
+        reservation = await asyncio.to_thread(self._reserve, tokens)
+        if reservation.delay > 0:
+            await asyncio.sleep(reservation.delay)
+        return reservation
 
     def wait(self) -> None:
-        with self._lock:
-            now = time.monotonic()
-            self._calls = [t for t in self._calls if now - t < self._period]
+        self.acquire()
 
-            if len(self._calls) >= self._max_calls:
-                sleep_time = self._period - (now - self._calls[0])
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
-                self._calls = [t for t in self._calls if time.monotonic() - t < self._period]
+    def record_usage(self, tokens: float) -> None:
+        """Correct the token bucket once the real usage of a call is known.
 
-            self._calls.append(time.monotonic())
+        ``tokens`` is the difference between actual and reserved tokens; negative
+        values refund an over-estimate.
+        """
+        if self._tokens is None or not tokens:
+            return
+        self._backend.adjust(self.name, self._tokens, tokens)
 
     def reset(self) -> None:
+        self._backend.reset(self.name)
+        with self._lock:
+            self._acquired = self._throttled = 0
+            self._wait_seconds = 0.0
+
+    def stats(self) -> dict:
+        """This process's counters plus each active worker's share of acquisitions."""
+        workers = self._backend.worker_usage(self.name)
+        total = sum(w["acquired"] for w in workers.values())
         with self._lock:
-            self._calls.clear()
+            return {
+                "acquired": self._acquired,
+                "throttled": self._throttled,
+                "wait_seconds": round(self._wait_seconds, 3),
+                "worker_id": self._backend.worker_id,
+                "workers": {
+                    worker: {
+                        **usage,
+                        "wait_seconds": round(usage["wait_seconds"], 3),
+                        "share": round(usage["acquired"] / total, 3) if total else 0.0,
+                    }
+                    for worker, usage in workers.items()
+                },
+            }
+
+    def _reserve(self, tokens: int) -> Reservation:
+        demands = [(self._requests, 1)]
+        if self._tokens is not None and tokens > 0:
+            demands.append((self._tokens, tokens))
+        delay, taken = self._backend.reserve(self.name, demands)
+        with self._lock:
+            self._acquired += 1
+            if delay > 0:
+                self._throttled += 1
+                self._wait_seconds += delay
+        return Reservation(delay, taken[1] if len(taken) > 1 else 0.0)
+
+
+_limiters: dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+_backend: RateLimitBackend | None = None
+
+
+def get_rate_limit_backend() -> RateLimitBackend:
+    """The backend chosen by RATE_LIMIT_BACKEND (``sqlite`` shares quota across processes)."""
+    global _backend
+    if _backend is None:
+        settings = get_settings()
+        if settings.rate_limit_backend == "sqlite":
+            _backend = SQLiteBackend(settings.rate_limit_path)
+        else:
+            _backend = LocalBackend()
+    return _backend
+
+
+def get_rate_limiter(name: str) -> RateLimiter | None:
+    """Return the process-wide limiter for ``tavily``, ``openai`` or ``gemini``.
+
+    Returns None when the bucket has no requests-per-minute limit configured.
+    """
+    with _limiters_lock:
+        if name not in _limiters:
+            settings = get_settings()
+            rpm = getattr(settings, f"{name}_rpm", 0)
+            if not rpm:
+                return None
+            burst = settings.rate_limit_burst_seconds
+            _limiters[name] = RateLimiter(
+                max(1, round(rpm * burst / 60)),
+                burst,
+                tokens_per_minute=getattr(settings, f"{name}_tpm", 0) or None,
+                burst_seconds=burst,
+                name=name,
+                backend=get_rate_limit_backend(),
+            )
+        return _limiters[name]
+
+
+def rate_limiter_stats() -> dict[str, dict]:
+    with _limiters_lock:
+        return {name: limiter.stats() for name, limiter in _limiters.items()}
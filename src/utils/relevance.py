@@ -0,0 +1,134 @@
+"""In-process BM25 ranking of search results against the research target."""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from typing import Any, Iterable, Mapping
+
+_WORD = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an the of in on at to for and or is was are were be been has have had as by with "
+    "from that this it its his her their he she they who which also not but about into "
+    "inc llc ltd co corp company".split()
+)
+
+# Query term weights: the name must match, context disambiguates, entities found
+# so far pull in related pages (companies, associates) the name alone would miss.
+NAME_WEIGHT = 3.0
+CONTEXT_WEIGHT = 1.0
+ENTITY_WEIGHT = 0.5
+
+
+def tokenize(text: str) -> list[str]:
+    return [t for t in _WORD.findall(text.lower()) if t not in _STOPWORDS and len(t) > 1]
+
+
+def build_query(target_name: str, target_context: str = "", entities: Iterable[str] = ()) -> dict[str, float]:
+    """Weighted query terms for a target; each term keeps its highest weight."""
+    query: dict[str, float] = {}
+    for text, weight in [(" ".join(entities), ENTITY_WEIGHT), (target_context, CONTEXT_WEIGHT),
+                         (target_name, NAME_WEIGHT)]:
+        for term in tokenize(text):
+            query[term] = max(weight, query.get(term, 0.0))
+    return query
+
+
+def relevance_query(state: Mapping[str, Any], max_entities: int = 20) -> dict[str, float]:
+    """BM25 query for a job's target: its name, context and the entities most often found so far."""
+    entities = Counter(e for f in state.get("extracted_facts", []) for e in f.get("entities") or [])
+    return build_query(
+        state["target_name"],
+        state.get("target_context", ""),
+        [e for e, _ in entities.most_common(max_entities)],
+    )
+
+
+def gap_query(state: Mapping[str, Any]) -> dict[str, float]:
+    """BM25 query for what is still missing: the target query plus the analyzer's information gaps."""
+    query = relevance_query(state)
+    for term in tokenize(" ".join(state.get("information_gaps") or [])):
+        query[term] = max(query.get(term, 0.0), CONTEXT_WEIGHT)
+    return query
+
+
+class BM25Ranker:
+    """Okapi BM25 over a batch of documents, scored term-at-a-time from an inverted index.
+
+    Only the postings of the query's terms are touched, so scoring a few
+    hundred snippets against a 20-term query takes well under a millisecond
+    per term. ``relevance`` normalizes each score by the best achievable one
+    (every query term present at saturating frequency), giving a 0-1 value
+    that can be thresholded independently of batch size. Documents can also
+    be added one at a time with ``add``; length normalization is recomputed
+    on the next query.
+    """
+
+    def __init__(self, documents: Iterable[str] = (), k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._n = 0
+        self._postings: dict[str, list[tuple[int, int]]] = {}
+        self._lengths: list[int] = []
+        self._total_length = 0
+        self._norms: list[float] | None = None
+        for doc in documents:
+            self.add(doc)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def add(self, document: str) -> int:
+        """Index one more document; returns its position in score lists."""
+        i = self._n
+        terms = tokenize(document)
+        for term, tf in Counter(terms).items():
+            self._postings.setdefault(term, []).append((i, tf))
+        self._lengths.append(len(terms))
+        self._total_length += len(terms)
+        self._n += 1
+        self._norms = None
+        return i
+
+    def _length_norms(self) -> list[float]:
+        # Per-document length normalization: k1 * (1 - b + b * len / avg)
+        if self._norms is None:
+            avg = self._total_length / self._n if self._n else 0.0
+            k1, b = self.k1, self.b
+            self._norms = [k1 * (1 - b + b * (n / avg if avg else 0.0)) for n in self._lengths]
+        return self._norms
+
+    def idf(self, term: str) -> float:
+        df = len(self._postings.get(term, ()))
+        return math.log(1 + (self._n - df + 0.5) / (df + 0.5))
+
+    def scores(self, query: dict[str, float]) -> list[float]:
+        scores = [0.0] * self._n
+        norms = self._length_norms()
+        k1p1 = self.k1 + 1
+        for term, weight in query.items():
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            w = weight * self.idf(term)
+            for i, tf in postings:
+                scores[i] += w * tf * k1p1 / (tf + norms[i])
+        return scores
+
+    def relevance(self, query: dict[str, float]) -> list[float]:
+        best = sum(weight * self.idf(term) * (self.k1 + 1) for term, weight in query.items())
+        if best <= 0:
+            return [0.0] * self._n
+        return [s / best for s in self.scores(query)]
+
+
+def result_text(result: dict) -> str:
+    return f"{result.get('title') or ''} {result.get('url') or ''} {result.get('content') or ''}"
+
+
+def rank_results(results: list[dict], query: dict[str, float]) -> list[float]:
+    """0-1 relevance of each search result (title, URL and snippet) to ``query``."""
+    if not results:
+        return []
+    return BM25Ranker([result_text(r) for r in results]).relevance(query)
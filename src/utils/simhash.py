@@ -0,0 +1,67 @@
+"""64-bit SimHash fingerprints for spotting near-identical text (syndicated articles, press releases)."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+
+_BITS = 64
+# Eight 8-bit bands: by pigeonhole, fingerprints within 7 bits agree exactly on one band
+_BANDS = 8
+_BAND_BITS = _BITS // _BANDS
+_BAND_MASK = (1 << _BAND_BITS) - 1
+MAX_DISTANCE = _BANDS - 1
+
+_WORD = re.compile(r"\w+")
+
+
+def simhash(text: str, shingle: int = 2) -> int:
+    """Fingerprint of ``text`` over word ``shingle``-grams; similar texts differ in few bits."""
+    words = _WORD.findall(text.lower())
+    if len(words) < shingle:
+        features = [" ".join(words)] if words else []
+    else:
+        features = [" ".join(words[i:i + shingle]) for i in range(len(words) - shingle + 1)]
+
+    weights = [0] * _BITS
+    for feature in features:
+        h = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(_BITS):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    return sum(1 << bit for bit, w in enumerate(weights) if w > 0)
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+class SimHashIndex:
+    """Fingerprints bucketed by band, so a lookup only compares against texts sharing one.
+
+    ``max_distance`` may be at most 7 (``MAX_DISTANCE``); within that, no
+    near-duplicate is missed. Unrelated texts sit around 32 bits apart.
+    """
+
+    def __init__(self, max_distance: int = MAX_DISTANCE):
+        if not 0 <= max_distance <= MAX_DISTANCE:
+            raise ValueError(f"max_distance must be between 0 and {MAX_DISTANCE}")
+        self._max_distance = max_distance
+        self._buckets: dict[tuple[int, int], list[tuple[int, str]]] = {}
+
+    def add(self, fingerprint: int, key: str) -> None:
+        for band in _bands(fingerprint):
+            self._buckets.setdefault(band, []).append((fingerprint, key))
+
+    def find(self, fingerprint: int) -> str | None:
+        """Key of the closest indexed fingerprint within ``max_distance``, if any."""
+        best, best_distance = None, self._max_distance + 1
+        for band in _bands(fingerprint):
+            for other, key in self._buckets.get(band, ()):
+                distance = hamming(fingerprint, other)
+                if distance < best_distance:
+                    best, best_distance = key, distance
+        return best
+
+
+def _bands(fingerprint: int) -> list[tuple[int, int]]:
+    return [(i, fingerprint >> (i * _BAND_BITS) & _BAND_MASK) for i in range(_BANDS)]
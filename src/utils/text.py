@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import re
 
+from src.utils.json_scan import scan_json, scan_outer_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -49,6 +52,21 @@ def ensure_str(content) -> str:
     return str(content)
 
 
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token) used for prompt budgeting."""
+    return (len(text) + 3) // 4
+
+
+def normalize_claim(claim: str) -> str:
+    """Case-, punctuation- and whitespace-insensitive form of a claim, used for dedup."""
+    return " ".join(re.sub(r"[^\w\s]", " ", claim.lower()).split())
+
+
+def claim_id(claim: str) -> str:
+    """Stable short ID for a fact, derived from its normalized claim."""
+    return hashlib.sha1(normalize_claim(claim).encode("utf-8")).hexdigest()[:16]
+
+
 def strip_code_fences(content) -> str:
     """Normalize content to string and remove markdown code fences if present."""
     text = ensure_str(content).strip()
@@ -57,41 +75,16 @@ def strip_code_fences(content) -> str:
     return text.strip()
 
 
-def _fix_unquoted_keys(text: str) -> str:
-    """Attempt to fix JSON with unquoted keys like {continue: true}."""
-    return re.sub(
-        r'(?<=[{,])\s*(\w+)\s*:',
-        r' "\1":',
-        text,
-    )
-
-
-def _extract_json_block(text: str):
-    """Try to find a JSON array or object embedded in free-form text."""
-    for pattern in [
-        r'(\[[\s\S]*\])',  # outermost [...] 
-        r'(\{[\s\S]*\})',  # outermost {...}
-    ]:
-        m = re.search(pattern, text)
-        if m:
-            candidate = m.group(1)
-            try:
-                return json.loads(candidate)
-            except json.JSONDecodeError:
-                try:
-                    return json.loads(_fix_unquoted_keys(candidate))
-                except json.JSONDecodeError:
-                    continue
-    return None
-
-
-def robust_json_loads(content, *, context: str = ""):
+def robust_json_loads(content, *, context: str = "", partial: bool = False):
     """Best-effort parse of LLM output into a Python object.
 
     Tries, in order:
     1. Direct json.loads after stripping code fences
-    2. Fixing unquoted keys then json.loads
-    3. Regex extraction of JSON array/object from surrounding prose
+    2. A single tolerant scan (see ``scan_json``) that finds the outermost JSON
+       array/object in surrounding prose, fixing unquoted keys and trailing
+       commas on the way
+    With ``partial``, output truncated mid-value (e.g. at max tokens) keeps
+    every complete element instead of failing outright.
     Returns the parsed object, or None on failure (with debug logging).
     """
     text = strip_code_fences(content)
@@ -102,14 +95,8 @@ def robust_json_loads(content, *, context: str = ""):
     except (json.JSONDecodeError, TypeError):
         pass
 
-    # 2. Fix unquoted keys
-    try:
-        return json.loads(_fix_unquoted_keys(text))
-    except (json.JSONDecodeError, TypeError):
-        pass
-
-    # 3. Regex extraction from surrounding narrative
-    extracted = _extract_json_block(text)
+    # 2. Tolerant scan of the surrounding narrative
+    extracted = scan_json(text, partial=partial)
     if extracted is not None:
         return extracted
 
@@ -119,3 +106,13 @@ def robust_json_loads(content, *, context: str = ""):
         text[:500],
     )
     return None
+
+
+def is_complete_json(content) -> bool:
+    """Whether the outermost JSON value in an LLM response is complete, not cut off or malformed."""
+    text = strip_code_fences(content)
+    try:
+        json.loads(text)
+        return True
+    except (json.JSONDecodeError, TypeError):
+        return scan_outer_json(text) is not None
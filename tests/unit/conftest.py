@@ -0,0 +1,23 @@
+import pytest
+
+from src.config import settings as settings_module
+from src.utils import circuit_breaker, rate_limiter
+
+
+@pytest.fixture
+def configure(monkeypatch):
+    """Settings with test API keys, rebuilt from the environment, and no shared limiters or breakers.
+
+    Returns a function that sets more environment variables and rebuilds the
+    settings again, for per-file and per-test overrides.
+    """
+    def _configure(**env: str) -> None:
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        monkeypatch.setattr(settings_module, "_settings", None)
+
+    _configure(OPENROUTER_API_KEY="test-key", TAVILY_API_KEY="test-key", RATE_LIMIT_BACKEND="local")
+    monkeypatch.setattr(circuit_breaker, "_breakers", {})
+    monkeypatch.setattr(rate_limiter, "_limiters", {})
+    monkeypatch.setattr(rate_limiter, "_backend", None)
+    return _configure
@@ -0,0 +1,118 @@
+import json
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from src.graphs.nodes import analyzer
+
+TARGET = "Jane Roe"
+
+
+def _facts(n: int) -> list[dict]:
+    return [
+        {"fact_id": f"f{i}", "claim": f"{TARGET} fact number {i}", "category": "professional",
+         "source_url": f"https://example.com/{i}", "entities": [TARGET, f"Org {i}"], "confidence": 0.6}
+        for i in range(n)
+    ]
+
+
+def _state(facts: list[dict], analyzed: int = 0, digest: str = "") -> dict:
+    return {
+        "target_name": TARGET, "target_context": "executive", "extracted_facts": facts,
+        "risk_flags": [], "analyzed_fact_count": analyzed, "analysis_digest": digest,
+    }
+
+
+class _Invoke:
+    """Stands in for resilient_invoke; records prompts and returns a canned response."""
+
+    def __init__(self, body: dict | None):
+        self.body = body
+        self.prompts: list[str] = []
+
+    def __call__(self, router, task, messages, **kwargs):
+        self.prompts.append(messages[-1].content)
+        return None if self.body is None else AIMessage(content=json.dumps(self.body))
+
+
+@pytest.fixture
+def invoke(monkeypatch, configure):
+    configure(INCREMENTAL_ANALYSIS="true")
+    monkeypatch.setattr(analyzer, "get_model_router", lambda: None)
+
+    def _install(body: dict | None) -> _Invoke:
+        stub = _Invoke(body)
+        monkeypatch.setattr(analyzer, "resilient_invoke", stub)
+        return stub
+
+    return _install
+
+
+ANALYSIS = {
+    "risk_flags": [{"risk_category": "legal", "severity": "low", "description": "Old lawsuit"}],
+    "connections": [{"source_entity": TARGET, "target_entity": "Org 1", "relationship": "EMPLOYED_BY"}],
+    "information_gaps": ["education", ""],
+    "analysis_digest": "Career facts, one legal matter.",
+}
+
+
+class TestAnalyzerNode:
+    def test_first_pass_sends_all_facts_and_sets_watermark(self, invoke):
+        stub = invoke(ANALYSIS)
+        update = analyzer.analyzer_node(_state(_facts(3)))
+        assert len(stub.prompts) == 1
+        assert all(f"fact number {i}" in stub.prompts[0] for i in range(3))
+        assert update["analyzed_fact_count"] == 3
+        assert update["analysis_digest"] == "Career facts, one legal matter."
+        assert update["information_gaps"] == ["education"]
+        assert update["run_metrics"]["analyzer_tokens_saved"] == 0
+        assert len(update["risk_flags"]) == 1
+        assert update["connections"][0]["target_entity"] == "Org 1"
+
+    def test_incremental_sends_only_new_facts(self, invoke):
+        stub = invoke(ANALYSIS)
+        update = analyzer.analyzer_node(_state(_facts(5), analyzed=3, digest="Earlier digest"))
+        prompt = stub.prompts[0]
+        assert "Earlier digest" in prompt
+        assert "fact number 3" in prompt and "fact number 4" in prompt
+        assert "fact number 0" not in prompt
+        assert update["analyzed_fact_count"] == 5
+        assert update["run_metrics"]["analyzer_tokens_saved"] > 0
+
+    def test_no_new_facts_skips_llm_call(self, invoke):
+        stub = invoke(ANALYSIS)
+        update = analyzer.analyzer_node(_state(_facts(3), analyzed=3, digest="Earlier digest"))
+        assert stub.prompts == []
+        assert update["risk_flags"] == [] and update["connections"] == []
+        assert "analyzed_fact_count" not in update
+        assert update["run_metrics"]["analyzer_tokens_saved"] > 0
+
+    def test_failed_call_keeps_watermark(self, invoke):
+        stub = invoke(None)
+        update = analyzer.analyzer_node(_state(_facts(5), analyzed=3, digest="Earlier digest"))
+        assert len(stub.prompts) == 1
+        assert "analyzed_fact_count" not in update
+        assert "analysis_digest" not in update
+        assert update["risk_flags"] == []
+
+    def test_full_analysis_when_incremental_disabled(self, invoke, configure):
+        configure(INCREMENTAL_ANALYSIS="false")
+        stub = invoke(ANALYSIS)
+        analyzer.analyzer_node(_state(_facts(5), analyzed=3, digest="Earlier digest"))
+        assert "fact number 0" in stub.prompts[0]
+
+
+class TestDigestRollover:
+    def test_llm_digest_replaces_previous_and_is_capped(self, invoke):
+        invoke({**ANALYSIS, "analysis_digest": "x" * 5000})
+        update = analyzer.analyzer_node(_state(_facts(4), analyzed=2, digest="Earlier digest"))
+        assert update["analysis_digest"] == "x" * analyzer._DIGEST_MAX_CHARS
+
+    def test_digest_built_from_state_when_llm_gives_none(self, invoke):
+        invoke({key: value for key, value in ANALYSIS.items() if key != "analysis_digest"})
+        update = analyzer.analyzer_node(_state(_facts(4), analyzed=2, digest="Earlier digest"))
+        digest = update["analysis_digest"]
+        assert "professional (4)" in digest
+        assert TARGET in digest
+        assert "legal/low: Old lawsuit" in digest
+        assert len(digest) <= analyzer._DIGEST_MAX_CHARS
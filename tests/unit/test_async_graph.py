@@ -0,0 +1,174 @@
+import asyncio
+import json
+import re
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from src.config.models import TaskType
+from src.graphs.nodes import analyzer, extractor, pipeline, planner, reporter, scorer, searcher, validator
+from src.graphs.research_graph import build_research_graph
+
+TARGET = "Jane Roe"
+# Per wave of queries, the finding each query's results yield
+FINDINGS = {
+    "Jane Roe career history": "founded a logistics startup in Denver during 2009",
+    "Jane Roe board seats": "joined the Acme Corp board of directors",
+    "Jane Roe lawsuits": "settled a contract dispute with former suppliers",
+    "Jane Roe regulatory filings": "registered as an investment adviser representative",
+}
+
+
+class _Model:
+    """Canned JSON per task, after ``latency`` seconds; tracks how many calls overlap."""
+
+    def __init__(self, task: TaskType, backend: "_Backend"):
+        self.task = task
+        self.backend = backend
+
+    def invoke(self, messages):
+        with self.backend.calls():
+            time.sleep(self.backend.latency)
+            return self._respond(messages)
+
+    async def ainvoke(self, messages):
+        with self.backend.calls():
+            await asyncio.sleep(self.backend.latency)
+            return self._respond(messages)
+
+    def _respond(self, messages) -> AIMessage:
+        prompt = messages if isinstance(messages, str) else messages[-1].content
+        if self.task == TaskType.PLANNING:
+            wave = list(FINDINGS)[:2] if "FIRST iteration" in prompt else list(FINDINGS)[2:]
+            body = {"queries": wave}
+        elif self.task == TaskType.EXTRACTION:
+            body = {"facts": [
+                {"claim": f"{TARGET} {FINDINGS[q]}", "category": "professional",
+                 "source_url": f"https://example.com/{i}", "source_title": q,
+                 "entities": [TARGET, "Acme Corp"], "confidence": 0.6}
+                for i, q in enumerate(re.findall(r"=== Query: (.+?) ===", prompt))
+            ]}
+        elif self.task == TaskType.ANALYSIS:
+            body = {"risk_flags": [], "connections": [
+                {"source_entity": TARGET, "target_entity": "Acme Corp", "relationship": "EMPLOYED_BY"},
+            ], "information_gaps": ["education"], "analysis_digest": "Career facts only."}
+        elif self.task == TaskType.VALIDATION and isinstance(messages, str):
+            body = {"continue": "Current iteration: 0 " in prompt}
+        elif self.task == TaskType.VALIDATION:
+            body = {"scores": [{"fact_index": 0, "confidence": 0.8}]}
+        else:
+            return AIMessage(content="## 1. Executive Summary\nNothing notable.")
+        return AIMessage(content=json.dumps(body))
+
+
+class _Router:
+    def __init__(self, backend):
+        self.backend = backend
+
+    def get_model(self, task, **kwargs):
+        return _Model(task, self.backend)
+
+    get_fallback_model = get_model
+
+
+class _SearchEngine:
+    def __init__(self, backend):
+        self.backend = backend
+
+    def submit(self, query, **kwargs) -> Future:
+        future: Future = Future()
+        threading.Timer(self.backend.latency, lambda: future.set_result(self._results(query))).start()
+        return future
+
+    async def asearch(self, query, **kwargs):
+        await asyncio.sleep(self.backend.latency)
+        return self._results(query)
+
+    @staticmethod
+    def _results(query):
+        return [{"title": query, "url": f"https://news.example.com/{query.replace(' ', '-')}",
+                 "content": f"Reporting on {TARGET}: she {FINDINGS[query]}, records show."}]
+
+
+class _Backend:
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def calls(self):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def backend(monkeypatch, configure):
+    configure(OPENAI_RPM="0", GEMINI_RPM="0", PASSAGE_INDEX_ENABLED="false", MAX_RESEARCH_ITERATIONS="2")
+
+    stub = _Backend(latency=0.02)
+    router, engine = _Router(stub), _SearchEngine(stub)
+    for module in (planner, extractor, pipeline, analyzer, scorer, validator, reporter):
+        monkeypatch.setattr(module, "get_model_router", lambda: router)
+    for module in (searcher, pipeline):
+        monkeypatch.setattr(module, "get_search_engine", lambda: engine)
+    return stub
+
+
+def _initial_state(job_id: str) -> dict:
+    return {
+        "job_id": job_id, "target_name": TARGET, "target_context": "executive",
+        "research_plan": [], "search_history": [], "extracted_facts": [], "connections": [],
+        "risk_flags": [], "confidence_scores": {}, "scored_fact_ids": [], "seen_documents": {},
+        "document_fingerprints": {}, "analysis_digest": "", "analyzed_fact_count": 0,
+        "information_gaps": [], "run_metrics": {}, "iteration": 0, "status": "planning",
+        "final_report": None,
+    }
+
+
+def _summary(state: dict) -> tuple:
+    return (
+        sorted(f["claim"] for f in state["extracted_facts"]),
+        sorted(sh["query"] for sh in state["search_history"]),
+        state["iteration"],
+        state["status"],
+    )
+
+
+class TestAsyncGraph:
+    def test_ainvoke_matches_invoke(self, backend):
+        graph = build_research_graph()
+        blocking = graph.invoke(_initial_state("sync"))
+        concurrent = asyncio.run(graph.ainvoke(_initial_state("async")))
+        assert _summary(concurrent) == _summary(blocking)
+        assert len(blocking["extracted_facts"]) == 4
+        assert "Executive Summary" in concurrent["final_report"]
+
+    def test_pipelined_ainvoke(self, backend, configure):
+        configure(PIPELINED_EXTRACTION="true")
+        state = asyncio.run(build_research_graph().ainvoke(_initial_state("pipelined")))
+        assert len(state["extracted_facts"]) == 4
+        assert state["status"] == "done"
+
+    def test_jobs_share_one_event_loop(self, backend):
+        graph = build_research_graph()
+        jobs = 12
+
+        async def run_all():
+            return await asyncio.gather(*(graph.ainvoke(_initial_state(f"job-{i}")) for i in range(jobs)))
+
+        states = asyncio.run(run_all())
+        assert all(s["status"] == "done" for s in states)
+        # Every job had a model call in flight at the same time, on a single thread
+        assert backend.peak >= jobs
@@ -0,0 +1,261 @@
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Annotated, TypedDict
+
+import pytest
+from langgraph.graph import END, StateGraph
+
+from src.graphs import checkpoint
+from src.graphs.checkpoint import (
+    checkpoint_config,
+    checkpointed_jobs,
+    claim_job,
+    heartbeat,
+    job_states,
+    open_checkpointer,
+    release_job,
+)
+from src.graphs.state import _merge_lists
+from src.services import research_service
+from src.services.job_store import ResearchJob, SQLiteJobStore
+
+HEARTBEAT = 15.0
+
+
+class _State(TypedDict, total=False):
+    job_id: str
+    target_name: str
+    target_context: str
+    steps: Annotated[list[str], _merge_lists]
+    final_report: str | None
+
+
+def _toy_graph(checkpointer, calls: list[str], fail_once: set[str]):
+    def node(name):
+        def run(state):
+            calls.append(name)
+            if name in fail_once:
+                fail_once.discard(name)
+                raise RuntimeError(f"{name} crashed")
+            return {"steps": [name]}
+        return run
+
+    graph = StateGraph(_State)
+    for name in ("planner", "searcher", "reporter"):
+        graph.add_node(name, node(name))
+    graph.set_entry_point("planner")
+    graph.add_edge("planner", "searcher")
+    graph.add_edge("searcher", "reporter")
+    graph.add_edge("reporter", END)
+    return graph.compile(checkpointer=checkpointer)
+
+
+@pytest.fixture
+def saver(tmp_path):
+    return open_checkpointer(tmp_path / "checkpoints.sqlite3")
+
+
+class TestCheckpointer:
+    def test_resume_skips_completed_nodes(self, saver):
+        calls: list[str] = []
+        graph = _toy_graph(saver, calls, fail_once={"searcher"})
+        config = checkpoint_config("job-1")
+        with pytest.raises(RuntimeError):
+            graph.invoke({"target_name": "T", "steps": []}, config)
+        assert graph.get_state(config).next == ("searcher",)
+
+        # A new process: fresh graph on the same checkpoint file
+        state = _toy_graph(saver, calls, fail_once=set()).invoke(None, config)
+        assert state["steps"] == ["planner", "searcher", "reporter"]
+        assert calls == ["planner", "searcher", "searcher", "reporter"]
+
+    def test_async_resume_skips_completed_nodes(self, saver):
+        calls: list[str] = []
+        config = checkpoint_config("job-1")
+
+        async def run():
+            graph = _toy_graph(saver, calls, fail_once={"searcher"})
+            with pytest.raises(RuntimeError):
+                await graph.ainvoke({"target_name": "T", "steps": []}, config)
+            assert (await graph.aget_state(config)).next == ("searcher",)
+            return await _toy_graph(saver, calls, fail_once=set()).ainvoke(None, config)
+
+        state = asyncio.run(run())
+        assert state["steps"] == ["planner", "searcher", "reporter"]
+        assert calls == ["planner", "searcher", "searcher", "reporter"]
+
+    def test_release_deletes_finished_jobs(self, saver):
+        graph = _toy_graph(saver, [], fail_once=set())
+        graph.invoke({"target_name": "T", "steps": []}, checkpoint_config("done"))
+        graph.invoke({"target_name": "T", "steps": []}, checkpoint_config("kept"))
+        release_job(saver, "done", finished=True)
+        release_job(saver, "kept", finished=False)
+        assert checkpointed_jobs(saver) == ["kept"]
+
+    def test_claims_are_exclusive_until_stale(self, saver, monkeypatch):
+        assert claim_job(saver, "job-1", HEARTBEAT, owner="a")
+        assert claim_job(saver, "job-1", HEARTBEAT, owner="a")  # renewing its own claim
+        assert not claim_job(saver, "job-1", HEARTBEAT, owner="b")
+        assert claim_job(saver, "job-2", HEARTBEAT, owner="b")
+
+        later = checkpoint.time.time() + HEARTBEAT * checkpoint._STALE_HEARTBEATS + 1
+        monkeypatch.setattr(checkpoint.time, "time", lambda: later)
+        heartbeat(saver, owner="b")
+        assert not claim_job(saver, "job-2", HEARTBEAT, owner="c")
+        assert claim_job(saver, "job-1", HEARTBEAT, owner="b")
+        release_job(saver, "job-1", finished=False, owner="b")
+        assert claim_job(saver, "job-1", HEARTBEAT, owner="c")
+
+    def test_failed_jobs_are_claimed_only_explicitly(self, saver, monkeypatch):
+        assert claim_job(saver, "job-1", HEARTBEAT, owner="a")
+        release_job(saver, "job-1", finished=False, failed=True, owner="a")
+
+        later = checkpoint.time.time() + HEARTBEAT * checkpoint._STALE_HEARTBEATS + 1
+        monkeypatch.setattr(checkpoint.time, "time", lambda: later)
+        assert not claim_job(saver, "job-1", HEARTBEAT, owner="b")
+        assert claim_job(saver, "job-1", HEARTBEAT, owner="b", include_failed=True)
+
+    def test_job_states(self, saver, monkeypatch):
+        graph = _toy_graph(saver, [], fail_once=set())
+        for job_id in ("live", "dead", "failed", "released"):
+            graph.invoke({"target_name": "T", "steps": []}, checkpoint_config(job_id))
+            claim_job(saver, job_id, HEARTBEAT, owner=job_id)
+        release_job(saver, "failed", finished=False, failed=True, owner="failed")
+        release_job(saver, "released", finished=False, owner="released")
+
+        later = checkpoint.time.time() + HEARTBEAT * checkpoint._STALE_HEARTBEATS + 1
+        monkeypatch.setattr(checkpoint.time, "time", lambda: later)
+        heartbeat(saver, owner="live")
+        assert job_states(saver, HEARTBEAT) == {
+            "live": "running", "dead": "interrupted", "failed": "failed", "released": "interrupted",
+        }
+
+
+class TestResearchServiceResume:
+    @pytest.fixture
+    def service(self, saver, tmp_path, monkeypatch):
+        calls: list[str] = []
+        failing = {"searcher"}
+        monkeypatch.setattr(research_service, "get_checkpointer", lambda: saver)
+        monkeypatch.setattr(
+            research_service, "build_research_graph",
+            lambda checkpointer=None: _toy_graph(checkpointer, calls, failing),
+        )
+        monkeypatch.setattr(
+            research_service, "get_settings", lambda: SimpleNamespace(checkpoint_max_age_hours=24.0, checkpoint_heartbeat_seconds=HEARTBEAT),
+        )
+        monkeypatch.setattr(research_service.ResearchService, "_build_identity_graph", lambda *a: None)
+        monkeypatch.setattr(research_service, "get_job_store", lambda: SQLiteJobStore(tmp_path / "jobs.sqlite3"))
+        monkeypatch.setattr(research_service, "_running_jobs", set())
+        service = research_service.ResearchService()
+        service.calls = calls
+        return service
+
+    def test_failed_job_resumes_from_checkpoint(self, service, saver):
+        job_id = service.start_research("Timothy Overturf", "Sisu Capital")
+        with pytest.raises(RuntimeError):
+            service.run_research(job_id)
+        assert service.get_job(job_id).status == "failed"
+        assert checkpointed_jobs(saver) == [job_id]
+
+        result = service.resume_research(job_id)
+        assert result["target_name"] == "Timothy Overturf"
+        assert service.calls == ["planner", "searcher", "searcher", "reporter"]
+        assert service.get_job(job_id).status == "completed"
+        assert checkpointed_jobs(saver) == []
+
+    @staticmethod
+    def _crash(service, saver, job_id, *, owner_alive: bool) -> None:
+        """Leave ``job_id`` as a worker that died (or is still running it) mid-run would."""
+        job = service.get_job(job_id)
+        job.status = "running"
+        service._store.save(job)
+        with saver.cursor() as cur:
+            cur.execute("DELETE FROM job_claims WHERE thread_id = ?", (job_id,))
+        claim_job(saver, job_id, HEARTBEAT, owner="other-worker")
+        if not owner_alive:
+            with saver.cursor() as cur:
+                cur.execute("UPDATE job_claims SET heartbeat_at = 0 WHERE thread_id = ?", (job_id,))
+
+    def test_interrupted_jobs_are_restored_after_restart(self, service, saver):
+        job_id = service.start_research("Timothy Overturf", "Sisu Capital")
+        with pytest.raises(RuntimeError):
+            service.run_research(job_id)
+        self._crash(service, saver, job_id, owner_alive=False)
+        service = research_service.ResearchService()  # another worker starts
+
+        assert service.resume_interrupted_jobs() == [job_id]
+        assert service.resume_interrupted_jobs() == []  # claimed once
+        assert service.get_job(job_id).target_name == "Timothy Overturf"
+        service.resume_research(job_id)
+        assert service.get_job(job_id).status == "completed"
+        assert service.get_job(job_id).result["target_name"] == "Timothy Overturf"
+
+    def test_jobs_running_in_a_live_worker_are_not_resumed(self, service, saver):
+        job_id = service.start_research("Timothy Overturf", "Sisu Capital")
+        with pytest.raises(RuntimeError):
+            service.run_research(job_id)
+        self._crash(service, saver, job_id, owner_alive=True)
+
+        assert service.resume_interrupted_jobs() == []
+        with pytest.raises(ValueError, match="another worker"):
+            service.resume_research(job_id)
+        assert service.calls == ["planner", "searcher"]
+
+    def test_failed_jobs_are_not_resumed_at_startup(self, service, saver):
+        job_id = service.start_research("Timothy Overturf", "Sisu Capital")
+        with pytest.raises(RuntimeError):
+            service.run_research(job_id)
+
+        assert service.resume_interrupted_jobs() == []
+        assert checkpointed_jobs(saver) == [job_id]
+        service.resume_research(job_id)  # an explicit resume still works
+        assert service.get_job(job_id).status == "completed"
+
+    def test_reserved_job_runs_once(self, service, saver):
+        job_id = service.start_research("Timothy Overturf", "Sisu Capital")
+        with pytest.raises(RuntimeError):
+            service.run_research(job_id)
+
+        # The controller reserves a job before scheduling it on the jobs loop
+        assert service.mark_running(job_id)
+        assert not service.mark_running(job_id)
+        with pytest.raises(ValueError, match="already running"):
+            service.resume_research(job_id)
+        service.resume_research(job_id, reserved=True)
+        assert service.calls == ["planner", "searcher", "searcher", "reporter"]
+        assert not service.is_running(job_id)
+
+    @staticmethod
+    def _abandon(saver, job_id: str) -> None:
+        """Leave ``job_id`` claimed by a worker that stopped heartbeating."""
+        with saver.cursor() as cur:
+            cur.execute(
+                "UPDATE job_claims SET owner = 'other-worker', heartbeat_at = 0 WHERE thread_id = ?", (job_id,),
+            )
+
+    def test_abandoned_queued_jobs_are_requeued(self, service, saver):
+        job_id = service.start_research("Timothy Overturf", "Sisu Capital")
+        assert service.requeue_abandoned_jobs() == []  # queued in this live worker
+        self._abandon(saver, job_id)
+
+        assert service.requeue_abandoned_jobs() == [job_id]
+        assert service.requeue_abandoned_jobs() == []  # claimed once
+        service._graph = _toy_graph(saver, service.calls, fail_once=set())
+        service.run_research(job_id)
+        assert service.get_job(job_id).status == "completed"
+
+    def test_long_abandoned_queued_jobs_fail(self, service):
+        job = ResearchJob("old-job", "Timothy Overturf", "Sisu Capital")
+        job.created_at -= timedelta(hours=25)
+        service._store.save(job)  # queued before claims were recorded
+
+        assert service.requeue_abandoned_jobs() == []
+        job = service.get_job("old-job")
+        assert (job.status, job.error) == ("failed", "Job was queued on a worker that stopped before starting it")
+
+    def test_nothing_to_resume(self, service):
+        assert service.restore_job("unknown") is None
+        with pytest.raises(ValueError):
+            service.resume_research("unknown")
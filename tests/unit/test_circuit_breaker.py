@@ -0,0 +1,169 @@
+import asyncio
+import time
+
+import httpx
+import openai
+import pytest
+from langchain_core.messages import AIMessage
+
+from src.config.models import TaskType
+from src.utils import circuit_breaker, llm_retry
+from src.utils.circuit_breaker import BreakerState, CircuitBreaker
+
+
+def _status_error(status: int, headers: dict | None = None) -> openai.APIStatusError:
+    request = httpx.Request("POST", "https://openrouter.ai/api/v1/chat/completions")
+    response = httpx.Response(status, headers=headers or {}, request=request)
+    cls = openai.RateLimitError if status == 429 else openai.InternalServerError
+    return cls("error", response=response, body=None)
+
+
+class TestCircuitBreaker:
+    def test_trips_after_threshold(self):
+        breaker = CircuitBreaker("p", failure_threshold=2, recovery_timeout=60)
+        breaker.record_failure()
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == BreakerState.OPEN
+        assert not breaker.allow_request()
+        assert breaker.snapshot()["trips"] == 1
+
+    def test_half_open_allows_single_probe(self):
+        breaker = CircuitBreaker("p", failure_threshold=1, recovery_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        assert breaker.allow_request()
+        assert breaker.state == BreakerState.HALF_OPEN
+        assert not breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state == BreakerState.CLOSED
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker("p", failure_threshold=1, recovery_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == BreakerState.OPEN
+        assert breaker.snapshot()["trips"] == 2
+
+    def test_inconclusive_probe_frees_the_slot(self):
+        breaker = CircuitBreaker("p", failure_threshold=1, recovery_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        assert breaker.allow_request()
+        breaker.record_inconclusive()
+        assert breaker.state == BreakerState.HALF_OPEN
+        assert breaker.allow_request()
+
+
+class TestClassifyError:
+    def test_timeout(self):
+        assert llm_retry.classify_error(httpx.ReadTimeout("slow")) == "timeout"
+
+    def test_rate_limit(self):
+        assert llm_retry.classify_error(_status_error(429)) == "rate_limit"
+
+    def test_server_error(self):
+        assert llm_retry.classify_error(_status_error(503)) == "server_error"
+
+    def test_parse_error(self):
+        assert llm_retry.classify_error(ValueError("bad json")) == "parse_error"
+
+    def test_retry_after_header(self):
+        assert llm_retry.retry_after_seconds(_status_error(429, {"retry-after": "3"})) == 3.0
+        assert llm_retry.retry_after_seconds(_status_error(429, {"retry-after-ms": "1500"})) == 1.5
+        assert llm_retry.retry_after_seconds(_status_error(503)) is None
+
+    def test_backoff_honours_retry_after_and_cap(self):
+        assert llm_retry.backoff_delay(0, 0.5, 20.0, retry_after=3.0) == 3.0
+        assert llm_retry.backoff_delay(0, 0.5, 20.0, retry_after=60.0) == 20.0
+        assert 0 <= llm_retry.backoff_delay(10, 0.5, 4.0) <= 4.0
+
+
+class _Model:
+    def __init__(self, errors: list[Exception]):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def invoke(self, messages):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return AIMessage(content="ok")
+
+    async def ainvoke(self, messages):
+        return self.invoke(messages)
+
+
+class _Router:
+    def __init__(self, primary, fallback):
+        self.primary, self.fallback = primary, fallback
+
+    def get_model(self, task, **kwargs):
+        return self.primary
+
+    def get_fallback_model(self, task, **kwargs):
+        return self.fallback
+
+
+@pytest.fixture(autouse=True)
+def _settings(monkeypatch, configure):
+    configure(LLM_BACKOFF_BASE_SECONDS="0.01", BREAKER_FAILURE_THRESHOLD="2", BREAKER_RECOVERY_SECONDS="60")
+    monkeypatch.setattr(llm_retry, "get_llm_cache", lambda task: None)
+
+
+class TestResilientInvoke:
+    def test_retries_transient_error_then_succeeds(self):
+        router = _Router(_Model([_status_error(503)]), _Model([]))
+        assert llm_retry.resilient_invoke(router, TaskType.EXTRACTION, "p").content == "ok"
+        assert router.primary.calls == 2
+        assert router.fallback.calls == 0
+
+    def test_open_circuit_routes_straight_to_fallback(self):
+        primary = _Model([_status_error(503)] * 10)
+        router = _Router(primary, _Model([]))
+        llm_retry.resilient_invoke(router, TaskType.EXTRACTION, "p")
+        assert circuit_breaker.breaker_metrics()["openai"]["state"] == "open"
+
+        calls_before = primary.calls
+        assert llm_retry.resilient_invoke(router, TaskType.EXTRACTION, "p").content == "ok"
+        assert primary.calls == calls_before
+
+    def test_client_error_is_not_retried(self):
+        request = httpx.Request("POST", "https://openrouter.ai")
+        bad_request = openai.BadRequestError(
+            "bad", response=httpx.Response(400, request=request), body=None,
+        )
+        router = _Router(_Model([bad_request]), _Model([]))
+        assert llm_retry.resilient_invoke(router, TaskType.EXTRACTION, "p").content == "ok"
+        assert router.primary.calls == 1
+
+    def test_request_errors_do_not_reset_failure_count(self):
+        breaker = circuit_breaker.get_breaker("openai")
+        breaker.record_failure()
+        router = _Router(_Model([ValueError("bad json")] * 10), _Model([]))
+        llm_retry.resilient_invoke(router, TaskType.EXTRACTION, "p")
+        assert breaker.snapshot()["consecutive_failures"] == 1
+
+    def test_unknown_errors_trip_the_breaker(self):
+        router = _Router(_Model([RuntimeError("boom")] * 10), _Model([]))
+        for _ in range(2):
+            assert llm_retry.resilient_invoke(router, TaskType.EXTRACTION, "p").content == "ok"
+        assert circuit_breaker.breaker_metrics()["openai"]["state"] == "open"
+
+
+class TestAsyncResilientInvoke:
+    def test_retries_transient_error_then_succeeds(self):
+        router = _Router(_Model([_status_error(503)]), _Model([]))
+        response = asyncio.run(llm_retry.aresilient_invoke(router, TaskType.EXTRACTION, "p"))
+        assert response.content == "ok"
+        assert router.primary.calls == 2
+        assert router.fallback.calls == 0
+
+    def test_exhausted_primary_falls_back(self):
+        router = _Router(_Model([_status_error(503)] * 10), _Model([]))
+        response = asyncio.run(llm_retry.aresilient_invoke(router, TaskType.EXTRACTION, "p"))
+        assert response.content == "ok"
+        assert router.fallback.calls == 1
+        assert llm_retry.llm_error_metrics()["openai"]["server_error"] >= 2
@@ -0,0 +1,85 @@
+from src.tools.content import MainContentParser, extract_main_content, extract_plain_text
+from src.utils.relevance import build_query
+
+ARTICLE = """
+<html><head><title>Sisu Capital CEO profile | News</title><script>var t = '<p>hidden</p>';</script></head>
+<body>
+  <header class="site-header"><a href="/">Logo</a><nav><a href="/a">Markets</a> <a href="/b">Tech</a></nav></header>
+  <div id="cookie-banner"><p>We use cookies to improve your experience. Accept all?</p></div>
+  <article>
+    <header><h1>Who is Timothy Overturf?</h1></header>
+    <p>Timothy Overturf is the chief executive of Sisu Capital, an investment adviser.</p>
+    <h2>Regulatory history</h2>
+    <p>The SEC filed a complaint against Sisu Capital and Overturf over advisory fees.<br>The case is ongoing.</p>
+    <h2>Newsletter</h2>
+    <ul><li><a href="/1">Five stocks to buy now</a></li><li><a href="/2">Markets wrap for today</a></li></ul>
+  </article>
+  <aside><p>Trending stories you may have missed this week.</p></aside>
+  <div class="share-bar"><p>Share this article on social media today</p></div>
+  <footer><p>Copyright 2025 News Corp. All rights reserved.</p></footer>
+</body></html>
+"""
+
+
+class TestMainContent:
+    def test_strips_boilerplate_and_keeps_structure(self):
+        assert extract_main_content(ARTICLE) == (
+            "# Who is Timothy Overturf?\n"
+            "Timothy Overturf is the chief executive of Sisu Capital, an investment adviser.\n"
+            "## Regulatory history\n"
+            "The SEC filed a complaint against Sisu Capital and Overturf over advisory fees. The case is ongoing."
+        )
+
+    def test_parses_incrementally(self):
+        parser = MainContentParser()
+        for i in range(0, len(ARTICLE), 7):
+            parser.feed(ARTICLE[i:i + 7])
+        whole = MainContentParser()
+        whole.feed(ARTICLE)
+        assert parser.close() == whole.close()
+
+    def test_over_budget_keeps_relevant_passages_with_their_headings(self):
+        filler = "".join(f"<h2>Section {i}</h2><p>Notes on gardening and the weather, part {i}.</p>" for i in range(40))
+        markup = (
+            f"<body><h1>Local news</h1>{filler}"
+            "<h2>Business</h2><p>Timothy Overturf, CEO of Sisu Capital, was named in an SEC complaint.</p></body>"
+        )
+        text = extract_main_content(markup, build_query("Timothy Overturf", "Sisu Capital"), max_chars=200)
+        assert text == "## Business\nTimothy Overturf, CEO of Sisu Capital, was named in an SEC complaint."
+
+    def test_without_query_keeps_the_leading_text(self):
+        markup = "".join(f"<p>Paragraph {i} has a handful of words.</p>" for i in range(100))
+        text = extract_main_content(markup, max_chars=100)
+        assert text.startswith("Paragraph 0 has")
+        assert len(text) <= 100
+
+    def test_unescapes_entities_and_dedupes_repeats(self):
+        markup = "<p>Smith &amp; Sons was founded in 1901.</p>" * 3 + "<p>d&nbsp;e f g</p>"
+        assert extract_main_content(markup) == "Smith & Sons was founded in 1901.\nd e f g"
+
+
+    def test_page_containers_are_never_skipped_on_class(self):
+        paragraph = "<p>Timothy Overturf is the chief executive of Sisu Capital.</p>"
+        for opening in (
+            '<body class="post-template has-sidebar">',
+            '<body class="wp-theme nav-fixed">',
+            '<body class="home page modal-open">',
+            '<main class="nav-open">',
+            '<article id="comments-enabled">',
+        ):
+            assert extract_main_content(opening + paragraph) == (
+                "Timothy Overturf is the chief executive of Sisu Capital."
+            ), opening
+
+    def test_matches_whole_class_tokens(self):
+        paragraph = "<p>Timothy Overturf is the chief executive of Sisu Capital.</p></div>"
+        assert extract_main_content('<div id="content" class="main ad-free">' + paragraph)
+        assert extract_main_content('<div class="has-sidebar">' + paragraph)
+        for chrome in ('class="cookie-banner"', 'class="share_bar"', 'id="site-footer"', 'class="post ads"'):
+            assert extract_main_content(f"<div {chrome}>" + paragraph) == "", chrome
+
+
+def test_plain_text_is_selected_by_paragraph():
+    text = "\n\n".join(["Weather report for the week ahead."] * 1 + [f"Filler line {i} here." for i in range(30)]
+                       + ["Overturf founded Sisu Capital."])
+    assert extract_plain_text(text, {"overturf": 1.0}, max_chars=60) == "Overturf founded Sisu Capital."
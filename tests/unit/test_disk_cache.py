@@ -0,0 +1,71 @@
+import time
+
+import pytest
+
+from src.utils.disk_cache import DiskCache
+from src.tools.search import normalize_query, search_cache_key
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DiskCache(tmp_path / "cache.sqlite3", ttl_seconds=60, max_entries=3)
+
+
+class TestDiskCache:
+    def test_roundtrip(self, cache):
+        cache.set("k", [{"title": "A", "score": 0.5}])
+        assert cache.get("k") == [{"title": "A", "score": 0.5}]
+
+    def test_miss_returns_none(self, cache):
+        assert cache.get("missing") is None
+
+    def test_hit_miss_counters(self, cache):
+        cache.set("k", "v")
+        cache.get("k")
+        cache.get("nope")
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_ttl_expiry(self, tmp_path):
+        cache = DiskCache(tmp_path / "ttl.sqlite3", ttl_seconds=0.05)
+        cache.set("k", "v")
+        time.sleep(0.1)
+        assert cache.get("k") is None
+
+    def test_lru_eviction(self, cache):
+        for key in ("a", "b", "c"):
+            cache.set(key, key)
+            time.sleep(0.01)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("d", "d")
+        assert cache.get("b") is None
+        assert cache.get("a") == "a"
+        assert cache.stats()["entries"] == 3
+
+    def test_byte_budget_eviction(self, tmp_path):
+        cache = DiskCache(tmp_path / "bytes.sqlite3", max_bytes=50)
+        cache.set("a", "x" * 30)
+        time.sleep(0.01)
+        cache.set("b", "y" * 30)
+        assert cache.get("a") is None
+        assert cache.get("b") == "y" * 30
+
+    def test_persists_across_instances(self, tmp_path):
+        DiskCache(tmp_path / "shared.sqlite3").set("k", {"n": 1})
+        assert DiskCache(tmp_path / "shared.sqlite3").get("k") == {"n": 1}
+
+
+class TestSearchCacheKey:
+    def test_query_normalization(self):
+        assert normalize_query("  Timothy   OVERTURF ") == "timothy overturf"
+        assert search_cache_key("search", "Foo  Bar", 5, "advanced", False) == search_cache_key(
+            "search", "foo bar", 5, "advanced", False
+        )
+
+    def test_params_change_key(self):
+        base = search_cache_key("search", "foo", 5, "advanced", False)
+        assert base != search_cache_key("search", "foo", 10, "advanced", False)
+        assert base != search_cache_key("search", "foo", 5, "basic", False)
+        assert base != search_cache_key("search", "foo", 5, "advanced", True)
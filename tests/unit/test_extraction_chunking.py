@@ -0,0 +1,163 @@
+import asyncio
+
+import pytest
+
+from src.graphs.nodes import extractor
+from src.graphs.nodes.extractor import (
+    chunk_searches,
+    credit_mirror_sources,
+    dedupe_new_facts,
+    filter_seen_documents,
+    _format_all_results,
+)
+from src.tools.search import SeenDocuments
+from src.utils.fact_index import FactIndex
+from src.utils.text import estimate_tokens
+
+
+def _searches(n_queries: int, n_results: int, content_len: int = 400) -> list[dict]:
+    return [
+        {
+            "query": f"query {q}",
+            "results": [
+                {"title": f"T{q}-{r}", "url": f"https://ex.com/{q}/{r}", "content": "x" * content_len}
+                for r in range(n_results)
+            ],
+        }
+        for q in range(n_queries)
+    ]
+
+
+class TestChunkSearches:
+    def test_small_input_is_single_chunk(self):
+        chunks = chunk_searches(_searches(2, 2), token_budget=10_000)
+        assert len(chunks) == 1
+        assert [e["query"] for e in chunks[0]] == ["query 0", "query 1"]
+
+    def test_chunks_respect_budget(self):
+        budget = 400
+        chunks = chunk_searches(_searches(5, 5), token_budget=budget)
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert estimate_tokens(_format_all_results(chunk)) <= budget + 5
+
+    def test_no_results_lost(self):
+        searches = _searches(5, 5)
+        chunks = chunk_searches(searches, token_budget=400)
+        urls = [r["url"] for chunk in chunks for e in chunk for r in e["results"]]
+        assert urls == [r["url"] for s in searches for r in s["results"]]
+
+    def test_oversized_result_is_trimmed(self):
+        chunks = chunk_searches(_searches(1, 1, content_len=20_000), token_budget=500)
+        assert len(chunks) == 1
+        assert estimate_tokens(_format_all_results(chunks[0])) <= 505
+
+
+class TestDedupeNewFacts:
+    def test_dedupes_across_chunks(self):
+        index = FactIndex([{"fact_id": "x", "claim": "Born in 1971"}])
+        first = dedupe_new_facts([{"claim": "CEO of Tesla, Inc."}, {"claim": "born in 1971"}], index)
+        second = dedupe_new_facts([{"claim": "ceo of tesla inc"}, {"claim": "Founded SpaceX"}], index)
+        assert [f["claim"] for f in first] == ["CEO of Tesla, Inc."]
+        assert [f["claim"] for f in second] == ["Founded SpaceX"]
+        assert first[0]["confidence"] == 0.5
+
+    def test_new_source_corroborates_known_fact(self):
+        index = FactIndex([{"fact_id": "x", "claim": "Born in 1971", "source_url": "https://a.com"}])
+        changed = dedupe_new_facts([{"claim": "born in 1971", "source_url": "https://b.com"}], index)
+        assert [f["fact_id"] for f in changed] == ["x"]
+        assert changed[0]["source_urls"] == ["https://a.com", "https://b.com"]
+        assert changed[0]["corroboration_count"] == 2
+
+    def test_skips_malformed(self):
+        assert dedupe_new_facts(["text", {"claim": ""}, {"claim": "  "}, {}], FactIndex()) == []
+
+
+def _distinct(searches: list[dict]) -> list[dict]:
+    for s in searches:
+        for r in s["results"]:
+            r["content"] = " ".join(f"{r['title']}w{i}" for i in range(80))
+    return searches
+
+
+class TestFilterSeenDocuments:
+    def test_counts_tokens_avoided(self):
+        searches = _distinct(_searches(1, 3))
+        seen = SeenDocuments()
+        seen.commit(filter_seen_documents(searches, seen)[0])
+        again = [{**searches[0], "query": "rephrased"}]
+        kept, metrics = filter_seen_documents(again, SeenDocuments(seen.new))
+        assert kept == []
+        assert metrics["extractor_documents_skipped"] == 3
+        assert metrics["extractor_tokens_avoided"] == estimate_tokens(_format_all_results(again))
+
+    def test_nothing_seen(self):
+        searches = _distinct(_searches(2, 2))
+        kept, metrics = filter_seen_documents(searches, SeenDocuments())
+        assert kept == searches
+        assert metrics == {
+            "extractor_documents_skipped": 0, "extractor_syndicated_copies": 0, "extractor_tokens_avoided": 0,
+        }
+
+
+class TestCreditMirrorSources:
+    def test_syndicated_copies_corroborate_facts(self):
+        index = FactIndex([{"fact_id": "x", "claim": "Born in 1971", "source_url": "https://www.a.com/story"}])
+        mirrors = {"a.com/story": ["https://b.com/copy", "https://c.com/copy"]}
+        facts = [{"fact_id": "x", "claim": "Born in 1971", "source_url": "https://www.a.com/story"},
+                 {"fact_id": "y", "claim": "Founded SpaceX", "source_url": "https://d.com"}]
+        assert credit_mirror_sources(facts, mirrors, index) == 1
+        [fact] = index.changes()
+        assert fact["corroboration_count"] == 3
+
+    def test_no_mirrors(self):
+        assert credit_mirror_sources([{"claim": "A", "source_url": "https://a.com"}], {}, FactIndex()) == 0
+
+
+class TestExtractorSeenDocuments:
+    TARGET = "Jane Roe"
+
+    @pytest.fixture(autouse=True)
+    def _stubs(self, monkeypatch, configure):
+        configure(PASSAGE_INDEX_ENABLED="false", EXTRACTION_CHUNK_TOKENS="80")
+        monkeypatch.setattr(extractor, "get_model_router", lambda: None)
+        self.failing: set[str] = set()
+
+        def extract(router, target_name, chunk, summary):
+            if any(r["url"] in self.failing for entry in chunk for r in entry["results"]):
+                return None
+            return [{"claim": r["content"][:60], "source_url": r["url"]} for e in chunk for r in e["results"]]
+
+        async def aextract(*args):
+            return extract(*args)
+
+        monkeypatch.setattr(extractor, "extract_facts", extract)
+        monkeypatch.setattr(extractor, "aextract_facts", aextract)
+
+    def _state(self) -> dict:
+        def result(url: str, text: str) -> dict:
+            return {"title": "T", "url": url, "content": text + " " + " ".join(f"{url[-1]}w{i}" for i in range(30))}
+
+        searches = [
+            {"query": "career", "results": [
+                result("https://a.com/1", f"{self.TARGET} founded a logistics startup in Denver."),
+                result("https://c.com/3", "Weather forecast: light rain expected over the weekend."),
+            ]},
+            {"query": "boards", "results": [
+                result("https://b.com/2", f"{self.TARGET} joined the Acme Corp board of directors."),
+            ]},
+        ]
+        return {"target_name": self.TARGET, "research_plan": ["career", "boards"], "extracted_facts": [],
+                "search_history": searches}
+
+    @pytest.mark.parametrize("run", [extractor.extractor_node, lambda s: asyncio.run(extractor.aextractor_node(s))])
+    def test_failed_and_irrelevant_documents_stay_unseen(self, run):
+        self.failing = {"https://b.com/2"}
+        update = run(self._state())
+        assert sorted(update["seen_documents"].values()) == ["a.com/1"]
+        assert update["run_metrics"]["relevance_results_dropped"] == 1
+
+        # The next iteration sends the failed document again
+        self.failing = set()
+        state = {**self._state(), "seen_documents": update["seen_documents"]}
+        assert sorted(run(state)["seen_documents"].values()) == ["b.com/2"]
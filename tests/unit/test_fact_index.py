@@ -0,0 +1,60 @@
+from src.utils.fact_index import FactIndex, claim_tokens, jaccard
+
+
+def _fact(claim: str, url: str = "https://a.com", **extra) -> dict:
+    return {"claim": claim, "source_url": url, **extra}
+
+
+class TestFactIndex:
+    def test_paraphrase_merges_with_url_union(self):
+        index = FactIndex([{"fact_id": "x", **_fact("Timothy Overturf is the CEO of Sisu Capital")}])
+        merged = index.add(_fact("Timothy Overturf serves as CEO of Sisu Capital LLC", "https://b.com"))
+        assert merged["fact_id"] == "x"
+        assert merged["claim"] == "Timothy Overturf is the CEO of Sisu Capital"
+        assert merged["source_urls"] == ["https://a.com", "https://b.com"]
+        assert merged["corroboration_count"] == 2
+        assert (index.added, index.merged) == (0, 1)
+        assert index.changes() == [merged]
+
+    def test_different_numbers_never_merge(self):
+        index = FactIndex()
+        index.add(_fact("Timothy Overturf founded Sisu Capital in 2005"))
+        index.add(_fact("Timothy Overturf founded Sisu Capital in 2007", "https://b.com"))
+        assert index.added == 2 and index.merged == 0
+
+    def test_unrelated_claims_stay_separate(self):
+        index = FactIndex()
+        index.add(_fact("Timothy Overturf is the CEO of Sisu Capital"))
+        index.add(_fact("Sisu Capital is registered in California"))
+        assert len(index) == 2
+
+    def test_same_source_duplicate_is_noop(self):
+        index = FactIndex([{"fact_id": "x", **_fact("Born in 1971", entities=["Tesla"])}])
+        assert index.add(_fact("born in 1971", entities=["Tesla"])) is None
+        assert index.changes() == []
+
+    def test_new_entity_updates_fact(self):
+        index = FactIndex([{"fact_id": "x", **_fact("Founded SpaceX", entities=["SpaceX"])}])
+        merged = index.add(_fact("founded spacex", entities=["Elon Musk"]))
+        assert merged["entities"] == ["SpaceX", "Elon Musk"]
+        assert merged["corroboration_count"] == 1
+
+    def test_does_not_mutate_existing_facts(self):
+        existing = {"fact_id": "x", **_fact("Born in 1971")}
+        FactIndex([existing]).add(_fact("born in 1971", "https://b.com"))
+        assert "source_urls" not in existing
+
+    def test_candidates_sublinear(self):
+        facts = [
+            {"fact_id": str(i), **_fact(f"company{i} filed report{i} with regulator{i} about product{i}")}
+            for i in range(3000)
+        ]
+        index = FactIndex(facts)
+        candidates = index._candidates(claim_tokens("company42 filed report42 with regulator42 about product42"))
+        assert "42" in candidates
+        assert len(candidates) < 100
+
+
+def test_jaccard():
+    assert jaccard(frozenset("ab"), frozenset("bc")) == 1 / 3
+    assert jaccard(frozenset(), frozenset()) == 1.0
@@ -0,0 +1,179 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.utils.hedging import HedgeBudget, HedgeStats, LatencyTracker, ahedged_call, hedged_call
+
+
+@pytest.fixture
+def executor():
+    pool = ThreadPoolExecutor(max_workers=4)
+    yield pool
+    pool.shutdown(wait=False)
+
+
+class TestLatencyTracker:
+    def test_percentile(self):
+        tracker = LatencyTracker()
+        for i in range(1, 101):
+            tracker.record("extraction", float(i))
+        assert tracker.percentile("extraction", 0.95) == 95.0
+        assert tracker.percentile("extraction", 0.5) == 50.0
+
+    def test_too_few_samples(self):
+        tracker = LatencyTracker()
+        tracker.record("extraction", 1.0)
+        assert tracker.percentile("extraction", 0.95, min_samples=5) is None
+        assert tracker.percentile("unknown", 0.95) is None
+
+    def test_window_drops_old_samples(self):
+        tracker = LatencyTracker(window=3)
+        for value in (100.0, 1.0, 2.0, 3.0):
+            tracker.record("k", value)
+        assert tracker.percentile("k", 1.0) == 3.0
+
+
+class TestHedgeBudget:
+    def test_caps_hedges_at_ratio(self):
+        budget = HedgeBudget(ratio=0.1)
+        for _ in range(20):
+            budget.record_call()
+        assert budget.try_acquire()
+        assert budget.try_acquire()
+        assert not budget.try_acquire()
+
+    def test_first_hedge_always_allowed(self):
+        budget = HedgeBudget(ratio=0.0)
+        budget.record_call()
+        assert budget.try_acquire()
+        assert not budget.try_acquire()
+
+
+class TestHedgedCall:
+    def test_fast_primary_does_not_hedge(self, executor):
+        hedge_calls = []
+        result = hedged_call(
+            lambda: "primary",
+            lambda: hedge_calls.append(1) or "hedge",
+            1.0,
+            executor=executor,
+            budget=HedgeBudget(),
+        )
+        assert result == ("primary", False, False)
+        assert not hedge_calls
+
+    def test_slow_primary_loses_to_hedge(self, executor):
+        release = threading.Event()
+
+        def slow():
+            release.wait(2)
+            return "primary"
+
+        try:
+            result = hedged_call(
+                slow, lambda: "hedge", 0.05, executor=executor, budget=HedgeBudget(),
+            )
+        finally:
+            release.set()
+        assert result == ("hedge", True, True)
+
+    def test_exhausted_budget_waits_for_primary(self, executor):
+        budget = HedgeBudget(ratio=0.0)
+        budget.record_call()
+        budget.try_acquire()
+
+        def slow():
+            time.sleep(0.1)
+            return "primary"
+
+        result = hedged_call(slow, lambda: "hedge", 0.01, executor=executor, budget=budget)
+        assert result == ("primary", False, False)
+
+    def test_hedge_failure_falls_back_to_primary(self, executor):
+        def slow():
+            time.sleep(0.1)
+            return "primary"
+
+        def broken():
+            raise RuntimeError("hedge failed")
+
+        result = hedged_call(slow, broken, 0.01, executor=executor, budget=HedgeBudget())
+        assert result == ("primary", True, False)
+
+    def test_both_fail_raises_primary_error(self, executor):
+        def slow_fail():
+            time.sleep(0.05)
+            raise ValueError("primary failed")
+
+        def fail():
+            raise RuntimeError("hedge failed")
+
+        with pytest.raises(ValueError):
+            hedged_call(slow_fail, fail, 0.01, executor=executor, budget=HedgeBudget())
+
+    def test_records_primary_latency(self, executor):
+        seen = []
+        hedged_call(
+            lambda: "primary", lambda: "hedge", 1.0,
+            executor=executor, budget=HedgeBudget(), on_primary_latency=seen.append,
+        )
+        executor.shutdown(wait=True)
+        assert len(seen) == 1 and seen[0] >= 0
+
+
+class TestAsyncHedgedCall:
+    def test_slow_primary_loses_and_is_cancelled(self):
+        cancelled = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(2)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return "primary"
+
+        async def hedge():
+            return "hedge"
+
+        result = asyncio.run(ahedged_call(slow, hedge, 0.02, budget=HedgeBudget()))
+        assert result == ("hedge", True, True)
+        assert cancelled == [True]
+
+    def test_fast_primary_does_not_hedge(self):
+        async def primary():
+            return "primary"
+
+        async def hedge():
+            raise AssertionError("hedge should not run")
+
+        seen = []
+        result = asyncio.run(
+            ahedged_call(primary, hedge, 1.0, budget=HedgeBudget(), on_primary_latency=seen.append)
+        )
+        assert result == ("primary", False, False)
+        assert len(seen) == 1
+
+    def test_both_fail_raises_primary_error(self):
+        async def slow_fail():
+            await asyncio.sleep(0.05)
+            raise ValueError("primary failed")
+
+        async def fail():
+            raise RuntimeError("hedge failed")
+
+        with pytest.raises(ValueError):
+            asyncio.run(ahedged_call(slow_fail, fail, 0.01, budget=HedgeBudget()))
+
+
+class TestHedgeStats:
+    def test_snapshot(self):
+        stats = HedgeStats()
+        stats.record("extraction", fired=False, won=False)
+        stats.record("extraction", fired=True, won=True)
+        assert stats.snapshot() == {
+            "extraction": {"calls": 2, "hedges_fired": 1, "hedges_won": 1},
+        }
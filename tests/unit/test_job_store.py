@@ -0,0 +1,113 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.services import job_store
+from src.services.job_store import MemoryJobStore, ResearchJob, SQLiteJobStore, get_job_store
+
+
+def _job(job_id: str, status: str = "pending", result: dict | None = None) -> ResearchJob:
+    job = ResearchJob(job_id, "Timothy Overturf", "Sisu Capital")
+    job.status = status
+    if result is not None:
+        job.completed_at = datetime.now(timezone.utc)
+        job.result = result
+    return job
+
+
+RESULT = {
+    "target_name": "Timothy Overturf",
+    "final_report": "## 1. Executive Summary\n" + "Sisu Capital founder and CEO. " * 200,
+    "facts": [{"claim": f"Fact {i}", "confidence": 0.7} for i in range(50)],
+    "confidence_stats": {"total_facts": 50, "avg_confidence": 0.7},
+}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SQLiteJobStore(tmp_path / "jobs.sqlite3", cache_size=2)
+
+
+class TestSQLiteJobStore:
+    def test_roundtrip(self, store):
+        job = _job("job-1", "completed", RESULT)
+        store.save(job)
+        loaded = store.get("job-1")
+        assert (loaded.target_name, loaded.status, loaded.error) == ("Timothy Overturf", "completed", None)
+        assert loaded.created_at == job.created_at
+        assert loaded.completed_at == job.completed_at
+        assert loaded.result == RESULT
+
+    def test_unknown_job(self, store):
+        assert store.get("missing") is None
+
+    def test_status_updates_keep_the_result(self, store):
+        store.save(_job("job-1", "completed", RESULT))
+        store.save(_job("job-1", "running"))
+        assert store.get("job-1").result == RESULT
+
+    def test_metadata_read_skips_the_result(self, store):
+        store.save(_job("job-1", "completed", RESULT))
+        assert store.get("job-1", with_result=False).result is None
+
+    def test_results_are_compressed(self, store):
+        store.save(_job("job-1", "completed", RESULT))
+        stats = store.stats()
+        assert 0 < stats["result_bytes"] < len(RESULT["final_report"]) / 4
+
+    def test_visible_to_other_processes(self, store, tmp_path):
+        other = SQLiteJobStore(tmp_path / "jobs.sqlite3")
+        store.save(_job("job-1", "running"))
+        assert other.get("job-1").status == "running"
+        store.save(_job("job-1", "completed", RESULT))
+        assert other.get("job-1").result == RESULT
+        assert other.stats()["cache_misses"] == 1
+
+    def test_result_cache_is_lru(self, store):
+        for job_id in ("a", "b", "c"):
+            store.save(_job(job_id, "completed", {"target_name": job_id}))
+        stats = store.stats()
+        assert stats["cached_results"] == 2
+        assert store.get("b").result == {"target_name": "b"}  # cached
+        assert store.get("a").result == {"target_name": "a"}  # evicted, read from disk
+        stats = store.stats()
+        assert (stats["cache_hits"], stats["cache_misses"]) == (1, 1)
+        assert stats["by_status"] == {"completed": 3}
+
+
+@pytest.mark.parametrize("make_store", [
+    lambda tmp_path: SQLiteJobStore(tmp_path / "jobs.sqlite3"),
+    lambda tmp_path: MemoryJobStore(),
+], ids=["sqlite", "memory"])
+def test_job_ids_by_status(make_store, tmp_path):
+    store = make_store(tmp_path)
+    for job_id, status in (("a", "pending"), ("b", "running"), ("c", "pending")):
+        store.save(_job(job_id, status))
+    store.save(_job("a", "running"))
+    assert store.job_ids("pending") == ["c"]
+    assert sorted(store.job_ids("running")) == ["a", "b"]
+
+
+class TestMemoryJobStore:
+    def test_returns_copies(self):
+        store = MemoryJobStore()
+        job = _job("job-1")
+        store.save(job)
+        job.status = "running"
+        assert store.get("job-1").status == "pending"
+        store.save(_job("job-1", "completed", RESULT))
+        store.save(_job("job-1", "completed"))
+        assert store.get("job-1").result == RESULT
+        assert store.stats() == {"jobs": 1, "by_status": {"completed": 1}}
+
+
+def test_backend_from_settings(tmp_path, monkeypatch, configure):
+    monkeypatch.delenv("JOB_STORE_BACKEND", raising=False)
+    configure(JOB_STORE_PATH=str(tmp_path / "jobs.sqlite3"))
+    monkeypatch.setattr(job_store, "_store", None)
+    assert isinstance(get_job_store(), SQLiteJobStore)
+    assert get_job_store() is get_job_store()
+
+    configure(JOB_STORE_BACKEND="memory")
+    monkeypatch.setattr(job_store, "_store", None)
+    assert isinstance(get_job_store(), MemoryJobStore)
@@ -0,0 +1,120 @@
+import json
+import time
+
+from src.utils.json_scan import scan_json, scan_outer_json
+from src.utils.text import robust_json_loads
+
+
+class TestScanJson:
+    def test_array_in_prose(self):
+        text = 'Here are the facts:\n[{"claim": "A"}, {"claim": "B"}]\nHope this helps.'
+        assert scan_json(text) == [{"claim": "A"}, {"claim": "B"}]
+
+    def test_prefers_largest_value_over_prose_brackets(self):
+        text = 'Per source [1], the result is {"risk_flags": [], "information_gaps": ["x"]} (see [2]).'
+        assert scan_json(text) == {"risk_flags": [], "information_gaps": ["x"]}
+
+    def test_unquoted_keys(self):
+        assert scan_json("{continue: true, reasoning: \"done\"}") == {"continue": True, "reasoning": "done"}
+
+    def test_trailing_commas(self):
+        assert scan_json('[{"a": 1, "b": [1, 2,],},]') == [{"a": 1, "b": [1, 2]}]
+
+    def test_python_literals(self):
+        assert scan_json('{"ok": True, "date": None, "flag": False}') == {
+            "ok": True, "date": None, "flag": False,
+        }
+
+    def test_brackets_and_colons_inside_strings(self):
+        text = 'Result: [{"claim": "He said \\"[x]\\" {at 10:30}, then left", "n": 1,}]'
+        assert scan_json(text) == [{"claim": 'He said "[x]" {at 10:30}, then left', "n": 1}]
+
+    def test_unquoted_word_inside_string_untouched(self):
+        assert scan_json('{note: "key: value, other: thing",}') == {"note": "key: value, other: thing"}
+
+    def test_skips_broken_outer_span_for_intact_nested_value(self):
+        assert scan_json('[see {"a": 1} and more]') == {"a": 1}
+
+    def test_mismatched_brackets(self):
+        assert scan_json('[1, 2}') is None
+
+    def test_no_json(self):
+        assert scan_json("no structured data here") is None
+
+    def test_unbalanced_input_is_linear(self):
+        text = "see {x " * 4000
+        for partial in (False, True):
+            start = time.perf_counter()
+            assert scan_json(text, partial=partial) is None
+            assert time.perf_counter() - start < 1.0
+
+    def test_intact_value_after_unbalanced_prose(self):
+        assert scan_json("see x} " * 2000 + '{"a": [1]}') == {"a": [1]}
+
+    def test_junk_before_truncated_array(self):
+        assert scan_json('Here {sort of: [{"a": 1}, {"b"', partial=True) == [{"a": 1}]
+
+
+class TestSalvage:
+    def test_truncated_array_keeps_complete_elements(self):
+        text = '[{"claim": "A"}, {"claim": "B"}, {"claim": "C", "entities": ["x", "y'
+        assert scan_json(text, partial=True) == [{"claim": "A"}, {"claim": "B"}]
+
+    def test_truncated_inside_wrapper_object(self):
+        text = '{"facts": [{"claim": "A"}, {"claim": "B"}, {"claim": "C", "sou'
+        assert scan_json(text, partial=True) == {"facts": [{"claim": "A"}, {"claim": "B"}]}
+
+    def test_truncated_analysis_keeps_finished_sections(self):
+        text = '{"risk_flags": [{"severity": "high"}], "connections": [{"c": 1}, {"c": 2}, {"c'
+        assert scan_json(text, partial=True) == {
+            "risk_flags": [{"severity": "high"}],
+            "connections": [{"c": 1}, {"c": 2}],
+        }
+
+    def test_drops_long_incomplete_last_item(self):
+        text = '[{"claim": "A"}, {"claim": "' + "very long claim " * 50 + '", "entities": ["x",'
+        assert scan_json(text, partial=True) == [{"claim": "A"}]
+
+    def test_truncated_after_trailing_comma(self):
+        assert scan_json("Scores: [0.9, 0.4,", partial=True) == [0.9, 0.4]
+
+    def test_nothing_complete(self):
+        assert scan_json('[{"claim": "A', partial=True) is None
+
+    def test_without_partial_truncated_values_are_rejected(self):
+        assert scan_json('[{"claim": "A"}, {"claim": "B') is None
+        assert scan_json('{"a": 1} then [{"claim": "A"}, {"claim": "B') == {"a": 1}
+
+
+class TestRobustJsonLoads:
+    def test_plain_json(self):
+        assert robust_json_loads('{"a": 1}') == {"a": 1}
+
+    def test_code_fence(self):
+        assert robust_json_loads('```json\n[1, 2, 3,]\n```') == [1, 2, 3]
+
+    def test_scalar(self):
+        assert robust_json_loads('"just a string"') == "just a string"
+
+    def test_failure_returns_none(self):
+        assert robust_json_loads("I could not find anything.", context="test") is None
+
+    def test_partial(self):
+        text = '```json\n[{"claim": "A"}, {"claim": "B", "source_url": "https://exa'
+        assert robust_json_loads(text) is None
+        assert robust_json_loads(text, partial=True) == [{"claim": "A"}]
+
+    def test_content_parts(self):
+        content = [{"type": "reasoning", "text": "thinking"}, {"type": "text", "text": '[{"claim": "A"}]'}]
+        assert robust_json_loads(content) == [{"claim": "A"}]
+
+
+class TestScanOuterJSON:
+    def test_complete_value_in_prose(self):
+        assert scan_outer_json('Sure: {continue: true,} done') == {"continue": True}
+
+    def test_truncated_outer_value_is_none(self):
+        assert scan_outer_json('{"facts": [{"claim": "a"}, {"cla') is None
+
+    def test_no_brackets(self):
+        assert scan_outer_json("no json here") is None
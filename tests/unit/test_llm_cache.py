@@ -0,0 +1,176 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from src.config.models import TaskType
+from src.utils import circuit_breaker, llm_retry
+from src.utils.disk_cache import DiskCache
+from src.utils.llm_cache import llm_cache_key
+
+pytestmark = pytest.mark.usefixtures("configure")
+
+
+class _FakeModel:
+    def __init__(self, reply: str, fail: bool = False, latency: float = 0.0):
+        self.reply = reply
+        self.fail = fail
+        self.latency = latency
+        self.calls = 0
+
+    def invoke(self, messages):
+        self.calls += 1
+        time.sleep(self.latency)
+        if self.fail:
+            raise RuntimeError("provider down")
+        return AIMessage(content=self.reply)
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        if self.fail:
+            raise RuntimeError("provider down")
+        return AIMessage(content=self.reply)
+
+
+class _FakeProvider:
+    def __init__(self, name: str):
+        self.name = name
+
+    def get_model_name(self) -> str:
+        return self.name
+
+
+class _FakeRouter:
+    def __init__(self, primary: _FakeModel, fallback: _FakeModel):
+        self.primary = primary
+        self.fallback = fallback
+
+    def get_model(self, task, temperature=0.0, json_mode=False):
+        return self.primary
+
+    def get_fallback_model(self, task, temperature=0.0, json_mode=False):
+        return self.fallback
+
+    def get_provider(self, task):
+        return _FakeProvider("primary-model")
+
+    def get_fallback_provider(self, task):
+        return _FakeProvider("fallback-model")
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = DiskCache(tmp_path / "llm.sqlite3")
+    monkeypatch.setattr(llm_retry, "get_llm_cache", lambda task: cache)
+    return cache
+
+
+MESSAGES = [SystemMessage(content="system"), HumanMessage(content="extract facts")]
+
+
+class TestLLMCacheKey:
+    def test_stable(self):
+        assert llm_cache_key("m", 0.0, True, MESSAGES) == llm_cache_key("m", 0.0, True, list(MESSAGES))
+
+    def test_sensitive_to_inputs(self):
+        base = llm_cache_key("m", 0.0, True, MESSAGES)
+        assert base != llm_cache_key("other", 0.0, True, MESSAGES)
+        assert base != llm_cache_key("m", 0.2, True, MESSAGES)
+        assert base != llm_cache_key("m", 0.0, False, MESSAGES)
+        assert base != llm_cache_key("m", 0.0, True, MESSAGES[:1])
+
+    def test_plain_string_prompt(self):
+        assert llm_cache_key("m", 0.0, True, "prompt") != llm_cache_key("m", 0.0, True, "other")
+
+
+class TestResilientInvokeCache:
+    def test_second_call_served_from_cache(self, cache):
+        router = _FakeRouter(_FakeModel("[1]"), _FakeModel("[2]"))
+        first = llm_retry.resilient_invoke(router, TaskType.EXTRACTION, MESSAGES)
+        second = llm_retry.resilient_invoke(router, TaskType.EXTRACTION, MESSAGES)
+        assert first.content == second.content == "[1]"
+        assert router.primary.calls == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_fallback_response_cached_under_fallback_model(self, cache):
+        router = _FakeRouter(_FakeModel("", fail=True), _FakeModel("[2]"))
+        assert llm_retry.resilient_invoke(router, TaskType.EXTRACTION, MESSAGES).content == "[2]"
+        assert llm_retry.resilient_invoke(router, TaskType.EXTRACTION, MESSAGES).content == "[2]"
+        assert router.fallback.calls == 1
+
+    def test_disabled_cache_always_calls_model(self, monkeypatch):
+        monkeypatch.setattr(llm_retry, "get_llm_cache", lambda task: None)
+        router = _FakeRouter(_FakeModel("[1]"), _FakeModel("[2]"))
+        llm_retry.resilient_invoke(router, TaskType.REPORTING, MESSAGES)
+        llm_retry.resilient_invoke(router, TaskType.REPORTING, MESSAGES)
+        assert router.primary.calls == 2
+
+    def test_empty_response_not_cached(self, cache):
+        router = _FakeRouter(_FakeModel(""), _FakeModel("[2]"))
+        llm_retry.resilient_invoke(router, TaskType.EXTRACTION, MESSAGES)
+        llm_retry.resilient_invoke(router, TaskType.EXTRACTION, MESSAGES)
+        assert router.primary.calls == 2
+
+    def test_incomplete_json_not_cached(self, cache):
+        router = _FakeRouter(_FakeModel('{"facts": [{"claim": "a"}, {"cla'), _FakeModel("[2]"))
+        llm_retry.resilient_invoke(router, TaskType.EXTRACTION, MESSAGES, json_mode=True)
+        llm_retry.resilient_invoke(router, TaskType.EXTRACTION, MESSAGES, json_mode=True)
+        assert router.primary.calls == 2
+
+    def test_complete_json_cached(self, cache):
+        router = _FakeRouter(_FakeModel('Here you go: {"facts": []}'), _FakeModel("[2]"))
+        llm_retry.resilient_invoke(router, TaskType.EXTRACTION, MESSAGES, json_mode=True)
+        llm_retry.resilient_invoke(router, TaskType.EXTRACTION, MESSAGES, json_mode=True)
+        assert router.primary.calls == 1
+
+    def test_async_cache_io_runs_off_the_event_loop(self, cache, monkeypatch):
+        threads = []
+        for name in ("get", "set"):
+            def record(*args, _original=getattr(cache, name), **kwargs):
+                threads.append(threading.current_thread())
+                return _original(*args, **kwargs)
+            monkeypatch.setattr(cache, name, record)
+
+        router = _FakeRouter(_FakeModel("[1]"), _FakeModel("[2]"))
+        for _ in range(2):
+            assert asyncio.run(llm_retry.aresilient_invoke(router, TaskType.EXTRACTION, MESSAGES)).content == "[1]"
+        assert router.primary.calls == 1
+        assert len(threads) == 3 and threading.main_thread() not in threads
+
+
+class TestHedgedResponseCache:
+    @pytest.fixture(autouse=True)
+    def _hedge_to_fallback(self, monkeypatch, configure):
+        configure(LLM_HEDGING_ENABLED="true", LLM_HEDGE_TARGET="fallback", LLM_HEDGE_INITIAL_DELAY_SECONDS="0.05")
+        monkeypatch.setattr(llm_retry, "_hedge_budget", None)
+
+    @staticmethod
+    def _router() -> _FakeRouter:
+        return _FakeRouter(_FakeModel("[1]", latency=0.5), _FakeModel("[2]"))
+
+    @staticmethod
+    def _assert_cached_under_fallback(cache):
+        assert cache.get(llm_cache_key("primary-model", 0.0, False, MESSAGES)) is None
+        assert cache.get(llm_cache_key("fallback-model", 0.0, False, MESSAGES)) is not None
+
+    def test_winning_fallback_hedge_cached_under_fallback_model(self, cache):
+        response = llm_retry.resilient_invoke(self._router(), TaskType.EXTRACTION, MESSAGES)
+        assert response.content == "[2]"
+        self._assert_cached_under_fallback(cache)
+
+    def test_async_winning_fallback_hedge_cached_under_fallback_model(self, cache):
+        response = asyncio.run(llm_retry.aresilient_invoke(self._router(), TaskType.EXTRACTION, MESSAGES))
+        assert response.content == "[2]"
+        self._assert_cached_under_fallback(cache)
+
+    def test_winning_fallback_hedge_counts_against_primary_breaker(self, cache):
+        primary = llm_retry.TASK_MODEL_MAP[TaskType.EXTRACTION]
+        fallback = llm_retry.FALLBACK_MODEL_MAP[primary]
+        circuit_breaker.get_breaker(fallback.value).record_failure()
+
+        llm_retry.resilient_invoke(self._router(), TaskType.EXTRACTION, MESSAGES)
+        assert circuit_breaker.get_breaker(primary.value).snapshot()["consecutive_failures"] == 1
+        assert circuit_breaker.get_breaker(fallback.value).snapshot()["consecutive_failures"] == 0
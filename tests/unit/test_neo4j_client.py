@@ -0,0 +1,40 @@
+import asyncio
+
+import pytest
+
+from src.db import neo4j_client
+from src.db.neo4j_client import Neo4jClient
+
+
+class _Driver:
+    async def verify_connectivity(self):
+        await asyncio.sleep(0.01)
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def drivers(monkeypatch, configure):
+    monkeypatch.setattr(Neo4jClient, "_instance", None)
+    monkeypatch.setattr(Neo4jClient, "_async_driver", None)
+    monkeypatch.setattr(Neo4jClient, "_async_connect_lock", asyncio.Lock())
+    created = []
+
+    def driver(uri, auth):
+        created.append(_Driver())
+        return created[-1]
+
+    monkeypatch.setattr(neo4j_client.AsyncGraphDatabase, "driver", driver)
+    return created
+
+
+def test_concurrent_aconnect_creates_one_driver(drivers):
+    client = Neo4jClient()
+
+    async def run():
+        await asyncio.gather(*(client.aconnect() for _ in range(5)))
+
+    asyncio.run(run())
+    assert len(drivers) == 1
+    assert client._async_driver is drivers[0]
@@ -0,0 +1,71 @@
+import time
+
+import pytest
+
+from src.tools.page_cache import PageCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return PageCache(tmp_path / "pages.sqlite3", fresh_seconds=60, max_age_seconds=3600, max_bytes=1000)
+
+
+class TestPageCache:
+    def test_round_trip_with_validators(self, cache):
+        cache.set("a.com/p", "<p>hi</p>", "text/html", '"abc"', "Wed, 01 Jan 2025 00:00:00 GMT")
+        page = cache.get("a.com/p")
+        assert page.body == "<p>hi</p>" and page.fresh
+        assert page.validators() == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+        }
+        assert cache.get("a.com/other") is None
+
+    def test_identical_bodies_are_stored_once(self, cache):
+        cache.set("a.com/p", "same body", "text/html")
+        cache.set("mirror.com/p", "same body", "text/html")
+        assert cache.stats() == {"pages": 2, "bodies": 1, "bytes": 9, "evictions": 0}
+
+    def test_stale_until_revalidated(self, tmp_path):
+        cache = PageCache(tmp_path / "pages.sqlite3", fresh_seconds=0.01)
+        cache.set("a.com/p", "body", "text/html", '"v1"')
+        time.sleep(0.02)
+        assert not cache.get("a.com/p").fresh
+        cache.revalidated("a.com/p", '"v2"')
+        page = cache.get("a.com/p")
+        assert page.fresh and page.etag == '"v2"' and page.body == "body"
+
+    def test_expired_pages_are_dropped(self, tmp_path):
+        cache = PageCache(tmp_path / "pages.sqlite3", max_age_seconds=0.01)
+        cache.set("a.com/p", "body", "text/html")
+        time.sleep(0.02)
+        assert cache.get("a.com/p") is None
+
+    def test_least_recently_read_evicted_over_byte_budget(self, cache):
+        cache.set("a.com/1", "x" * 400, "text/html")
+        cache.set("a.com/2", "y" * 400, "text/html")
+        cache.get("a.com/1")
+        cache.set("a.com/3", "z" * 400, "text/html")
+        assert cache.get("a.com/2") is None
+        assert cache.get("a.com/1") is not None and cache.get("a.com/3") is not None
+        stats = cache.stats()
+        assert stats["bytes"] == 800 and stats["evictions"] == 1
+
+    def test_orphaned_bodies_are_dropped(self, tmp_path, monkeypatch):
+        cache = PageCache(tmp_path / "pages.sqlite3", max_age_seconds=0.05)
+        scans = []
+        drop_orphans = cache._drop_orphans
+        monkeypatch.setattr(cache, "_drop_orphans", lambda: scans.append(1) or drop_orphans())
+
+        cache.set("a.com/p", "v1", "text/html")
+        cache.set("a.com/p", "v2", "text/html")  # the old body is freed without a full scan
+        assert not scans
+        assert cache.stats()["bodies"] == 1
+
+        time.sleep(0.1)
+        assert cache.get("a.com/p") is None
+        assert scans and cache.stats()["bodies"] == 0
+
+    def test_persists_across_instances(self, tmp_path):
+        PageCache(tmp_path / "pages.sqlite3").set("a.com/p", "body", "text/plain")
+        assert PageCache(tmp_path / "pages.sqlite3").get("a.com/p").content_type == "text/plain"
@@ -0,0 +1,103 @@
+from src.tools.search import SeenDocuments
+from src.utils.passage_index import PassageIndex, index_raw_content, passages_as_search, split_passages
+from src.utils.relevance import build_query, gap_query
+
+PROFILE = "\n".join([
+    "Home | Markets | Tech",
+    "Timothy Overturf is the chief executive of Sisu Capital, a registered investment adviser in California.",
+    "He founded the firm after a decade in wealth management and advisory roles.",
+    "",
+    "The SEC complaint alleges Sisu Capital and Overturf charged clients undisclosed advisory fees.",
+    "Sign up for our newsletter to get the latest stories in your inbox every morning.",
+])
+
+
+class TestSplitPassages:
+    def test_packs_paragraphs_and_drops_fragments(self):
+        passages = split_passages(PROFILE, max_words=40)
+        assert all(len(p.split()) <= 40 for p in passages)
+        assert "Home | Markets | Tech" not in " ".join(passages)
+        assert passages[0].startswith("Timothy Overturf is the chief executive")
+
+    def test_long_paragraphs_are_windowed(self):
+        passages = split_passages(" ".join(f"w{i}" for i in range(250)), max_words=100)
+        assert [len(p.split()) for p in passages] == [100, 100, 50]
+
+
+class TestPassageIndex:
+    def _index(self) -> PassageIndex:
+        index = PassageIndex(max_words=20)
+        index.add_document("https://a.com/profile", "Overturf profile", PROFILE)
+        index.add_document("https://b.com/weather", "Weather", "Rain is expected across the region this weekend with cooler air.")
+        return index
+
+    def test_search_ranks_and_caps_per_page(self):
+        index = self._index()
+        query = build_query("Timothy Overturf", "Sisu Capital")
+        assert [p.url for p in index.search(query, 5)] == ["https://a.com/profile"] * 2
+        assert len(index.search(query, 5, max_per_url=1)) == 1
+
+    def test_take_hands_out_each_passage_once(self):
+        index = self._index()
+        query = {"sec": 1.0, "fees": 1.0, "overturf": 3.0}
+        first = index.take(query, 1)
+        assert "SEC complaint" in first[0].text
+        assert index.take(query, 1) != first
+        assert index.search(query, 1) == first
+        assert index.stats() == {"documents": 2, "passages": 5, "taken": 2}
+
+    def test_gate_filters_on_the_target(self):
+        index = self._index()
+        gaps = {"rain": 1.0, "weekend": 1.0}
+        assert index.search(gaps, 3)[0].url == "https://b.com/weather"
+        assert index.search(gaps, 3, gate={"overturf": 1.0}, min_score=0.1) == []
+
+    def test_documents_and_repeated_passages_are_indexed_once(self):
+        index = self._index()
+        assert index.add_document("https://a.com/profile", "Overturf profile", PROFILE) == 0
+        assert index.add_document("https://c.com/copy", "Copy", PROFILE) == 0
+        assert len(index) == 5
+
+
+def test_index_raw_content_strips_page_text():
+    index = PassageIndex()
+    results = [
+        {"title": "Profile", "url": "https://a.com/p", "content": "snippet", "raw_content": PROFILE},
+        {"title": "No raw", "url": "https://b.com/p", "content": "snippet"},
+    ]
+    stripped, metrics = index_raw_content(index, results)
+    assert all("raw_content" not in r for r in stripped)
+    assert metrics["passages_indexed"] == len(index) > 0
+    assert metrics["raw_content_tokens_indexed"] > 0
+    assert "raw_content" in results[0]
+
+
+def test_stripped_results_keep_the_page_fingerprint():
+    # Different snippets of one republished page still cluster once its text is stripped
+    snippets = [
+        "Timothy Overturf founded Sisu Capital, an investment adviser in San Francisco, in 2012. " * 3,
+        "Court records list a 2021 settlement with the SEC over undisclosed fees charged by the adviser. " * 3,
+    ]
+    results = [
+        {"title": "Profile", "url": url, "content": snippet, "raw_content": PROFILE}
+        for url, snippet in zip(["https://a.com/p", "https://mirror.org/p"], snippets)
+    ]
+    stripped, _ = index_raw_content(None, results)
+    seen = SeenDocuments()
+    kept = seen.filter([{"query": "q", "results": stripped}])
+    assert [r["url"] for e in kept for r in e["results"]] == ["https://a.com/p"]
+    assert seen.mirrors == {"a.com/p": ["https://mirror.org/p"]}
+
+
+def test_gap_query_adds_gap_terms_below_the_name():
+    query = gap_query({"target_name": "Timothy Overturf", "information_gaps": ["Education history unknown"]})
+    assert query["overturf"] == 3.0
+    assert query["education"] == 1.0
+
+
+def test_passages_as_search_matches_search_history_shape():
+    index = PassageIndex()
+    index.add_document("https://a.com/p", "Profile", PROFILE)
+    entry = passages_as_search(index.search({"overturf": 1.0}, 1), "label")
+    assert entry["query"] == "label"
+    assert set(entry["results"][0]) == {"title", "url", "content"}
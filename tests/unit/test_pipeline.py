@@ -0,0 +1,162 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+from src.graphs.nodes import pipeline
+
+TARGET = "Jane Roe"
+SLOW_QUERY = "Jane Roe lawsuits"
+CLAIMS = {
+    "Jane Roe career history": "founded a logistics startup in Denver during 2009",
+    "Jane Roe board seats": "joined the Acme Corp board of directors",
+    SLOW_QUERY: "settled a contract dispute with former suppliers",
+}
+
+
+class _Engine:
+    """Fast queries resolve at once; SLOW_QUERY waits until the first extraction has started."""
+
+    def __init__(self, results_per_query: int = 1):
+        self.results_per_query = results_per_query
+        self.release = threading.Event()
+        self.slow_done = threading.Event()
+
+    def submit(self, query, **kwargs) -> Future:
+        future: Future = Future()
+        if query != SLOW_QUERY:
+            future.set_result(self._results(query))
+            return future
+
+        def _finish():
+            self.release.wait(5)
+            self.slow_done.set()
+            future.set_result(self._results(query))
+
+        threading.Thread(target=_finish, daemon=True).start()
+        return future
+
+    async def asearch(self, query, **kwargs):
+        if query == SLOW_QUERY:
+            await asyncio.to_thread(self.release.wait, 5)
+            self.slow_done.set()
+        return self._results(query)
+
+    def _results(self, query):
+        slug = query.replace(" ", "-")
+        return [
+            {"title": query, "url": f"https://news.example.com/{slug}/{i}",
+             "content": f"Reporting on {TARGET}: she {CLAIMS[query]}, records show. "
+                        + " ".join(f"{slug}-{i}-note{j}" for j in range(120))}
+            for i in range(self.results_per_query)
+        ]
+
+
+class _Extractor:
+    """Stands in for extract_facts; records each chunk and whether the slow search had finished."""
+
+    def __init__(self, engine: _Engine):
+        self.engine = engine
+        self.calls: list[tuple[list[str], bool]] = []
+        self.failing: set[str] = set()
+        self._lock = threading.Lock()
+
+    def __call__(self, router, target_name, chunk, existing_summary):
+        queries = [entry["query"] for entry in chunk]
+        with self._lock:
+            self.calls.append((queries, self.engine.slow_done.is_set()))
+        self.engine.release.set()
+        if self.failing.intersection(queries):
+            return None
+        return [
+            {"claim": f"{TARGET} {CLAIMS[entry['query']]}", "category": "professional",
+             "source_url": result["url"], "source_title": result["title"],
+             "entities": [TARGET], "confidence": 0.6}
+            for entry in chunk for result in entry["results"]
+        ]
+
+    async def acall(self, router, target_name, chunk, existing_summary):
+        return self(router, target_name, chunk, existing_summary)
+
+
+@pytest.fixture
+def configure(configure):
+    configure(RELEVANCE_FILTER_ENABLED="false", PASSAGE_INDEX_ENABLED="false")
+    return configure
+
+
+@pytest.fixture
+def stubs(monkeypatch, configure):
+    def _stubs(results_per_query: int = 1):
+        engine = _Engine(results_per_query)
+        extractor = _Extractor(engine)
+        monkeypatch.setattr(pipeline, "get_search_engine", lambda: engine)
+        monkeypatch.setattr(pipeline, "get_model_router", lambda: None)
+        monkeypatch.setattr(pipeline, "extract_facts", extractor)
+        monkeypatch.setattr(pipeline, "aextract_facts", extractor.acall)
+        return extractor
+
+    return _stubs
+
+
+def _state(**overrides) -> dict:
+    return {
+        "target_name": TARGET, "research_plan": list(CLAIMS), "search_history": [],
+        "extracted_facts": [], **overrides,
+    }
+
+
+def _run(node, state):
+    return asyncio.run(node(state)) if asyncio.iscoroutinefunction(node) else node(state)
+
+
+@pytest.mark.parametrize("node", [pipeline.search_extract_node, pipeline.asearch_extract_node])
+class TestSearchExtractNode:
+    def test_extraction_starts_before_slow_query_finishes(self, node, stubs):
+        extractor = stubs()
+        _run(node, _state())
+        first_queries, slow_done_at_first = extractor.calls[0]
+        assert SLOW_QUERY not in first_queries
+        assert not slow_done_at_first
+        assert any(SLOW_QUERY in queries for queries, _ in extractor.calls)
+
+    def test_chunks_hold_one_query_each(self, node, stubs, configure):
+        configure(EXTRACTION_CHUNK_TOKENS="400")
+        extractor = stubs(results_per_query=3)
+        _run(node, _state())
+        assert len(extractor.calls) > len(CLAIMS)
+        for queries, _ in extractor.calls:
+            assert len(set(queries)) == 1
+
+    def test_merges_into_extracted_facts(self, node, stubs):
+        stubs(results_per_query=2)
+        known = {"fact_id": "known", "claim": f"{TARGET} joined the Acme Corp board of directors",
+                 "category": "professional", "source_url": "https://old.example.com/a",
+                 "source_urls": ["https://old.example.com/a"], "confidence": 0.5}
+        update = _run(node, _state(extracted_facts=[known]))
+
+        assert sorted(sh["query"] for sh in update["search_history"]) == sorted(CLAIMS)
+        assert update["status"] == "analyzing"
+        claims = sorted(f["claim"] for f in update["extracted_facts"])
+        assert claims == sorted(f"{TARGET} {claim}" for claim in CLAIMS.values())
+        # Both sources of a query collapse into one fact, and the known fact is updated in place
+        merged = next(f for f in update["extracted_facts"] if f["fact_id"] == "known")
+        assert "https://old.example.com/a" in merged["source_urls"]
+        assert len(merged["source_urls"]) == 3
+        assert all(f.get("fact_id") for f in update["extracted_facts"])
+
+    def test_skips_executed_queries(self, node, stubs):
+        extractor = stubs()
+        executed = [{"query": q, "results": []} for q in CLAIMS]
+        update = _run(node, _state(search_history=executed))
+        assert update["extracted_facts"] == []
+        assert extractor.calls == []
+
+    def test_failed_chunks_leave_documents_unseen(self, node, stubs):
+        extractor = stubs()
+        extractor.failing = {SLOW_QUERY}
+        update = _run(node, _state())
+        seen_urls = set(update["seen_documents"].values())
+        assert len(seen_urls) == len(CLAIMS) - 1
+        assert not any(SLOW_QUERY.replace(" ", "-") in url for url in seen_urls)
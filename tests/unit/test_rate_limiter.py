@@ -1,6 +1,13 @@
+import asyncio
+import multiprocessing
+import threading
 import time
 import pytest
+from langchain_core.messages import AIMessage
 
+from src.config.models import ModelProvider
+from src.utils import llm_retry, rate_limiter
+from src.utils.rate_limit_backends import LocalBackend, SQLiteBackend, TokenBucket
 from src.utils.rate_limiter import RateLimiter
 
 
@@ -30,3 +37,218 @@ class TestRateLimiter:
         limiter.wait()
         elapsed = time.monotonic() - start
         assert elapsed < 0.5
+
+    def test_waiters_sleep_concurrently(self):
+        limiter = RateLimiter(max_calls=1, period_seconds=0.2)
+        limiter.wait()
+        start = time.monotonic()
+        threads = [threading.Thread(target=limiter.wait) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.monotonic() - start
+        # Queued reservations: 0.2s and 0.4s, slept in parallel rather than back to back
+        assert 0.3 <= elapsed < 0.55
+
+    def test_async_acquire(self):
+        limiter = RateLimiter(max_calls=2, period_seconds=0.2)
+
+        async def run():
+            return await asyncio.gather(*(limiter.aacquire() for _ in range(4)))
+
+        start = time.monotonic()
+        waits = asyncio.run(run())
+        assert [w.delay for w in waits[:2]] == [0.0, 0.0]
+        assert time.monotonic() - start >= 0.15
+        assert limiter.stats()["throttled"] == 2
+
+    def test_async_reservation_does_not_block_loop(self):
+        class SlowBackend(LocalBackend):
+            def reserve(self, key, demands):
+                time.sleep(0.2)
+                return super().reserve(key, demands)
+
+        limiter = RateLimiter(max_calls=10, period_seconds=1.0, backend=SlowBackend())
+        ticks = []
+
+        async def tick():
+            for _ in range(5):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.02)
+
+        async def run():
+            await asyncio.gather(tick(), limiter.aacquire())
+
+        asyncio.run(run())
+        assert ticks[-1] - ticks[0] < 0.19
+
+    def test_tokens_per_minute(self):
+        limiter = RateLimiter(max_calls=100, period_seconds=1.0, tokens_per_minute=600, burst_seconds=1.0)
+        # 10 tokens/second with a 10 token burst
+        assert limiter.acquire(tokens=10).delay == 0.0
+        start = time.monotonic()
+        limiter.acquire(tokens=3)
+        assert time.monotonic() - start >= 0.25
+
+    def test_record_usage_refunds_overestimate(self):
+        limiter = RateLimiter(max_calls=100, period_seconds=1.0, tokens_per_minute=600, burst_seconds=1.0)
+        limiter.acquire(tokens=10)
+        limiter.record_usage(-10)
+        assert limiter.acquire(tokens=10).delay == 0.0
+
+    def test_reservation_capped_at_bucket_size(self):
+        limiter = RateLimiter(max_calls=100, period_seconds=1.0, tokens_per_minute=600, burst_seconds=1.0)
+        assert limiter.acquire(tokens=100) == (0.0, 10.0)
+        assert RateLimiter(max_calls=100, period_seconds=1.0).acquire(tokens=100) == (0.0, 0.0)
+
+
+class _FailingModel:
+    def invoke(self, messages):
+        raise TimeoutError("slow provider")
+
+    async def ainvoke(self, messages):
+        raise TimeoutError("slow provider")
+
+
+class TestFailedCallRefund:
+    @pytest.fixture
+    def limiter(self, monkeypatch):
+        # 10 tokens/second with a 10 token burst
+        limiter = RateLimiter(max_calls=100, period_seconds=1.0, tokens_per_minute=600, burst_seconds=1.0)
+        monkeypatch.setattr(llm_retry, "get_rate_limiter", lambda name: limiter)
+        return limiter
+
+    def test_sync_call_refunds_reservation(self, limiter):
+        with pytest.raises(TimeoutError):
+            llm_retry._call(ModelProvider.OPENAI, _FailingModel(), "x" * 40)
+        assert limiter.acquire(tokens=10).delay == 0.0
+
+    def test_async_call_refunds_reservation(self, limiter):
+        with pytest.raises(TimeoutError):
+            asyncio.run(llm_retry._acall(ModelProvider.OPENAI, _FailingModel(), "x" * 40))
+        assert limiter.acquire(tokens=10).delay == 0.0
+
+    @pytest.mark.parametrize("call", [
+        lambda model, messages: llm_retry._call(ModelProvider.OPENAI, model, messages),
+        lambda model, messages: asyncio.run(llm_retry._acall(ModelProvider.OPENAI, model, messages)),
+    ])
+    def test_oversized_prompt_refunds_only_what_was_reserved(self, limiter, monkeypatch, call):
+        refunds = []
+        monkeypatch.setattr(limiter, "record_usage", refunds.append)
+        # ~100 estimated tokens against a 10 token bucket: only 10 were taken
+        with pytest.raises(TimeoutError):
+            call(_FailingModel(), "x" * 400)
+        assert refunds == [-10.0]
+
+    def test_usage_settled_against_the_reservation(self, limiter):
+        class _Model:
+            def invoke(self, messages):
+                return AIMessage(content="ok", usage_metadata={
+                    "input_tokens": 100, "output_tokens": 0, "total_tokens": 100,
+                })
+
+        llm_retry._call(ModelProvider.OPENAI, _Model(), "x" * 400)
+        # 100 used, 10 reserved: the bucket owes 90 tokens, nine seconds at 10/second
+        assert limiter.acquire(tokens=1).delay == pytest.approx(9.1, abs=0.05)
+
+    def test_async_usage_settled_off_the_event_loop(self, limiter, monkeypatch):
+        threads = []
+        adjust = limiter._backend.adjust
+
+        def record(*args):
+            threads.append(threading.current_thread())
+            adjust(*args)
+
+        monkeypatch.setattr(limiter._backend, "adjust", record)
+        with pytest.raises(TimeoutError):
+            asyncio.run(llm_retry._acall(ModelProvider.OPENAI, _FailingModel(), "x" * 40))
+        assert threads and threading.main_thread() not in threads
+
+
+class TestTokenBucket:
+    def test_reserve_and_refill(self):
+        bucket = TokenBucket(capacity=2, refill_per_second=1.0)
+        assert bucket.reserve(1, now=bucket.updated) == (0.0, 1)
+        assert bucket.reserve(1, now=bucket.updated) == (0.0, 1)
+        assert bucket.reserve(1, now=bucket.updated)[0] == pytest.approx(1.0)
+        assert bucket.reserve(1, now=bucket.updated + 3.0) == (0.0, 1)
+
+    def test_oversized_request_capped_at_capacity(self):
+        bucket = TokenBucket(capacity=5, refill_per_second=1.0)
+        assert bucket.reserve(50, now=bucket.updated) == (0.0, 5.0)
+
+
+@pytest.mark.usefixtures("configure")
+class TestGetRateLimiter:
+    def test_shared_per_name(self):
+        assert rate_limiter.get_rate_limiter("tavily") is rate_limiter.get_rate_limiter("tavily")
+        assert rate_limiter.get_rate_limiter("openai") is not rate_limiter.get_rate_limiter("tavily")
+
+    def test_local_backend_by_default(self, monkeypatch):
+        monkeypatch.delenv("RATE_LIMIT_BACKEND")
+        assert isinstance(rate_limiter.get_rate_limit_backend(), LocalBackend)
+
+    def test_disabled_when_rpm_zero(self, monkeypatch):
+        monkeypatch.setenv("GEMINI_RPM", "0")
+        assert rate_limiter.get_rate_limiter("gemini") is None
+
+
+class TestSQLiteBackend:
+    def test_quota_shared_between_backends(self, tmp_path):
+        path = tmp_path / "limits.sqlite3"
+        first = RateLimiter(2, 60.0, name="tavily", backend=SQLiteBackend(path, worker_id="w1"))
+        second = RateLimiter(2, 60.0, name="tavily", backend=SQLiteBackend(path, worker_id="w2"))
+        assert first._reserve(0).delay == 0.0
+        assert second._reserve(0).delay == 0.0
+        # The bucket of 2 is empty for both workers; later reservations queue behind earlier ones
+        queued_first = first._reserve(0).delay
+        queued_second = second._reserve(0).delay
+        assert 0 < queued_first < queued_second
+
+    def test_worker_shares(self, tmp_path):
+        path = tmp_path / "limits.sqlite3"
+        first = RateLimiter(100, 1.0, name="openai", backend=SQLiteBackend(path, worker_id="w1"))
+        second = RateLimiter(100, 1.0, name="openai", backend=SQLiteBackend(path, worker_id="w2"))
+        for _ in range(3):
+            first.acquire()
+        second.acquire()
+        workers = first.stats()["workers"]
+        assert workers["w1"]["share"] == 0.75
+        assert workers["w2"]["share"] == 0.25
+        assert first.stats()["acquired"] == 3
+
+    def test_separate_processes(self, tmp_path):
+        path = tmp_path / "limits.sqlite3"
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(2) as pool:
+            delays = pool.map(_reserve_many, [(str(path), f"w{i}") for i in range(2)])
+        waits = sorted(d for worker in delays for d in worker)
+        # 10 requests against a bucket of 4: exactly 6 must wait, each a distinct slot
+        assert waits[:4] == [0.0] * 4
+        assert all(d > 0 for d in waits[4:])
+        assert len({round(d, 1) for d in waits[4:]}) == 6
+
+    def test_reset_and_adjust(self, tmp_path):
+        backend = SQLiteBackend(tmp_path / "limits.sqlite3", worker_id="w1")
+        limiter = RateLimiter(
+            100, 1.0, tokens_per_minute=600, burst_seconds=1.0, name="gemini", backend=backend,
+        )
+        limiter.acquire(tokens=10)
+        limiter.record_usage(-10)
+        assert limiter._reserve(10).delay == 0.0
+        limiter.reset()
+        assert backend.worker_usage("gemini") == {}
+
+    def test_local_backend_reports_single_worker(self):
+        limiter = RateLimiter(5, 1.0, backend=LocalBackend(worker_id="only"))
+        limiter.acquire()
+        assert limiter.stats()["workers"] == {
+            "only": {"acquired": 1, "throttled": 0, "wait_seconds": 0.0, "share": 1.0},
+        }
+
+
+def _reserve_many(args):
+    path, worker = args
+    limiter = RateLimiter(4, 60.0, name="tavily", backend=SQLiteBackend(path, worker_id=worker))
+    return [limiter._reserve(0).delay for _ in range(5)]
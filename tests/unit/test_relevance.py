@@ -0,0 +1,86 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from evaluation.relevance import SAMPLES_PATH, evaluate_relevance_filter
+from src.graphs.nodes.extractor import filter_relevant_results
+from src.utils.relevance import BM25Ranker, build_query, rank_results, tokenize
+
+
+class TestBuildQuery:
+    def test_name_outweighs_context_and_entities(self):
+        query = build_query("Michael Burry", "Founder of Scion", ["Scion Capital", "Burry"])
+        assert query["burry"] == query["michael"] == 3.0
+        assert query["scion"] == 1.0
+        assert query["capital"] == 0.5
+        assert "of" not in query
+
+    def test_tokenize_drops_stopwords_and_punctuation(self):
+        assert tokenize("The CEO of Sisu Capital, LLC.") == ["ceo", "sisu", "capital"]
+
+
+class TestBM25Ranker:
+    def test_ranks_matching_documents_first(self):
+        docs = ["Elon Musk leads Tesla", "musk deer in Nepal", "quarterly EV sales"]
+        scores = BM25Ranker(docs).scores({"elon": 3.0, "musk": 3.0, "tesla": 1.0})
+        assert scores[0] > scores[1] > scores[2] == 0.0
+
+    def test_relevance_is_normalized(self):
+        relevance = rank_results(
+            [{"title": "Elon Musk", "content": "Elon Musk Elon Musk Tesla"}, {"title": "Other"}],
+            {"elon": 3.0, "musk": 3.0, "tesla": 1.0},
+        )
+        assert 0.5 < relevance[0] < 1.0
+        assert relevance[1] == 0.0
+
+    def test_incremental_add_matches_batch(self):
+        docs = ["Elon Musk leads Tesla", "musk deer in Nepal", "quarterly EV sales and Tesla deliveries"]
+        ranker = BM25Ranker()
+        for doc in docs:
+            ranker.add(doc)
+        query = {"musk": 3.0, "tesla": 1.0}
+        assert ranker.scores(query) == BM25Ranker(docs).scores(query)
+        assert len(ranker) == 3
+
+    def test_empty(self):
+        assert rank_results([], {"a": 1.0}) == []
+        assert BM25Ranker(["text"]).relevance({}) == [0.0]
+
+
+def _searches() -> list[dict]:
+    return [
+        {"query": "q1", "results": [
+            {"title": "Elon Musk profile", "url": "https://a.com", "content": "Elon Musk, CEO of Tesla and SpaceX"},
+            {"title": "Musk perfume", "url": "https://b.com", "content": "White musk fragrances"},
+        ]},
+        {"query": "q2", "results": [
+            {"title": "Tesla earnings", "url": "https://c.com", "content": "Elon Musk said Tesla margins improved"},
+            {"title": "Elon University", "url": "https://d.com", "content": "Commencement in North Carolina"},
+        ]},
+    ]
+
+
+class TestFilterRelevantResults:
+    def test_threshold(self):
+        query = build_query("Elon Musk", "CEO of Tesla and SpaceX")
+        kept, metrics = filter_relevant_results(_searches(), query, min_score=0.15)
+        assert [r["url"] for s in kept for r in s["results"]] == ["https://a.com", "https://c.com"]
+        assert metrics["relevance_results_dropped"] == 2
+        assert metrics["relevance_tokens_avoided"] > 0
+
+    def test_top_k_keeps_best_in_original_order(self):
+        query = build_query("Elon Musk", "CEO of Tesla and SpaceX")
+        kept, _ = filter_relevant_results(_searches(), query, min_score=0.0, top_k=1)
+        assert [s["query"] for s in kept] == ["q1"]
+        assert [r["url"] for r in kept[0]["results"]] == ["https://a.com"]
+
+
+class TestPersonaSamples:
+    @pytest.mark.parametrize("persona_file", sorted(Path("evaluation/personas").glob("persona_*.json")))
+    def test_default_threshold_keeps_every_relevant_result(self, persona_file):
+        persona = json.loads(persona_file.read_text(encoding="utf-8"))
+        samples = json.loads(SAMPLES_PATH.read_text(encoding="utf-8"))[persona["name"]]
+        metrics = evaluate_relevance_filter(persona, samples, min_score=0.15)
+        assert metrics["recall"] == 1.0
+        assert metrics["precision"] >= 0.7
@@ -0,0 +1,99 @@
+import asyncio
+import json
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from src.graphs.nodes import scorer
+
+TARGET = "Jane Roe"
+
+
+def _facts(n: int) -> list[dict]:
+    return [
+        {"fact_id": f"f{i}", "claim": f"{TARGET} fact number {i}", "category": "professional",
+         "source_url": f"https://example.com/{i}"}
+        for i in range(n)
+    ]
+
+
+def _state(facts: list[dict], scored: list[str] | None = None) -> dict:
+    return {"target_name": TARGET, "extracted_facts": facts, "scored_fact_ids": scored or [],
+            "search_history": []}
+
+
+class _Invoke:
+    """Stands in for resilient_invoke; records prompts and returns canned content."""
+
+    def __init__(self, content: str | None):
+        self.content = content
+        self.prompts: list[str] = []
+
+    def __call__(self, router, task, messages, **kwargs):
+        self.prompts.append(messages[-1].content)
+        return None if self.content is None else AIMessage(content=self.content)
+
+    async def acall(self, router, task, messages, **kwargs):
+        return self(router, task, messages, **kwargs)
+
+
+@pytest.fixture
+def invoke(monkeypatch, configure):
+    monkeypatch.setattr(scorer, "get_model_router", lambda: None)
+
+    def _install(content: str | None) -> _Invoke:
+        stub = _Invoke(content)
+        monkeypatch.setattr(scorer, "resilient_invoke", stub)
+        monkeypatch.setattr(scorer, "aresilient_invoke", stub.acall)
+        return stub
+
+    return _install
+
+
+def _scores(*indexes: int) -> str:
+    return json.dumps({"scores": [{"fact_index": i, "confidence": 0.9} for i in indexes]})
+
+
+class TestScorerNode:
+    def test_scores_every_fact_once(self, invoke):
+        invoke(_scores(0, 1, 2))
+        update = scorer.scorer_node(_state(_facts(3)))
+        assert update["scored_fact_ids"] == ["f0", "f1", "f2"]
+        assert update["confidence_scores"] == {f"{TARGET} fact number {i}": 0.9 for i in range(3)}
+
+    def test_skips_already_scored_facts(self, invoke):
+        stub = invoke(_scores(0))
+        update = scorer.scorer_node(_state(_facts(3), scored=["f0", "f1"]))
+        assert "fact number 2" in stub.prompts[0]
+        assert "fact number 0" not in stub.prompts[0]
+        assert update["scored_fact_ids"] == ["f2"]
+        assert update["run_metrics"]["scorer_facts_skipped"] == 2
+
+    def test_partial_response_leaves_missing_facts_unscored(self, invoke):
+        invoke(_scores(0, 2, 7))
+        update = scorer.scorer_node(_state(_facts(3)))
+        assert update["scored_fact_ids"] == ["f0", "f2"]
+        assert set(update["confidence_scores"]) == {f"{TARGET} fact number 0", f"{TARGET} fact number 2"}
+
+        # The skipped fact is sent again on the next pass
+        stub = invoke(_scores(0))
+        retry = scorer.scorer_node(_state(_facts(3), scored=update["scored_fact_ids"]))
+        assert "fact number 1" in stub.prompts[0]
+        assert retry["scored_fact_ids"] == ["f1"]
+
+    def test_unparseable_response_scores_nothing(self, invoke):
+        invoke("Sorry, I cannot score these facts.")
+        update = scorer.scorer_node(_state(_facts(3)))
+        assert update["scored_fact_ids"] == []
+        assert update["confidence_scores"] == {}
+
+    def test_failed_call_scores_nothing(self, invoke):
+        invoke(None)
+        update = scorer.scorer_node(_state(_facts(2)))
+        assert update.get("scored_fact_ids", []) == []
+        assert update["run_metrics"]["scorer_llm_calls"] == 1
+
+    def test_async_partial_response(self, invoke):
+        invoke(_scores(1))
+        update = asyncio.run(scorer.ascorer_node(_state(_facts(2))))
+        assert update["scored_fact_ids"] == ["f1"]
@@ -3,6 +3,7 @@ import pytest
 from src.services.scoring_service import (
     get_source_tier,
     compute_confidence,
+    apply_corroboration,
     aggregate_confidence_stats,
 )
 
@@ -50,6 +51,18 @@ class TestComputeConfidence:
         assert score <= 1.0
 
 
+class TestApplyCorroboration:
+    def test_single_source_unchanged(self):
+        assert apply_corroboration(0.4, ["https://sec.gov/filing"], 1) == 0.4
+
+    def test_corroboration_raises_confidence(self):
+        urls = ["https://bbc.com/a", "https://cnn.com/b", "https://apnews.com/c"]
+        assert apply_corroboration(0.4, urls, 3) == compute_confidence(urls, 3)
+
+    def test_never_lowers_llm_score(self):
+        assert apply_corroboration(0.95, ["https://reddit.com/r", "https://quora.com/q"], 2) == 0.95
+
+
 class TestAggregateConfidenceStats:
     def test_empty_facts(self):
         stats = aggregate_confidence_stats([])
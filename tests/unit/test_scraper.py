@@ -0,0 +1,212 @@
+import asyncio
+import threading
+from collections import Counter
+from concurrent.futures import wait
+
+import httpx
+import pytest
+
+from src.tools.page_cache import PageCache
+from src.tools.scraper import WebScraper
+
+PAGE = (
+    "<html><head><title>T</title><style>body {color: red}</style>"
+    "<script>var x = '<p>hidden</p>';</script></head>"
+    "<body><h1>Sisu Capital</h1><p>Timothy Overturf is CEO &amp; founder.</p><!-- note --></body></html>"
+)
+
+
+class _FakeSite:
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.active: Counter = Counter()
+        self.peak: Counter = Counter()
+        self.peak_total = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        self.active[host] += 1
+        self.peak[host] = max(self.peak[host], self.active[host])
+        self.peak_total = max(self.peak_total, sum(self.active.values()))
+        await asyncio.sleep(self.delay)
+        self.active[host] -= 1
+        if request.url.path == "/slow":
+            await asyncio.sleep(1.0)
+        if request.url.path == "/missing":
+            return httpx.Response(404)
+        if request.url.path == "/pdf":
+            return httpx.Response(200, headers={"content-type": "application/pdf"}, content=b"%PDF")
+        return httpx.Response(200, headers={"content-type": "text/html; charset=utf-8"}, text=PAGE)
+
+
+@pytest.fixture
+def site():
+    return _FakeSite()
+
+
+class TestWebScraper:
+    def test_extracts_visible_text(self, site):
+        scraper = WebScraper(transport=httpx.MockTransport(site))
+        text = scraper.scrape_url("https://a.com/page")
+        scraper.close()
+        assert text == "# Sisu Capital\nTimothy Overturf is CEO & founder."
+
+    def test_global_and_per_host_limits(self, site):
+        scraper = WebScraper(max_concurrency=4, per_host_concurrency=2, transport=httpx.MockTransport(site))
+        urls = [f"https://host{h}.com/{i}" for h in range(3) for i in range(5)]
+        wait([scraper.submit(u) for u in urls])
+        stats = scraper.stats()
+        scraper.close()
+        assert stats["requests"] == 15
+        assert max(site.peak.values()) <= 2
+        assert site.peak_total <= 4
+
+    def test_scrape_multiple_runs_concurrently(self, site):
+        scraper = WebScraper(transport=httpx.MockTransport(site))
+        urls = [f"https://host{i}.com/" for i in range(10)]
+        results = scraper.scrape_multiple(urls)
+        scraper.close()
+        assert list(results) == urls
+        assert site.peak_total > 1
+
+    def test_failures_return_empty(self, site):
+        scraper = WebScraper(timeout=0.3, transport=httpx.MockTransport(site))
+        results = scraper.scrape_multiple(["https://a.com/missing", "https://a.com/slow", "https://a.com/pdf"])
+        stats = scraper.stats()
+        scraper.close()
+        assert results == {"https://a.com/missing": "", "https://a.com/slow": "", "https://a.com/pdf": ""}
+        assert stats["failures"] == 2
+
+    def test_malformed_urls_return_empty(self, site):
+        scraper = WebScraper(transport=httpx.MockTransport(site))
+        urls = ["http://[bad", "https://a.com/page"]
+        results = scraper.scrape_multiple(urls)
+        single = scraper.scrape_url("http://[bad")
+        stats = scraper.stats()
+        scraper.close()
+        assert results["http://[bad"] == single == ""
+        assert results["https://a.com/page"].startswith("# Sisu Capital")
+        assert stats["failures"] == 2
+
+    def test_stops_reading_at_size_cap(self):
+        sent = 0
+
+        async def endless():
+            nonlocal sent
+            while True:
+                sent += 1024
+                yield b"<p> " + b"word " * 203 + b"</p>\n"
+
+        def handler(request):
+            return httpx.Response(200, headers={"content-type": "text/html"}, content=endless())
+
+        scraper = WebScraper(max_bytes=10_000, max_chars=50_000, transport=httpx.MockTransport(handler))
+        text = scraper.scrape_url("https://big.com/")
+        stats = scraper.stats()
+        scraper.close()
+        assert stats["truncated"] == 1
+        assert sent < 20_000
+        assert 0 < len(text) <= 10_000
+
+
+class TestScraperCache:
+    @staticmethod
+    def _versioned_site(requests: list):
+        def handler(request):
+            requests.append(request)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304, headers={"etag": '"v1"'})
+            return httpx.Response(200, headers={"content-type": "text/html", "etag": '"v1"'}, text=PAGE)
+        return handler
+
+    def test_fresh_pages_skip_the_network(self, tmp_path):
+        requests = []
+        cache = PageCache(tmp_path / "pages.sqlite3", fresh_seconds=3600)
+        scraper = WebScraper(cache=cache, transport=httpx.MockTransport(self._versioned_site(requests)))
+        metrics: dict = {}
+        first = scraper.scrape_multiple(["https://a.com/p?utm_source=x"], metrics=metrics)
+        second = scraper.scrape_multiple(["https://www.a.com/p"], metrics=metrics)
+        stats = scraper.stats()["page_cache"]
+        scraper.close()
+        assert len(requests) == 1
+        assert list(first.values()) == list(second.values())
+        assert metrics == {"page_cache_misses": 1, "page_cache_hits": 1}
+        assert stats["hit_rate"] == 0.5
+
+    def test_stale_pages_are_revalidated(self, tmp_path):
+        requests = []
+        cache = PageCache(tmp_path / "pages.sqlite3", fresh_seconds=0)
+        scraper = WebScraper(cache=cache, transport=httpx.MockTransport(self._versioned_site(requests)))
+        metrics: dict = {}
+        first = scraper.scrape_multiple(["https://a.com/p"], metrics=metrics)
+        second = scraper.scrape_multiple(["https://a.com/p"], metrics=metrics)
+        scraper.close()
+        assert "if-none-match" not in requests[0].headers
+        assert requests[1].headers["if-none-match"] == '"v1"'
+        assert first == second and first["https://a.com/p"]
+        assert metrics == {"page_cache_misses": 1, "page_cache_revalidated": 1}
+
+    def test_changed_pages_replace_the_cached_body(self, tmp_path):
+        version = ["old"]
+
+        def handler(request):
+            return httpx.Response(200, headers={"content-type": "text/plain", "etag": version[0]}, text=version[0])
+
+        cache = PageCache(tmp_path / "pages.sqlite3", fresh_seconds=0)
+        scraper = WebScraper(cache=cache, transport=httpx.MockTransport(handler))
+        assert scraper.scrape_url("https://a.com/p") == "old"
+        version[0] = "new"
+        assert scraper.scrape_url("https://a.com/p") == "new"
+        scraper.close()
+        assert cache.stats()["bodies"] == 1
+
+    def test_cache_io_runs_off_the_fetch_loop(self, tmp_path, monkeypatch):
+        threads = []
+        cache = PageCache(tmp_path / "pages.sqlite3", fresh_seconds=0)
+        for name in ("get", "set", "revalidated"):
+            def record(*args, _original=getattr(cache, name)):
+                threads.append(threading.current_thread())
+                return _original(*args)
+            monkeypatch.setattr(cache, name, record)
+
+        scraper = WebScraper(cache=cache, transport=httpx.MockTransport(self._versioned_site([])))
+        scraper.scrape_url("https://a.com/p")
+        scraper.scrape_url("https://a.com/p")
+
+        async def current_thread():
+            return threading.current_thread()
+
+        loop_thread = scraper._loop.run(current_thread())
+        scraper.close()
+        assert len(threads) == 4 and loop_thread not in threads
+
+    def test_truncated_pages_are_not_revalidated(self, tmp_path):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304, headers={"etag": '"v1"'})
+            body = b"<p>" + b"word " * 5000 + b"</p>"
+            return httpx.Response(200, headers={"content-type": "text/html", "etag": '"v1"'}, content=body)
+
+        cache = PageCache(tmp_path / "pages.sqlite3", fresh_seconds=0)
+        scraper = WebScraper(max_bytes=1_000, cache=cache, transport=httpx.MockTransport(handler))
+        metrics: dict = {}
+        scraper.scrape_multiple(["https://a.com/big"], metrics=metrics)
+        scraper.scrape_multiple(["https://a.com/big"], metrics=metrics)
+        scraper.close()
+        assert "if-none-match" not in requests[1].headers
+        assert metrics == {"page_cache_misses": 2}
+
+
+def test_long_pages_keep_passages_about_the_query():
+    filler = "".join(f"<p>Unrelated paragraph number {i} about the weather and gardening.</p>" for i in range(50))
+    markup = f"<html><body>{filler}<p>Timothy Overturf runs Sisu Capital.</p></body></html>"
+    scraper = WebScraper(max_chars=300, transport=httpx.MockTransport(
+        lambda request: httpx.Response(200, headers={"content-type": "text/html"}, text=markup)
+    ))
+    text = scraper.scrape_url("https://a.com/", query={"overturf": 3.0, "sisu": 1.0})
+    scraper.close()
+    assert "Timothy Overturf runs Sisu Capital." in text
+    assert len(text) <= 300
@@ -0,0 +1,100 @@
+import asyncio
+import threading
+from concurrent.futures import wait
+
+import httpx
+import pytest
+
+from src.tools.search_engine import SearchEngine
+from src.utils.disk_cache import DiskCache
+from src.utils.rate_limiter import RateLimiter
+
+
+class _FakeTavily:
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        query = request.read().decode()
+        return httpx.Response(
+            200,
+            json={"results": [{"title": "T", "url": "https://example.com", "content": query}]},
+        )
+
+
+@pytest.fixture
+def fake():
+    return _FakeTavily()
+
+
+class TestSearchEngine:
+    def test_returns_normalized_results(self, fake):
+        engine = SearchEngine("key", transport=httpx.MockTransport(fake))
+        results = engine.search("python", max_results=3)
+        engine.close()
+        assert results[0]["url"] == "https://example.com"
+        assert set(results[0]) == {"title", "url", "content", "score", "raw_content"}
+
+    def test_global_concurrency_limit(self, fake):
+        engine = SearchEngine("key", max_concurrency=3, transport=httpx.MockTransport(fake))
+        futures = [engine.submit(f"query {i}") for i in range(12)]
+        wait(futures)
+        engine.close()
+        assert fake.calls == 12
+        assert fake.peak <= 3
+
+    def test_uses_cache(self, fake, tmp_path):
+        cache = DiskCache(tmp_path / "search.sqlite3")
+        engine = SearchEngine("key", cache=cache, transport=httpx.MockTransport(fake))
+        engine.search("same query")
+        engine.search("Same   Query")
+        engine.search("same query", bypass_cache=True)
+        engine.close()
+        assert fake.calls == 2
+
+    def test_cache_io_runs_off_the_engine_loop(self, fake, tmp_path, monkeypatch):
+        threads = []
+        cache = DiskCache(tmp_path / "search.sqlite3")
+        for name in ("get", "set"):
+            def record(*args, _original=getattr(cache, name)):
+                threads.append(threading.current_thread())
+                return _original(*args)
+            monkeypatch.setattr(cache, name, record)
+
+        engine = SearchEngine("key", cache=cache, transport=httpx.MockTransport(fake))
+        engine.search("same query")
+        engine.search("same query")
+
+        async def current_thread():
+            return threading.current_thread()
+
+        loop_thread = engine._loop.run(current_thread())
+        engine.close()
+        assert fake.calls == 1
+        assert len(threads) == 3 and loop_thread not in threads
+
+    def test_asearch_from_another_loop(self, fake):
+        engine = SearchEngine("key", transport=httpx.MockTransport(fake))
+
+        async def _run():
+            return await asyncio.gather(*(engine.asearch(f"q{i}") for i in range(3)))
+
+        results = asyncio.run(_run())
+        engine.close()
+        assert len(results) == 3
+
+    def test_rate_limited(self, fake):
+        limiter = RateLimiter(max_calls=2, period_seconds=0.2)
+        engine = SearchEngine("key", rate_limiter=limiter, transport=httpx.MockTransport(fake))
+        wait([engine.submit(f"query {i}") for i in range(4)])
+        engine.close()
+        assert fake.calls == 4
+        assert limiter.stats()["throttled"] == 2
@@ -0,0 +1,121 @@
+import pytest
+
+from src.tools.search import SeenDocuments, canonicalize_url
+
+
+class TestCanonicalizeUrl:
+    @pytest.mark.parametrize("url", [
+        "https://www.example.com/news/story/?utm_source=tw&id=7#comments",
+        "http://example.com/news/story?id=7",
+        "example.com:443/news//story/?fbclid=abc&id=7",
+        "HTTPS://EXAMPLE.COM/news/story?id=7&gclid=x",
+    ])
+    def test_variants_collide(self, url):
+        assert canonicalize_url(url) == "example.com/news/story?id=7"
+
+    def test_keeps_meaningful_differences(self):
+        assert canonicalize_url("https://example.com/a?id=1") != canonicalize_url("https://example.com/a?id=2")
+        assert canonicalize_url("https://example.com/A") != canonicalize_url("https://example.com/a")
+        assert canonicalize_url("https://example.com:8080/") == "example.com:8080"
+
+    def test_sorts_params(self):
+        assert canonicalize_url("https://x.com/?b=2&a=1") == canonicalize_url("https://x.com/?a=1&b=2")
+
+    def test_empty(self):
+        assert canonicalize_url("") == ""
+
+
+def _entry(query: str, *results: tuple[str, str]) -> dict:
+    return {"query": query, "results": [{"title": "T", "url": u, "content": c} for u, c in results]}
+
+
+class TestSeenDocuments:
+    def test_drops_same_document_across_queries(self):
+        seen = SeenDocuments()
+        kept = seen.filter([
+            _entry("q1", ("https://example.com/a", "CEO since 2019.")),
+            _entry("q2", ("http://www.example.com/a/?utm_medium=x", "CEO  since 2019."), ("https://b.com", "Other")),
+        ])
+        assert [[r["url"] for r in e["results"]] for e in kept] == [["https://example.com/a"], ["https://b.com"]]
+        assert seen.dropped == 1
+
+    def test_drops_documents_from_earlier_iterations(self):
+        first = SeenDocuments()
+        first.commit(first.filter([_entry("q1", ("https://example.com/a", "CEO since 2019."))]))
+        later = SeenDocuments(first.new)
+        assert later.filter([_entry("q2", ("https://example.com/a?ref=home", "CEO since 2019."))]) == []
+        assert later.dropped == 1 and later.new == {}
+
+    def test_collapses_different_snippets_of_one_page(self):
+        seen = SeenDocuments()
+        kept = seen.filter([
+            _entry("q1", ("https://example.com/a", "Snippet one.")),
+            _entry("q2", ("https://example.com/a#part", "Snippet two.")),
+        ])
+        assert len(kept) == 1
+        assert kept[0]["results"][0]["content"] == "Snippet one.\n...\nSnippet two."
+        assert seen.collapsed == 1
+
+    def test_syndicated_copy_dropped_but_short_snippets_kept(self):
+        article = "Sisu Capital announced a new fund. " * 10
+        seen = SeenDocuments()
+        kept = seen.filter([_entry(
+            "q1",
+            ("https://a.com/story", article), ("https://b.com/copy", article),
+            ("https://a.com/x", "Page not found"), ("https://b.com/y", "Page not found"),
+        )])
+        assert [r["url"] for r in kept[0]["results"]] == [
+            "https://a.com/story", "https://a.com/x", "https://b.com/y",
+        ]
+
+    def test_syndicated_near_copies_cluster_with_mirrors(self):
+        story = (
+            "Sisu Capital LLC, an investment adviser based in San Francisco, announced on Monday "
+            "that Timothy Overturf will step down as chief executive after the SEC filed charges "
+            "alleging undisclosed fees charged to clients between 2017 and 2021."
+        )
+        other = (
+            "Sisu Capital LLC, an investment adviser based in San Francisco, reported on Tuesday "
+            "that its flagship fund returned 12 percent in 2023, outperforming its benchmark, "
+            "according to a letter sent to investors last week."
+        )
+        seen = SeenDocuments()
+        kept = seen.filter([
+            _entry("q1", ("https://wire.com/story", story)),
+            _entry("q2", ("https://news.example/x", "SAN FRANCISCO -- " + story), ("https://b.com/y", other)),
+        ])
+        assert [r["url"] for e in kept for r in e["results"]] == ["https://wire.com/story", "https://b.com/y"]
+        assert seen.clustered == 1
+        assert seen.mirrors == {"wire.com/story": ["https://news.example/x"]}
+
+        seen.commit(kept)
+        later = SeenDocuments(seen.new, seen.new_fingerprints)
+        assert later.filter([_entry("q3", ("https://c.org/z", story + " Reporting by staff."))]) == []
+        assert later.mirrors == {"wire.com/story": ["https://c.org/z"]}
+
+    def test_only_committed_documents_are_seen(self):
+        story = "Sisu Capital announced a new fund for institutional investors this week. " * 4
+        seen = SeenDocuments()
+        kept = seen.filter([
+            _entry("q1", ("https://a.com/1", "CEO since 2019."), ("https://wire.com/s", story)),
+            _entry("q2", ("https://b.com/2", "Founded in 2015."), ("https://copy.com/s", "REUTERS -- " + story)),
+        ])
+        assert seen.clustered == 1
+        # Only the first query's chunk was extracted; the copy clustered into its story goes with it
+        seen.commit(kept[:1])
+        assert set(seen.new.values()) == {"a.com/1", "wire.com/s", "copy.com/s"}
+        assert list(seen.new_fingerprints) == ["wire.com/s"]
+
+        later = SeenDocuments(seen.new, seen.new_fingerprints)
+        kept = later.filter([
+            _entry("q3", ("https://a.com/1", "CEO since 2019."), ("https://b.com/2", "Founded in 2015.")),
+        ])
+        assert [r["url"] for e in kept for r in e["results"]] == ["https://b.com/2"]
+
+    def test_does_not_mutate_input(self):
+        searches = [
+            _entry("q1", ("https://example.com/a", "One")),
+            _entry("q2", ("https://example.com/a", "Two")),
+        ]
+        SeenDocuments().filter(searches)
+        assert searches[0]["results"][0]["content"] == "One"
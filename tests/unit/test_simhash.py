@@ -0,0 +1,33 @@
+import pytest
+
+from src.utils.simhash import SimHashIndex, hamming, simhash
+
+
+class TestSimHash:
+    def test_near_identical_texts_are_close(self):
+        text = "The company announced record revenue for the quarter, driven by strong demand in Europe and Asia."
+        assert hamming(simhash(text), simhash("UPDATE: " + text)) <= 6
+        assert simhash(text) == simhash(text.upper())
+
+    def test_unrelated_texts_are_far(self):
+        a = simhash("The company announced record revenue for the quarter, driven by strong demand in Europe.")
+        b = simhash("A federal judge dismissed the lawsuit on Friday, citing a lack of standing by the plaintiffs.")
+        assert hamming(a, b) > 10
+
+
+class TestSimHashIndex:
+    def test_finds_within_distance(self):
+        index = SimHashIndex(max_distance=3)
+        index.add(0b1011 << 40, "a")
+        assert index.find((0b1011 << 40) ^ 0b111) == "a"
+        assert index.find((0b1011 << 40) ^ 0b1111) is None
+
+    def test_prefers_closest(self):
+        index = SimHashIndex()
+        index.add(0, "far")
+        index.add(0b11, "near")
+        assert index.find(0b111) == "near"
+
+    def test_rejects_unsupported_distance(self):
+        with pytest.raises(ValueError):
+            SimHashIndex(max_distance=8)
@@ -5,7 +5,9 @@ from src.graphs.state import (
     Connection,
     SearchResult,
     _merge_lists,
+    _merge_facts,
     _merge_dicts,
+    _sum_dicts,
 )
 
 
@@ -15,14 +17,27 @@ class TestReducers:
         assert _merge_lists([], [1]) == [1]
         assert _merge_lists([1], []) == [1]
 
+    def test_merge_facts_updates_in_place(self):
+        left = [{"fact_id": "a", "n": 1}, {"fact_id": "b", "n": 1}]
+        right = [{"fact_id": "a", "n": 2}, {"fact_id": "c", "n": 1}]
+        assert _merge_facts(left, right) == [
+            {"fact_id": "a", "n": 2}, {"fact_id": "b", "n": 1}, {"fact_id": "c", "n": 1},
+        ]
+        assert _merge_facts([], [{"claim": "no id"}]) == [{"claim": "no id"}]
+
     def test_merge_dicts(self):
         assert _merge_dicts({"a": 1}, {"b": 2}) == {"a": 1, "b": 2}
         assert _merge_dicts({"a": 1}, {"a": 2}) == {"a": 2}
 
+    def test_sum_dicts(self):
+        assert _sum_dicts({"a": 1}, {"a": 2, "b": 3}) == {"a": 3, "b": 3}
+        assert _sum_dicts({}, {"a": 1.5}) == {"a": 1.5}
+
 
 class TestStateTypes:
     def test_extracted_fact_structure(self):
         fact: ExtractedFact = {
+            "fact_id": "3f2a9c1d0b7e6a54",
             "category": "professional",
             "claim": "CEO of Test Corp",
             "source_url": "https://example.com",